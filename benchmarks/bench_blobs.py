@@ -0,0 +1,44 @@
+"""
+색상별 blob 분석 비교
+- recognize: 기존 경로 (가장 큰 색상 1개, 위치 정보 없음)
+- per-color contours: 색상마다 마스크 생성 + findContours + moments (기존 방식으로 blob을 구할 때)
+- recognize_blobs: 라벨 영상 1장에 connectedComponentsWithStats 1회
+
+실행: python -m benchmarks.bench_blobs
+"""
+import cv2
+from benchmarks.common import measure, print_row
+from benchmarks.synthetic import RESOLUTIONS, floor_frame
+from vision.color import ColorRecognizer
+from vision.utils.timing import NULL_TIMER
+
+
+def per_color_contours(recognizer, frame, min_area_ratio):
+    roi_code, (h, w), _ = recognizer._roi_code(frame, NULL_TIMER)
+    blobs = {}
+    for color_name, mask in recognizer._get_color_masks(roi_code).items():
+        blobs[color_name] = []
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        for contour in contours:
+            moments = cv2.moments(contour)
+            if moments['m00'] / (h * w) < min_area_ratio:
+                continue
+            centroid = (moments['m10'] / moments['m00'], moments['m01'] / moments['m00'])
+            blobs[color_name].append((moments['m00'], centroid, cv2.boundingRect(contour)))
+    return blobs
+
+
+def main():
+    recognizer = ColorRecognizer()
+    min_area_ratio = 0.001
+
+    for w, h in RESOLUTIONS:
+        frame, _ = floor_frame(0, (w, h))
+        print(f"[{w}x{h}]")
+        print_row('recognize', measure(recognizer.recognize, frame))
+        print_row('per-color contours', measure(per_color_contours, recognizer, frame, min_area_ratio))
+        print_row('recognize_blobs', measure(recognizer.recognize_blobs, frame, min_area_ratio))
+
+
+if __name__ == '__main__':
+    main()
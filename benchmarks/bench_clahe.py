@@ -0,0 +1,29 @@
+"""
+apply_clahe_color 출력 모드별 비교 ('bgr' / 'lab' / 'l')
+
+실행: python -m benchmarks.bench_clahe
+"""
+import cv2
+from benchmarks.common import measure, print_row
+from vision.utils.image_proc import apply_clahe_color
+from vision.utils.workspace import FrameWorkspace
+
+
+RESOLUTIONS = [(640, 480), (1280, 720), (1920, 1080)]
+
+
+def main():
+    base = cv2.imread("./data/demo/test1.png")
+
+    for w, h in RESOLUTIONS:
+        frame = cv2.resize(base, (w, h))
+        workspace = FrameWorkspace()
+        print(f"[{w}x{h}]")
+
+        for output in ('bgr', 'lab', 'l'):
+            print_row(f"output='{output}'", measure(apply_clahe_color, frame, output=output))
+        print_row("output='bgr' + workspace", measure(apply_clahe_color, frame, workspace=workspace))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+색상 분류 + 바닥 ROI 내 색상별 면적 집계 단계 비교 (전처리와 바닥 윤곽선 채우기는 공통이라 제외)
+- inRange x7: 흰색/색상 범위마다 cv2.inRange + ROI AND + countNonZero (기존 방식)
+- LUT + bincount: 범위 코드 분류 후 ROI 코드 영상 전체에 np.bincount
+- LUT + calcHist: 상단 제외 행은 분류 생략, 바닥 마스크를 calcHist의 mask로 사용 (현재 경로)
+세 경로의 색상별 면적이 같은지도 확인
+
+실행: python -m benchmarks.bench_classify
+"""
+import cv2
+import numpy as np
+from benchmarks.common import measure, print_row
+from benchmarks.synthetic import RESOLUTIONS, floor_frame
+from vision.color import ColorRecognizer
+from vision.utils.timing import NULL_TIMER
+
+
+def inrange_areas(recognizer, hsv, floor_mask):
+    cv2.inRange(hsv, *recognizer.white_range)     # 기존 방식은 바닥 마스크도 inRange로 계산
+    areas = {}
+    for color_name, boundaries in recognizer.color_ranges.items():
+        mask = cv2.inRange(hsv, np.array(boundaries[0]), np.array(boundaries[1]))
+        for i in range(2, len(boundaries) - 1, 2):
+            cv2.bitwise_or(mask, cv2.inRange(hsv, np.array(boundaries[i]), np.array(boundaries[i + 1])), dst=mask)
+        areas[color_name] = cv2.countNonZero(cv2.bitwise_and(floor_mask, mask))
+    return areas
+
+
+def bincount_areas(recognizer, hsv, floor_mask):
+    code = recognizer._classify(hsv)
+    roi_code = cv2.bitwise_and(code, code, mask=floor_mask)
+    hist = np.bincount(roi_code.ravel(), minlength=recognizer._color_membership.shape[1])
+    counts = recognizer._color_membership @ hist
+    return dict(zip(recognizer._color_bits.keys(), (int(c) for c in counts)))
+
+
+def calchist_areas(recognizer, hsv, floor_mask):
+    start_row = recognizer._classify_start_row(hsv.shape[0])
+    code = recognizer._classify(hsv, start_row)
+    return recognizer._count_color_areas(code, floor_mask, start_row)
+
+
+def main():
+    recognizer = ColorRecognizer()
+
+    for w, h in RESOLUTIONS:
+        frame, _ = floor_frame(0, (w, h))
+        hsv = recognizer._preprocess(frame, (w, h), NULL_TIMER)
+        floor_mask = recognizer._get_floor_mask(recognizer._classify(hsv), h)
+
+        expected = inrange_areas(recognizer, hsv, floor_mask)
+        same = all(fn(recognizer, hsv, floor_mask) == expected for fn in (bincount_areas, calchist_areas))
+        print(f"[{w}x{h}] areas match: {same}")
+        print_row('inRange x7', measure(inrange_areas, recognizer, hsv, floor_mask, repeat=50))
+        print_row('LUT + bincount', measure(bincount_areas, recognizer, hsv, floor_mask, repeat=50))
+        print_row('LUT + calcHist', measure(calchist_areas, recognizer, hsv, floor_mask, repeat=50))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+바닥 마스크 추적(track_floor) vs 매 프레임 전체 계산 비교 (전처리/분류는 공통이라 제외하고 _get_floor_mask만 측정)
+시퀀스는 분류 코드 단계에서 합성:
+- static: 같은 프레임 반복
+- marker: 바닥 안쪽에서 물체(비흰색 사각형)가 이동
+- shifting: 바닥 경계가 매 프레임 1px씩 이동 (항상 전체 계산, 추적 오버헤드 확인용)
+- speckle bg N%: 바닥 경계에서 떨어진 배경에 매 프레임 새 잡음
+- speckle all N%: 바닥 경계를 포함한 전체에 매 프레임 새 잡음 (경계가 바뀌므로 대부분 전체 계산)
+프레임마다 추적 결과가 전체 계산 결과와 같은지와 이전 결과 재사용 비율도 출력
+
+실행: python -m benchmarks.bench_floor_tracking
+"""
+import cv2
+import numpy as np
+from benchmarks.common import measure, print_row
+from benchmarks.synthetic import RESOLUTIONS, floor_frame
+from vision.color import ColorRecognizer
+from vision.utils.timing import NULL_TIMER
+
+N_FRAMES = 30
+
+
+def speckled(recognizer, code, rng, ratio, region=None):
+    """흰색 비트를 무작위로 뒤집은 코드 (region이 있으면 그 안에서만)"""
+    flip = rng.random(code.shape) < ratio
+    if region is not None:
+        flip &= region
+    noisy = code.copy()
+    noisy[flip] ^= recognizer._white_bit
+    return noisy
+
+
+def sequences(recognizer, code, h, w, seed=0):
+    rng = np.random.default_rng(seed)
+    floor = recognizer._get_floor_mask(code, h)
+    background = cv2.dilate(floor, np.ones((9, 9), np.uint8)) == 0
+
+    marker = []
+    mw, mh = w // 6, h // 6
+    for i in range(N_FRAMES):
+        moved = code.copy()
+        x = w // 8 + (w - w // 4 - mw) * i // N_FRAMES
+        moved[h * 3 // 4 - mh // 2:h * 3 // 4 + mh // 2, x:x + mw] &= np.uint8(~recognizer._white_bit & 0xFF)
+        marker.append(moved)
+
+    shifting = []
+    for i in range(N_FRAMES):
+        shift = np.float32([[1, 0, 0], [0, 1, i % 10]])
+        shifting.append(cv2.warpAffine(code, shift, (w, h), flags=cv2.INTER_NEAREST, borderMode=cv2.BORDER_REPLICATE))
+
+    return {
+        'static': [code] * N_FRAMES,
+        'marker': marker,
+        'shifting': shifting,
+        'speckle bg 1%': [speckled(recognizer, code, rng, 0.01, background) for _ in range(N_FRAMES)],
+        'speckle bg 5%': [speckled(recognizer, code, rng, 0.05, background) for _ in range(N_FRAMES)],
+        'speckle all 1%': [speckled(recognizer, code, rng, 0.01) for _ in range(N_FRAMES)],
+    }
+
+
+def run(recognizer, codes, h):
+    recognizer.reset_floor_tracking()
+    return [recognizer._get_floor_mask(code, h) for code in codes]
+
+
+def per_frame(stats, n):
+    return {k: (v * n if k == 'fps' else v / n) for k, v in stats.items()}
+
+
+def main():
+    full = ColorRecognizer()
+    tracked = ColorRecognizer(track_floor=True)
+
+    for w, h in RESOLUTIONS:
+        frame, _ = floor_frame(0, (w, h))
+        code = full._classify(full._preprocess(frame, (w, h), NULL_TIMER))
+        print(f"[{w}x{h}]")
+
+        for name, codes in sequences(full, code, h, w).items():
+            expected = run(full, codes, h)
+            masks = run(tracked, codes, h)
+            diff = max(cv2.countNonZero(cv2.compare(a, b, cv2.CMP_NE)) for a, b in zip(masks, expected))
+            reused = sum(cur is prev for prev, cur in zip(masks, masks[1:]))
+
+            print_row(f'  {name} full', per_frame(measure(run, full, codes, h, repeat=5), len(codes)))
+            print_row(f'  {name} tracked', per_frame(measure(run, tracked, codes, h, repeat=5), len(codes)),
+                      f'| reused {reused}/{len(codes)} | max diff {diff} px')
+
+
+if __name__ == '__main__':
+    main()
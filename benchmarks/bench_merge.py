@@ -0,0 +1,53 @@
+"""
+OCRBase._merge_ocr_boxes 박스 수별 처리 시간
+
+실행: python -m benchmarks.bench_merge --boxes 10 100 500 1000
+"""
+import argparse
+import numpy as np
+from vision.engines.base import OCRBase
+from vision.result import OCRBatch, RawOCR
+from benchmarks.common import measure, print_row
+
+
+class _Engine(OCRBase):
+    def _recognize_raw(self, image):
+        return []
+
+
+def make_boxes(n, seed=0):
+    """간판이 많은 장면처럼 여러 줄에 걸쳐 분리된 글자 조각 생성 (일부는 병합 대상)"""
+    rng = np.random.default_rng(seed)
+    results = []
+    while len(results) < n:
+        x, y = rng.integers(0, 1800), rng.integers(0, 1000)
+        h = int(rng.integers(12, 40))
+        for _ in range(int(rng.integers(1, 4))):
+            w = int(rng.integers(h, h * 4))
+            dy = int(rng.integers(-2, 3))
+            results.append(RawOCR(text='가1', confidence=float(rng.random()), bbox=(x, y + dy, x + w, y + dy + h)))
+            x += w + int(rng.integers(-2, h))
+    return results[:n]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--boxes', type=int, nargs='+', default=[10, 100, 500, 1000])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    engine = _Engine()
+    for n in args.boxes:
+        boxes = make_boxes(n)
+        batch = OCRBatch.from_raw(boxes)
+        kwargs = dict(y_center_ratio=engine.y_center_ratio, min_height_ratio=engine.min_height_ratio,
+                      max_spacing_ratio=engine.max_spacing_ratio)
+
+        stats = measure(engine._merge, batch, repeat=args.repeat)
+        print_row(f"merge {n} boxes (OCRBatch)", stats, f"-> {len(engine._merge(batch))} lines")
+        stats = measure(engine._merge_ocr_boxes, boxes, repeat=args.repeat, **kwargs)
+        print_row(f"merge {n} boxes (RawOCR list)", stats)
+
+
+if __name__ == '__main__':
+    main()
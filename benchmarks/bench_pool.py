@@ -0,0 +1,51 @@
+"""
+PlateDetectorPool 워커 수별 처리량(fps) 비교
+
+실행:
+  python -m benchmarks.bench_pool --model paddle --debug          # 사전 OCR 결과 사용 (풀 오버헤드 측정)
+  python -m benchmarks.bench_pool --model paddle --workers 1 2 4  # 실제 PaddleOCR 추론
+"""
+import argparse
+import time
+import cv2
+from vision.pool import PlateDetectorPool
+
+
+def run(n_workers, frames, detector_kwargs, target):
+    with PlateDetectorPool(n_workers, detector_kwargs=detector_kwargs,
+                           max_frame_shape=frames[0].shape) as pool:
+        # 워커 모델 로드 완료까지 대기
+        for _ in range(n_workers):
+            pool.detect(frames[0], target)
+
+        start = time.perf_counter()
+        futures = [pool.submit(frame, target) for frame in frames]
+        for future in futures:
+            future.result()
+        return len(frames) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model', default='paddle', choices=['paddle', 'clova'])
+    parser.add_argument('--debug', action='store_true', help='debug_mode (data/demo 사전 OCR 결과 사용)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--frames', type=int, default=64)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--target', default='630모8800')
+    args = parser.parse_args()
+
+    base = cv2.imread("./data/demo/test1.png")
+    frame = cv2.resize(base, (args.width, base.shape[0] * args.width // base.shape[1]))
+    frames = [frame] * args.frames
+    detector_kwargs = {'model': args.model, 'debug_mode': args.debug}
+
+    baseline = None
+    for n_workers in args.workers:
+        fps = run(n_workers, frames, detector_kwargs, args.target)
+        baseline = baseline or fps
+        print(f"workers={n_workers:<3} {fps:8.1f} fps (x{fps / baseline:.2f})")
+
+
+if __name__ == '__main__':
+    main()
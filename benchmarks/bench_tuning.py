@@ -0,0 +1,62 @@
+"""
+ColorRangeSweep (적분 히스토그램) vs 설정마다 recognize 재실행 비교 (합성 바닥 프레임 기준)
+재실행 방식은 일부 조합만 실행해 전체 소요 시간을 추정하고, 해당 조합의 정확도가 같은지 확인
+
+실행: python -m benchmarks.bench_tuning [-n 60] [--sample 5]
+"""
+import argparse
+import time
+import numpy as np
+from benchmarks.synthetic import corpus
+from vision.color import ColorRecognizer
+from vision.tuning import ColorRangeSweep, SweepResult
+
+
+def shifted(ranges, dh, ds):
+    # 색상 범위 후보: H 범위를 dh만큼 넓히고 S 하한을 ds만큼 이동
+    boxes = []
+    for i in range(0, len(ranges) - 1, 2):
+        lower, upper = ranges[i], ranges[i + 1]
+        boxes.append((max(0, lower[0] - dh), max(0, lower[1] + ds), lower[2]))
+        boxes.append((min(179, upper[0] + dh), upper[1], upper[2]))
+    return boxes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', type=int, default=60, help='프레임 수')
+    parser.add_argument('--sample', type=int, default=5, help='재실행 방식으로 확인할 조합 수')
+    args = parser.parse_args()
+
+    data = [(frame, label) for _, frame, label in corpus('floor', args.n, seed=7, resolutions=[(640, 480)])]
+    base = ColorRecognizer()
+    candidates = {
+        name: [shifted(ranges, dh, ds) for dh in (0, 2) for ds in (-10, 0, 10)]
+        for name, ranges in base.color_ranges.items()
+    }
+    sweep = ColorRangeSweep(candidates, [0.03, 0.06, 0.09, 0.12], [{}, {'exclude_top_ratio': 0.35}], base=base)
+    print(f"{sweep.n_configs} configurations x {len(data)} frames")
+
+    start = time.perf_counter()
+    sweep.add_frames(data)
+    prepared = time.perf_counter()
+    accuracy = sweep.evaluate()
+    evaluated = time.perf_counter()
+    print(f"sweep: histograms {prepared - start:.2f}s + evaluation {evaluated - prepared:.2f}s "
+          f"= {evaluated - start:.2f}s (best {accuracy.max():.1%})")
+
+    rng = np.random.default_rng(0)
+    sample = rng.choice(sweep.n_configs, args.sample, replace=False)
+    start = time.perf_counter()
+    mismatches = 0
+    for index in sample:
+        recognizer = sweep.recognizer(SweepResult(accuracy=0.0, **sweep.config(int(index))))
+        predicted = [(result.color if result else None) for result in map(recognizer.recognize, (f for f, _ in data))]
+        mismatches += np.mean([p == label for p, (_, label) in zip(predicted, data)]) != accuracy[index]
+    per_config = (time.perf_counter() - start) / len(sample)
+    print(f"recognize per config: {per_config:.2f}s -> estimated {per_config * sweep.n_configs / 3600:.1f}h for all "
+          f"({mismatches} accuracy mismatches in {len(sample)} sampled configs)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+번호판 형식 검증 / 유사도 계산: 쌍별 호출 vs 배치 API
+
+실행: python -m benchmarks.bench_verifier --texts 200 --targets 50
+"""
+import argparse
+import numpy as np
+from vision.plate_index import PlateIndex
+from vision.utils.verifier import filter_plate_like, is_plate_like, plate_similarity, plate_similarity_matrix
+from benchmarks.common import measure, print_row
+
+_MIDS = '가나다라마거너더러머고노도로모구누두루무버서어저허오'
+
+
+def random_plates(n, rng):
+    return [
+        f"{rng.integers(100, 1000)}{_MIDS[rng.integers(len(_MIDS))]}{rng.integers(1000, 10000)}"
+        for _ in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--texts', type=int, default=200)
+    parser.add_argument('--targets', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # OCR 후보: 번호판 형식 80%, 그 외 문자열 20%
+    texts = random_plates(args.texts, rng)
+    for i in rng.choice(len(texts), len(texts) // 5, replace=False):
+        texts[i] = texts[i][:5] + ' 간판'
+    targets = random_plates(args.targets, rng)
+    pairs = args.texts * args.targets
+
+    def pairwise():
+        scores = np.zeros((len(texts), len(targets)))
+        for i, text in enumerate(texts):
+            if not is_plate_like(text.replace(' ', '')):
+                continue
+            for j, target in enumerate(targets):
+                scores[i, j] = plate_similarity(target, text)
+        return scores
+
+    def batch():
+        scores = np.zeros((len(texts), len(targets)))
+        valid = np.flatnonzero(filter_plate_like(texts))
+        scores[valid] = plate_similarity_matrix([texts[i] for i in valid], targets)
+        return scores
+
+    index = PlateIndex(targets)
+
+    def indexed():
+        scores = np.zeros((len(texts), len(targets)))
+        valid = np.flatnonzero(filter_plate_like(texts))
+        scores[valid] = index.scores([texts[i] for i in valid])
+        return scores
+
+    assert np.array_equal(pairwise(), batch()) and np.array_equal(pairwise(), indexed())
+
+    print(f"{args.texts} texts x {args.targets} targets ({pairs} pairs)")
+    for name, fn in [('pairwise (plate_similarity loop)', pairwise),
+                     ('batch (plate_similarity_matrix)', batch),
+                     ('batch (PlateIndex.scores)', indexed)]:
+        stats = measure(fn, repeat=args.repeat)
+        print_row(name, stats, f"| {pairs / stats['mean_ms'] * 1000:,.0f} pairs/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+apply_white_balance (히스토그램 + LUT) vs apply_white_balance_float (np.percentile) 비교
+
+실행: python -m benchmarks.bench_white_balance
+"""
+import cv2
+import numpy as np
+from benchmarks.common import measure, print_row
+from vision.utils.image_proc import apply_white_balance, apply_white_balance_float
+
+
+RESOLUTIONS = [(640, 480), (1280, 720), (1920, 1080)]
+
+
+def main():
+    base = cv2.imread("./data/demo/test1.png")
+
+    for w, h in RESOLUTIONS:
+        frame = cv2.resize(base, (w, h))
+        print(f"[{w}x{h}]")
+
+        reference = apply_white_balance_float(frame)
+        print_row('float percentile', measure(apply_white_balance_float, frame))
+
+        for step in (1, 2, 4):
+            out = apply_white_balance(frame, sample_step=step)
+            max_diff = int(np.abs(out.astype(np.int16) - reference).max())
+            print_row(f'histogram LUT (sample_step={step})', measure(apply_white_balance, frame, sample_step=step),
+                      f'| max abs diff {max_diff}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Clova OCR API 로컬 스텁 서버
+data/demo/test1_clova_res.json을 응답으로 재생하여 API 비용 없이 ClovaOCREngine의
+커넥션 재사용/재시도/동시성 동작을 확인하거나 처리량을 측정할 때 사용
+
+실행: python -m benchmarks.clova_stub --port 8080 --latency 0.2 --fail-rate 0.1
+사용: ClovaOCREngine(api_url="http://127.0.0.1:8080/ocr", api_key="stub")
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class ClovaStubHandler(BaseHTTPRequestHandler):
+    fields = []
+    latency = 0.0       # 응답 지연 (초)
+    fail_rate = 0.0     # 503 응답 비율 (재시도 확인용)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.latency)
+
+        if random.random() < self.fail_rate:
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        body = json.dumps({'images': [{'inferResult': 'SUCCESS', 'fields': self.fields}]}).encode('UTF-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(port=0, latency=0.0, fail_rate=0.0, json_path="./data/demo/test1_clova_res.json"):
+    """백그라운드 스레드로 스텁 서버 실행 후 서버 객체 반환 (server.server_port로 포트 확인)"""
+    with open(json_path, 'r') as f:
+        fields = json.load(f)
+
+    handler = type('Handler', (ClovaStubHandler,), {'fields': fields, 'latency': latency, 'fail_rate': fail_rate})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.port, args.latency, args.fail_rate)
+    print(f"Clova OCR stub listening on http://127.0.0.1:{server.server_port}/ocr")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
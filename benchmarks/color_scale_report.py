@@ -0,0 +1,65 @@
+"""
+ColorRecognizer 축소 분석(analysis_scale) 배율별 정확도/속도 리포트
+원본 해상도 결과를 기준으로 색상 일치율, 면적 비율 오차, 평균 지연 시간을 비교
+
+실행: python -m benchmarks.color_scale_report --frames ./data/demo --scales 1 0.5 0.25
+"""
+import argparse
+import os
+import cv2
+import numpy as np
+from benchmarks.common import measure
+from vision.color import ColorRecognizer
+
+
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+def load_frames(folder):
+    names = sorted(n for n in os.listdir(folder) if n.lower().endswith(IMAGE_EXTS))
+    for name in names:
+        frame = cv2.imread(os.path.join(folder, name))
+        if frame is not None:
+            yield name, frame
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', default='./data/demo', help='프레임 이미지 폴더')
+    parser.add_argument('--scales', type=float, nargs='+', default=[1.0, 0.75, 0.5, 0.25])
+    parser.add_argument('--min-area-ratio', type=float, default=0.09)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    frames = list(load_frames(args.frames))
+    if not frames:
+        raise SystemExit(f"No frames found in {args.frames}")
+
+    reference = ColorRecognizer(min_detection_area_ratio=0)
+    ref_results = [reference.recognize(frame) for _, frame in frames]
+
+    print(f"{len(frames)} frames from {args.frames}")
+    print(f"{'scale':>6} | {'color agree':>11} | {'detect agree':>12} | {'ratio MAE':>10} | {'mean ms':>8} | {'fps':>7}")
+
+    for scale in args.scales:
+        recognizer = ColorRecognizer(min_detection_area_ratio=0, analysis_scale=scale)
+
+        color_agree, detect_agree, ratio_errors, latencies = 0, 0, [], []
+        for (_, frame), ref in zip(frames, ref_results):
+            res = recognizer.recognize(frame)
+            latencies.append(measure(recognizer.recognize, frame, repeat=args.repeat, warmup=1)['mean_ms'])
+
+            ref_ratio = ref.area_ratio if ref else 0.0
+            ratio = res.area_ratio if res else 0.0
+            color_agree += (ref.color if ref else None) == (res.color if res else None)
+            detect_agree += (ref_ratio >= args.min_area_ratio) == (ratio >= args.min_area_ratio)
+            ratio_errors.append(abs(ref_ratio - ratio))
+
+        n = len(frames)
+        mean_ms = float(np.mean(latencies))
+        print(f"{scale:>6.2f} | {color_agree / n:>11.1%} | {detect_agree / n:>12.1%} | "
+              f"{np.mean(ratio_errors):>10.5f} | {mean_ms:>8.2f} | {1000 / mean_ms:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+import time
+import tracemalloc
+import numpy as np
+
+
+def measure(fn, *args, repeat=20, warmup=2, **kwargs):
+    """fn(*args, **kwargs)를 반복 실행해 지연 시간(ms) 통계 반환"""
+    for _ in range(warmup):
+        fn(*args, **kwargs)
+
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies = np.array(latencies)
+    return {
+        'mean_ms': float(latencies.mean()),
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p95_ms': float(np.percentile(latencies, 95)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'fps': float(1000 / latencies.mean()),
+    }
+
+
+def print_row(name, stats, extra=''):
+    print(f"{name:<40} mean {stats['mean_ms']:8.2f} ms | p95 {stats['p95_ms']:8.2f} ms | {stats['fps']:8.1f} fps {extra}")
+
+
+def peak_memory_kb(fn, *args, **kwargs):
+    """fn(*args, **kwargs) 1회 실행 중 파이썬/numpy 할당 최대치(KB, tracemalloc 기준)"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
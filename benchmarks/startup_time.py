@@ -0,0 +1,71 @@
+"""
+vision 서비스 시작 시간 측정 (단계별, 각 측정은 새 파이썬 프로세스에서 실행)
+
+실행:
+  python -m benchmarks.startup_time --model paddle
+  python -m benchmarks.startup_time --model clova --debug
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# 단계별 경과 시간(초)을 JSON으로 출력하는 측정 스크립트
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+marks = {}
+import vision
+marks['import vision'] = time.perf_counter() - start
+from vision.detector import PlateNumberDetector
+marks['import vision.detector'] = time.perf_counter() - start
+detector = PlateNumberDetector(model=%(model)r, debug_mode=%(debug)r, lazy_load=%(lazy)r)
+marks['detector ready'] = time.perf_counter() - start
+if %(warmup)r:
+    thread = detector.warmup(background=True)
+    marks['warmup started'] = time.perf_counter() - start
+import cv2
+frame = cv2.imread('./data/demo/test1.png')
+detector.detect(frame, '')
+marks['first detect'] = time.perf_counter() - start
+marks['paddleocr imported'] = 'paddleocr' in sys.modules
+marks['requests imported'] = 'requests' in sys.modules
+print(json.dumps(marks))
+"""
+
+
+def run(model, debug, lazy, warmup):
+    code = _SCRIPT % {'model': model, 'debug': debug, 'lazy': lazy, 'warmup': warmup}
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model', default='paddle', choices=['paddle', 'clova'])
+    parser.add_argument('--debug', action='store_true', help='debug_mode (모델 로드/API 호출 생략)')
+    args = parser.parse_args()
+
+    modes = [('eager', False, False), ('lazy', True, False)]
+    if args.model == 'paddle':
+        modes.append(('lazy + background warmup', True, True))
+
+    for name, lazy, warmup in modes:
+        try:
+            marks = run(args.model, args.debug, lazy, warmup)
+        except RuntimeError as e:
+            print(f"[{name}] failed: {e}")
+            continue
+
+        print(f"[{name}]")
+        for stage, value in marks.items():
+            if isinstance(value, bool):
+                print(f"  {stage:<26} {value}")
+            else:
+                print(f"  {stage:<26} {value * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+vision 패키지 벤치마크 스위트 (합성 프레임 기준, 같은 seed면 같은 입력)
+케이스별 fps, 지연 시간 백분위(p50/p95/p99), 1회 실행 중 최대 메모리(tracemalloc)를 측정하고
+결과를 JSON으로 저장하거나 이전 결과(baseline)와 비교
+
+실행:
+  python -m benchmarks.suite --save benchmarks/baseline.json       # 기준 결과 저장
+  python -m benchmarks.suite --compare benchmarks/baseline.json    # 기준 대비 비교 (회귀 시 종료 코드 1)
+  python -m benchmarks.suite --only color image_proc --resolutions 640x480
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import cv2
+import numpy as np
+from benchmarks.common import measure, peak_memory_kb
+from benchmarks.synthetic import corpus, floor_frame, random_plate_text
+from benchmarks.bench_merge import make_boxes
+from vision.color import ColorRecognizer
+from vision.detector import PlateNumberDetector
+from vision.frame import FrameContext
+from vision.engines.base import OCRBase
+from vision.result import OCRBatch
+from vision.utils import image_proc
+from vision.utils.proposal import propose_plate_regions
+from vision.utils.verifier import filter_plate_like, plate_similarity_matrix
+
+
+GROUPS = ('color', 'image_proc', 'merge', 'verifier', 'detector')
+
+
+class _MergeEngine(OCRBase):
+    def _recognize_raw(self, image):
+        return OCRBatch.empty()
+
+
+def _cycle(fn, inputs):
+    # 호출마다 입력을 돌아가며 사용 (프레임 하나에 대한 캐시 효과 방지)
+    state = {'i': 0}
+
+    def call():
+        item = inputs[state['i'] % len(inputs)]
+        state['i'] += 1
+        return fn(item)
+    return call
+
+
+def color_cases(resolutions, seed):
+    for w, h in resolutions:
+        frames = [floor_frame(seed * 1000 + i, (w, h))[0] for i in range(4)]
+        for name, kwargs in [
+            ('default', {}),
+            ('workspace', {'use_workspace': True}),
+            ('analysis_width=320', {'analysis_width': 320}),
+        ]:
+            recognizer = ColorRecognizer(**kwargs)
+            yield f"color.recognize[{name}] {w}x{h}", _cycle(recognizer.recognize, frames)
+        recognizer = ColorRecognizer()
+        yield f"color.recognize_blobs {w}x{h}", _cycle(lambda f: recognizer.recognize_blobs(f, 0.001), frames)
+
+
+def image_proc_cases(resolutions, seed):
+    for w, h in resolutions:
+        frames = [floor_frame(seed * 1000 + i, (w, h))[0] for i in range(2)]
+        grays = [cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) for frame in frames]
+        yield f"image_proc.to_grayscale {w}x{h}", _cycle(image_proc.to_grayscale, frames)
+        yield f"image_proc.to_hsv {w}x{h}", _cycle(image_proc.to_hsv, frames)
+        yield f"image_proc.adjust_contrast_linear {w}x{h}", _cycle(image_proc.adjust_contrast_linear, frames)
+        yield f"image_proc.adjust_gamma {w}x{h}", _cycle(lambda f: image_proc.adjust_gamma(f, 1.5), frames)
+        yield f"image_proc.apply_clahe_color {w}x{h}", _cycle(image_proc.apply_clahe_color, frames)
+        yield f"image_proc.apply_white_balance {w}x{h}", _cycle(image_proc.apply_white_balance, frames)
+        yield f"image_proc.binarize {w}x{h}", _cycle(image_proc.binarize, grays)
+        yield f"image_proc.binarize_adaptive {w}x{h}", _cycle(image_proc.binarize_adaptive, grays)
+        yield f"image_proc.apply_blackhat {w}x{h}", _cycle(image_proc.apply_blackhat, grays)
+        yield f"image_proc.morph_close {w}x{h}", _cycle(image_proc.morph_close, grays)
+        yield f"image_proc.gradient_x {w}x{h}", _cycle(image_proc.gradient_x, grays)
+
+
+def merge_cases(resolutions, seed):
+    engine = _MergeEngine()
+    for n in (10, 100, 1000):
+        batch = OCRBatch.from_raw(make_boxes(n, seed))
+        yield f"merge {n} boxes", lambda batch=batch: engine._merge(batch)
+
+
+def verifier_cases(resolutions, seed):
+    rng = np.random.default_rng(seed)
+    for n_texts, n_targets in ((10, 1), (200, 50), (1000, 200)):
+        texts = [random_plate_text(rng) for _ in range(n_texts)]
+        targets = [random_plate_text(rng) for _ in range(n_targets)]
+
+        def verify(texts=texts, targets=targets):
+            valid = np.flatnonzero(filter_plate_like(texts))
+            return plate_similarity_matrix([texts[i] for i in valid], targets)
+        yield f"verifier {n_texts}x{n_targets}", verify
+
+
+def detector_cases(resolutions, seed):
+    # debug_mode: 사전 OCR 결과를 사용하므로 전처리/병합/검증 비용만 측정
+    # (debug_mode에서는 후보 영역 검출을 생략하므로 후보 영역 검출 비용은 따로 측정)
+    for w, h in resolutions:
+        frames = [frame for _, frame, _ in corpus('plate', 4, seed, resolutions=[(w, h)])]
+        for model, engine_kwargs in [('paddle', {}), ('clova', {'api_url': 'http://localhost', 'api_key': '-'})]:
+            detector = PlateNumberDetector(model=model, debug_mode=True, **engine_kwargs)
+            yield (f"detector.detect[{model}] {w}x{h}",
+                   _cycle(lambda frame, d=detector: d.detect(frame, '630모8800'), frames))
+        gray_frames = [cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) for frame in frames]
+        yield f"detector.proposals {w}x{h}", _cycle(propose_plate_regions, gray_frames)
+
+        # 같은 프레임에 색상 인식 + 번호판 탐지 (FrameContext로 CLAHE 공유 여부 비교)
+        recognizer = ColorRecognizer()
+        detector = PlateNumberDetector(model='clova', debug_mode=True, api_url='http://localhost', api_key='-')
+
+        def separate(frame):
+            return recognizer.recognize(frame), detector.detect(frame, '630모8800')
+
+        def shared(frame):
+            context = FrameContext(frame)
+            return recognizer.recognize(context), detector.detect(context, '630모8800')
+        yield f"color+detector[separate] {w}x{h}", _cycle(separate, frames)
+        yield f"color+detector[FrameContext] {w}x{h}", _cycle(shared, frames)
+
+
+CASES = {
+    'color': color_cases,
+    'image_proc': image_proc_cases,
+    'merge': merge_cases,
+    'verifier': verifier_cases,
+    'detector': detector_cases,
+}
+
+
+def color_accuracy(seed, n=30):
+    """합성 바닥 프레임에서 마커 색상 인식 정확도 (속도 최적화로 결과가 바뀌었는지 확인용)"""
+    recognizer = ColorRecognizer()
+    correct = 0
+    for _, frame, label in corpus('floor', n, seed):
+        result = recognizer.recognize(frame)
+        correct += (result.color if result else None) == label
+    return correct / n
+
+
+def run(groups, resolutions, seed, repeat, warmup):
+    results = {}
+    for group in groups:
+        for name, fn in CASES[group](resolutions, seed):
+            stats = measure(fn, repeat=repeat, warmup=warmup)
+            stats['peak_kb'] = peak_memory_kb(fn)
+            results[name] = stats
+            print(f"{name:<52} p50 {stats['p50_ms']:9.3f} ms | p95 {stats['p95_ms']:9.3f} | "
+                  f"p99 {stats['p99_ms']:9.3f} | {stats['fps']:9.1f} fps | peak {stats['peak_kb']:9.0f} KB")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """p50 기준으로 baseline보다 tolerance 이상 느려진 케이스 목록 반환"""
+    regressions = []
+    print(f"\n{'case':<52} {'base p50':>10} {'now p50':>10} {'change':>8}")
+    for name, stats in results.items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print(f"{name:<52} {'-':>10} {stats['p50_ms']:10.3f}      new")
+            continue
+        change = stats['p50_ms'] / base['p50_ms'] - 1 if base['p50_ms'] > 0 else 0.0
+        flag = ''
+        if change > tolerance:
+            flag = '  <-- regression'
+            regressions.append(name)
+        print(f"{name:<52} {base['p50_ms']:10.3f} {stats['p50_ms']:10.3f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--only', nargs='+', choices=GROUPS, default=list(GROUPS))
+    parser.add_argument('--resolutions', nargs='+', default=['640x480', '1280x720', '1920x1080'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--save', help='결과 JSON 저장 경로')
+    parser.add_argument('--compare', help='비교할 baseline JSON 경로')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='회귀로 판단할 p50 증가율')
+    args = parser.parse_args()
+
+    resolutions = [tuple(int(v) for v in r.split('x')) for r in args.resolutions]
+
+    results = run(args.only, resolutions, args.seed, args.repeat, args.warmup)
+    report = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'opencv': cv2.__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    if 'color' in args.only:
+        report['color_accuracy'] = color_accuracy(args.seed)
+        print(f"\ncolor accuracy on synthetic floor frames: {report['color_accuracy']:.1%}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"saved: {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if 'color_accuracy' in report and 'color_accuracy' in baseline:
+            print(f"color accuracy: {baseline['color_accuracy']:.1%} -> {report['color_accuracy']:.1%}")
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.tolerance:.0%}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+벤치마크용 합성 프레임 생성기 (같은 seed면 항상 같은 프레임)
+- floor: 흰색 바닥 타일 + 색상 마커 (ColorRecognizer용)
+- plate: 번호판 문자열이 그려진 차량 후면 장면 (PlateNumberDetector 전처리/후보 영역용)
+해상도와 조명(밝기, 감마, 색온도, 비네팅)을 프레임마다 다르게 적용
+
+cv2.putText는 한글을 그리지 못하므로 번호판 가운데 글자는 영문 대문자로 렌더링
+(is_plate_like 형식은 만족)
+"""
+from typing import Iterator, Tuple
+import cv2
+import numpy as np
+
+
+RESOLUTIONS = [(640, 480), (1280, 720), (1920, 1080)]
+
+# BGR 마커 색상 (ColorRecognizer 기본 HSV 범위 안쪽 값)
+MARKER_COLORS = {
+    'red': (40, 40, 220),
+    'orange': (10, 140, 250),
+    'yellow': (40, 220, 230),
+    'green': (60, 190, 40),
+    'blue': (220, 110, 30),
+    'purple': (180, 50, 140),
+}
+
+
+def apply_lighting(frame: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """밝기/감마/색온도/비네팅을 무작위로 적용"""
+    h, w = frame.shape[:2]
+    img = frame.astype(np.float32) / 255
+
+    gamma = rng.uniform(0.8, 1.25)
+    gain = rng.uniform(0.75, 1.1)
+    cast = rng.uniform(0.96, 1.04, 3).astype(np.float32)   # 채널별 색온도 편차
+    img = np.power(img, gamma) * gain * cast
+
+    # 중심에서 멀어질수록 어두워지는 비네팅
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    cy, cx = h * rng.uniform(0.3, 0.7), w * rng.uniform(0.3, 0.7)
+    dist = np.sqrt(((yy - cy) / h) ** 2 + ((xx - cx) / w) ** 2)
+    img *= (1 - rng.uniform(0.05, 0.2) * dist)[..., None]
+
+    noise = rng.normal(0, rng.uniform(0.005, 0.02), img.shape).astype(np.float32)
+    return np.clip((img + noise) * 255, 0, 255).astype(np.uint8)
+
+
+def floor_frame(seed: int, size: Tuple[int, int] = (640, 480), marker: str = None) -> Tuple[np.ndarray, str]:
+    """
+    상단은 벽/배경, 하단은 흰색 바닥 타일이고 바닥 위에 색상 마커가 놓인 프레임
+    반환: (BGR 프레임, 마커 색상 이름 또는 None)
+    """
+    rng = np.random.default_rng(seed)
+    w, h = size
+    frame = np.empty((h, w, 3), dtype=np.uint8)
+
+    # 배경(상단 1/3)과 흰 바닥
+    horizon = int(h * rng.uniform(0.25, 0.4))
+    frame[:horizon] = rng.integers(60, 140, 3)
+    frame[horizon:] = rng.integers(215, 245)
+
+    # 타일 줄눈 (바닥보다 약간 어두운 무채색)
+    tile = int(rng.integers(40, 90) * w / 640)
+    grout = (int(rng.integers(195, 212)),) * 3
+    for x in range(int(rng.integers(0, tile)), w, tile):
+        cv2.line(frame, (x, horizon), (x, h), grout, max(1, w // 640))
+    for y in range(horizon + int(rng.integers(0, tile)), h, tile):
+        cv2.line(frame, (0, y), (w, y), grout, max(1, w // 640))
+
+    if marker is None:
+        marker = list(MARKER_COLORS)[int(rng.integers(len(MARKER_COLORS)))]
+    if marker:
+        mw, mh = int(w * rng.uniform(0.3, 0.55)), int((h - horizon) * rng.uniform(0.45, 0.7))
+        x1 = int(rng.integers(0, w - mw))
+        y1 = int(rng.integers(horizon, h - mh))
+        cv2.rectangle(frame, (x1, y1), (x1 + mw, y1 + mh), MARKER_COLORS[marker], -1)
+
+    # 바닥 위 작은 잡동사니
+    for _ in range(int(rng.integers(0, 6))):
+        cx, cy = int(rng.integers(0, w)), int(rng.integers(horizon, h))
+        cv2.circle(frame, (cx, cy), int(rng.integers(3, 15) * w / 640), tuple(int(v) for v in rng.integers(0, 255, 3)), -1)
+
+    return apply_lighting(frame, rng), marker or None
+
+
+def random_plate_text(rng: np.random.Generator) -> str:
+    return f"{rng.integers(100, 1000)}{chr(ord('A') + int(rng.integers(26)))}{rng.integers(1000, 10000)}"
+
+
+def plate_frame(seed: int, size: Tuple[int, int] = (1280, 720), text: str = None) -> Tuple[np.ndarray, str]:
+    """
+    차량 후면(사각형) 위에 번호판 문자열을 그린 프레임 + 주변 간판 텍스트
+    반환: (BGR 프레임, 번호판 문자열)
+    """
+    rng = np.random.default_rng(seed)
+    w, h = size
+    frame = np.full((h, w, 3), rng.integers(90, 170, 3), dtype=np.uint8)
+    text = text or random_plate_text(rng)
+    scale = w / 1280
+
+    # 차량 후면
+    cw, ch = int(w * rng.uniform(0.3, 0.45)), int(h * rng.uniform(0.35, 0.5))
+    cx, cy = int(rng.integers(0, w - cw)), int(rng.integers(h // 4, h - ch))
+    cv2.rectangle(frame, (cx, cy), (cx + cw, cy + ch), tuple(int(v) for v in rng.integers(20, 230, 3)), -1)
+
+    # 번호판
+    font_scale = 1.1 * scale
+    thickness = max(1, int(round(2 * scale)))
+    (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+    px, py = cx + (cw - tw) // 2, cy + int(ch * 0.65)
+    pad = int(10 * scale)
+    cv2.rectangle(frame, (px - pad, py - th - pad), (px + tw + pad, py + pad), (245, 245, 245), -1)
+    cv2.rectangle(frame, (px - pad, py - th - pad), (px + tw + pad, py + pad), (20, 20, 20), max(1, thickness // 2))
+    cv2.putText(frame, text, (px, py), cv2.FONT_HERSHEY_SIMPLEX, font_scale, (10, 10, 10), thickness, cv2.LINE_AA)
+
+    # 간판 등 배경 텍스트
+    for _ in range(int(rng.integers(2, 8))):
+        word = ''.join(chr(ord('A') + int(v)) for v in rng.integers(0, 26, int(rng.integers(3, 10))))
+        org = (int(rng.integers(0, w - 50)), int(rng.integers(30, h)))
+        cv2.putText(frame, word, org, cv2.FONT_HERSHEY_DUPLEX, rng.uniform(0.5, 1.5) * scale,
+                    tuple(int(v) for v in rng.integers(0, 255, 3)), thickness, cv2.LINE_AA)
+
+    return apply_lighting(frame, rng), text
+
+
+def corpus(kind: str, n: int, seed: int = 0, resolutions=RESOLUTIONS) -> Iterator[Tuple[str, np.ndarray, str]]:
+    """
+    kind('floor' / 'plate') 프레임 n장을 해상도를 돌아가며 생성
+    반환: (이름, 프레임, 정답 라벨)
+    """
+    make = {'floor': floor_frame, 'plate': plate_frame}[kind]
+    for i in range(n):
+        size = resolutions[i % len(resolutions)]
+        frame, label = make(seed * 100003 + i, size)
+        yield f"{kind}_{i:04d}_{size[0]}x{size[1]}", frame, label
+
+
+def main():
+    # 생성 결과 확인용: 지정 폴더에 PNG로 저장
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--out', default='./data/synthetic')
+    parser.add_argument('-n', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    for kind in ('floor', 'plate'):
+        for name, frame, label in corpus(kind, args.n, args.seed):
+            cv2.imwrite(os.path.join(args.out, f"{name}_{label}.png"), frame)
+            print(name, label)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,59 +1,36 @@
-import threading
-import time
 import cv2
-
-# 색상 인식 스레드 워커 클래스 정의 예제
-class ColorRecognitionWorker(threading.Thread):
-    def __init__(self, recognizer, input_queue, ):
-        super().__init__()
-
-        self.recognizer = recognizer  # ColorRecognizer 주입
-        self.input_queue = input_queue
-
-        self.result = None
-        self.daemon = True
-        self.stopped = False
-
-    def run(self):
-        while not self.stopped:
-            if not self.input_queue.empty():
-                frame = self.input_queue.get()
-                self.result = self.recognizer.recognize(frame)
-            else:
-                time.sleep(0.01)
-
-    def stop(self):
-        self.stopped = True
-
+from vision.color import ColorRecognizer
+from vision.stream import ColorRecognitionStream
 
 # ==========================================
 # cv2.VideoCapture를 이용한 실행 예제
+# - 캡처 스레드: 카메라 프레임을 계속 읽어 최신 프레임 슬롯에 덮어씀
+# - 처리 스레드: 항상 가장 최근 프레임만 인식 (밀린 프레임은 드롭)
 # ==========================================
-from vision.color import ColorRecognizer
-from queue import Queue
 
 # 1. 초기화 (카메라 인덱스는 보통 0)
 cap = cv2.VideoCapture(0)
-frame_queue = Queue(maxsize=1)
 recognizer = ColorRecognizer(min_detection_area_ratio=0.088)
-worker = ColorRecognitionWorker(recognizer, frame_queue)
+stream = ColorRecognitionStream(recognizer, cap)
 
-worker.start()
+stream.start()
 
 print("인식을 시작합니다. 'q'를 누르면 종료합니다.")
 
 try:
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        # 큐가 비어있을 때만 새 프레임을 넣음 (병목 방지)
-        if not frame_queue.full():
-            frame_queue.put(frame)
-
-        # 워커의 최신 결과 가져오기
-        res = worker.result
+    last_seq = -1
+    while True:
+        # 새 프레임이 들어올 때까지 대기 (카메라 입력이 끝나면 None)
+        item = stream.wait_frame(last_seq, timeout=1.0)
+        if item is None:
+            if not stream.running:
+                break
+            continue
+        last_seq, _, frame = item
+
+        # 처리 스레드의 최신 결과 가져오기
+        latest = stream.latest
+        res = latest.result if latest else None
 
         # 결과 시각화
         display_frame = frame.copy()
@@ -65,12 +42,20 @@ try:
             cv2.putText(display_frame, "Searching...", (10, 30),
                         cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
 
+        # 결과가 몇 프레임/몇 ms 전 입력 기준인지 표시
+        stats = stream.stats()
+        if latest:
+            info = (f"lag {last_seq - latest.seq} frames / {latest.latency * 1000:.0f} ms | "
+                    f"{stats['process_fps']:.1f} fps | dropped {stats['dropped']}")
+            cv2.putText(display_frame, info, (10, 60),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+
         cv2.imshow('Color Detection Test', display_frame)
 
         if cv2.waitKey(1) & 0xFF == ord('q'):
             break
 
 finally:
-    worker.stop()
+    stream.stop()
     cap.release()
-    cv2.destroyAllWindows()
\ No newline at end of file
+    cv2.destroyAllWindows()
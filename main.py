@@ -16,6 +16,7 @@ detector = PlateNumberDetector(
     model="clova",                 # OCR할 엔진 선택 ("paddle" 또는 "clova")
     plate_similarity_thresh=82,     # 타겟 번호판과 일치하는지 판단할 유사도 임계치(기본값 80)
     apply_preprocess=True,          # 전처리 적용 여부 (CLACHE 기법)
+    verbose=True,                   # 후보 번호판별 유사도 및 최종 결과 출력
     debug_mode=True,                # 디버그 모드 : 사전 OCR 데이터(data/demo/에 존재) 불러오기 -> API 호출 수 줄이거나 모델 로드 리소스 생략 가능
 )
 
@@ -0,0 +1,135 @@
+"""
+OCRBase._merge_batch 속성 기반 테스트 (고정 시드 무작위 배치)
+
+실행: python -m unittest discover tests
+"""
+import unittest
+from typing import List
+import numpy as np
+from vision.engines.base import OCRBase
+from vision.result import OCRBatch, RawOCR
+
+PARAMS = dict(y_center_ratio=0.2, min_height_ratio=0.6, max_spacing_ratio=0.1)
+TRIALS = 300
+
+
+def greedy_merge(results: List[RawOCR], *, y_center_ratio, min_height_ratio, max_spacing_ratio) -> List[RawOCR]:
+    """이전 _merge_ocr_boxes 구현 (x1 순으로 정렬 후 마지막 병합 결과와만 비교, 입력을 변경하지 않도록 복사)"""
+    if not results:
+        return []
+
+    results = sorted(results, key=lambda r: r.bbox[0])
+    merged = [RawOCR(results[0].text, results[0].confidence, results[0].bbox)]
+    for result in results[1:]:
+        prev = merged[-1]
+        px1, py1, px2, py2 = prev.bbox
+        x1, y1, x2, y2 = result.bbox
+        prev_h, curr_h = py2 - py1, y2 - y1
+
+        y_align_ok = abs((py1 + py2) / 2 - (y1 + y2) / 2) <= min(prev_h, curr_h) * y_center_ratio
+        height_ok = min(prev_h, curr_h) / max(prev_h, curr_h) >= min_height_ratio
+        spacing_ok = x1 - px2 <= ((px2 - px1) + (x2 - x1)) / 2 * max_spacing_ratio
+
+        if y_align_ok and height_ok and spacing_ok:
+            prev.text += result.text
+            prev.confidence = min(prev.confidence, result.confidence)
+            prev.bbox = (px1, min(py1, y1), x2, max(py2, y2))
+        else:
+            merged.append(RawOCR(result.text, result.confidence, result.bbox))
+    return merged
+
+
+def random_layout(rng: np.random.Generator):
+    """
+    여러 줄에 걸친 조각 배치와 줄별 조각 목록 반환
+    조각 사이 간격은 '맞닿음(병합)' 또는 '충분히 멀리(분리)'로만 만들어 병합 기준이 모호한 경계값은 피함
+    높이는 같은 중심에서 비율이 0.9 이상(병합 가능) 또는 0.4 이하(병합 불가)
+    """
+    lines = []
+    y = int(rng.integers(0, 50))
+    for _ in range(int(rng.integers(1, 6))):
+        height = int(rng.integers(20, 40))
+        center = y + height
+        fragments = []
+        x = int(rng.integers(0, 100))
+        for _ in range(int(rng.integers(1, 9))):
+            h = height if rng.random() < 0.8 else (height - 1 if rng.random() < 0.5 else height // 3)
+            w = int(rng.integers(10, 60))
+            top = center - h // 2
+            fragments.append(RawOCR(
+                text=''.join(rng.choice(list('0123456789가나다'), size=int(rng.integers(1, 4)))),
+                confidence=float(np.float32(rng.uniform(0.5, 1.0))),
+                bbox=(x, top, x + w, top + h)
+            ))
+            # 맞닿음(0) 또는 줄 전체 폭보다 먼 간격
+            x += w + (0 if rng.random() < 0.6 else int(rng.integers(200, 300)))
+        lines.append(fragments)
+        y = center + height * 2
+
+    fragments = [fragment for line in lines for fragment in line]
+    order = rng.permutation(len(fragments))
+    return [fragments[i] for i in order], lines
+
+
+def rows(batch: OCRBatch):
+    return sorted(zip(
+        (tuple(bbox) for bbox in batch.bboxes.tolist()),
+        batch.texts,
+        batch.confidences.tolist()
+    ))
+
+
+class MergeBatchTest(unittest.TestCase):
+
+    def test_input_not_mutated(self):
+        rng = np.random.default_rng(0)
+        for _ in range(TRIALS):
+            fragments, _ = random_layout(rng)
+            batch = OCRBatch.from_raw(fragments)
+            texts, confidences, bboxes = list(batch.texts), batch.confidences.copy(), batch.bboxes.copy()
+
+            OCRBase._merge_batch(batch, **PARAMS)
+
+            self.assertEqual(batch.texts, texts)
+            np.testing.assert_array_equal(batch.confidences, confidences)
+            np.testing.assert_array_equal(batch.bboxes, bboxes)
+
+    def test_deterministic_and_order_independent(self):
+        rng = np.random.default_rng(1)
+        for _ in range(TRIALS):
+            fragments, _ = random_layout(rng)
+            expected = OCRBase._merge_batch(OCRBatch.from_raw(fragments), **PARAMS)
+
+            shuffled = [fragments[i] for i in rng.permutation(len(fragments))]
+            for candidate in (fragments, shuffled):
+                result = OCRBase._merge_batch(OCRBatch.from_raw(candidate), **PARAMS)
+                self.assertEqual(result.texts, expected.texts)
+                np.testing.assert_array_equal(result.confidences, expected.confidences)
+                np.testing.assert_array_equal(result.bboxes, expected.bboxes)
+
+    def test_matches_greedy_merge(self):
+        # 이전 구현은 여러 줄이 x 순서로 섞이면 병합이 끊기므로, 줄별로 실행한 결과와 비교
+        rng = np.random.default_rng(2)
+        for _ in range(TRIALS):
+            fragments, lines = random_layout(rng)
+            expected = OCRBatch.from_raw([merged for line in lines for merged in greedy_merge(line, **PARAMS)])
+
+            result = OCRBase._merge_batch(OCRBatch.from_raw(fragments), **PARAMS)
+            self.assertEqual(rows(result), rows(expected))
+
+    def test_single_line_matches_greedy_merge(self):
+        rng = np.random.default_rng(3)
+        for _ in range(TRIALS):
+            _, lines = random_layout(rng)
+            line = lines[0]
+            expected = OCRBatch.from_raw(greedy_merge(line, **PARAMS))
+
+            result = OCRBase._merge_batch(OCRBatch.from_raw(line), **PARAMS)
+            self.assertEqual(rows(result), rows(expected))
+
+    def test_empty(self):
+        self.assertEqual(len(OCRBase._merge_batch(OCRBatch.empty(), **PARAMS)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
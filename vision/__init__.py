@@ -0,0 +1,27 @@
+# 하위 모듈(cv2, paddleocr 등)은 실제로 사용할 때 import
+# 예: `from vision import PlateNumberDetector`
+_EXPORTS = {
+    'PlateNumberDetector': 'vision.detector',
+    'ColorRecognizer': 'vision.color',
+    'PlateIndex': 'vision.plate_index',
+    'PlateTracker': 'vision.tracker',
+    'PlateVoter': 'vision.voting',
+    'PlateDetectorPool': 'vision.pool',
+    'ColorRecognitionStream': 'vision.stream',
+    'FrameContext': 'vision.frame',
+    'RawOCR': 'vision.result',
+    'PlateResult': 'vision.result',
+    'ColorRecognitionResult': 'vision.result',
+    'ColorBlob': 'vision.result',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'vision' has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -1,18 +1,32 @@
+import math
+from typing import Dict, List
 import cv2
 import numpy as np
-from vision.result import ColorRecognitionResult
+from vision.frame import FrameContext
+from vision.result import ColorBlob, ColorRecognitionResult
 from vision.utils.image_proc import apply_white_balance, apply_clahe_color
+from vision.utils.timing import start_timer
+from vision.utils.workspace import FrameWorkspace
 
 
 class ColorRecognizer:
 
+    # 추적 중 바닥 경계가 계속 바뀌면 이 프레임 수마다 한 번만 추적 기준을 다시 저장
+    FLOOR_RETRY_INTERVAL = 8
+
     def __init__(
             self,
             min_detection_area_ratio=0.09,  # 탐지로 판정할 전체 대비 최소 면적 비율 기준
             exclude_top_ratio=0.25,  # 상단 노이즈 제거 비율 (0 ~ n)
             include_bottom_ratio=0.5,  # 하단 강제 포함 비율 (n ~ 1.0)
             white_balancing_p =0.5,   # 화이트 밸런싱 적용 강도
+            white_balance_sample_step = 1,  # 화이트 밸런싱 히스토그램 샘플링 간격 (1이면 전체 픽셀)
             apply_enhance_brightness = True,    # 밝기 조정 전처리 적용 여부
+            use_workspace = False,  # 프레임 간 버퍼 재사용 여부 (프레임당 메모리 할당 제거)
+            analysis_scale = 1.0,   # 축소 분석 배율 (1.0이면 원본 해상도로 분석)
+            analysis_width = None,  # 분석 해상도 너비 지정 (지정 시 analysis_scale보다 우선, 원본보다 크면 무시)
+            track_floor = False,    # 연속 영상용 바닥 마스크 추적 여부 (바닥 경계가 그대로면 이전 프레임 결과 재사용)
+            timing_sink = None,     # 단계별 소요 시간 계측 싱크 (vision.utils.timing, None이면 비활성화)
     ):
         # 색상 탐지 기준 초기화
         self.min_detection_area_ratio = min_detection_area_ratio
@@ -23,8 +37,22 @@ class ColorRecognizer:
 
         # 이미지 전처리 관련
         self.white_balancing_p = white_balancing_p
+        self.white_balance_sample_step = white_balance_sample_step
         self.apply_enhance_brightness = apply_enhance_brightness
 
+        # 분석 해상도 (면적 비율은 축소 프레임 기준으로 계산, 마스크는 요청 시 원본 크기로 복원)
+        self.analysis_scale = analysis_scale
+        self.analysis_width = analysis_width
+
+        # 바닥 마스크 추적 (결과는 매 프레임 전체 계산과 동일, 단일 이미지 입력에는 영향 없음)
+        self.track_floor = track_floor
+        self.reset_floor_tracking()
+
+        self.timing_sink = timing_sink
+
+        # 사전 할당 버퍼 (workspace.stats()로 할당 절감량 확인 가능)
+        self.workspace = FrameWorkspace() if use_workspace else None
+
         # 색상 hsv 범위
         self.white_range = (np.array([0, 0, 163]), np.array([179, 50, 255]))
         self.color_ranges = {
@@ -36,9 +64,113 @@ class ColorRecognizer:
             'purple': [(120, 61, 82), (151, 255, 255)]
         }
 
-    def _get_floor_mask(self, hsv, h):
+        # HSV 범위 룩업 테이블 (범위가 바뀌면 _classify에서 다시 생성)
+        self._lut_key = None
+        self._build_lut()
+
+    def _range_key(self):
+        # 범위 설정을 비교 가능한 튜플로 변환 (dict 내부 값이 바뀌어도 감지하기 위함)
+        white = tuple(tuple(int(v) for v in bound) for bound in self.white_range)
+        colors = tuple(
+            (color_name, tuple(tuple(int(v) for v in bound) for bound in boundaries))
+            for color_name, boundaries in self.color_ranges.items()
+        )
+        return white, colors
+
+    def _build_lut(self):
+        """
+        color_ranges, white_range로부터 HSV -> 라벨 코드 룩업 테이블 생성
+        각 HSV 범위(박스)마다 비트 하나를 할당하고, 채널별 LUT를 AND 하면
+        픽셀이 속한 모든 범위의 비트가 켜진 코드가 한 번에 계산됨
+        """
+        white, colors = self._range_key()
+
+        # (lower, upper) 박스 목록 구성 (빨간색처럼 범위가 2개인 색상은 박스 2개)
+        boxes = [white]
+        color_boxes = []
+        for _, boundaries in colors:
+            indices = []
+            for i in range(0, len(boundaries) - 1, 2):
+                indices.append(len(boxes))
+                boxes.append((boundaries[i], boundaries[i + 1]))
+            color_boxes.append(indices)
+
+        if len(boxes) > 16:
+            raise ValueError(f"Too many HSV ranges: {len(boxes)} (max 16)")
+        dtype = np.uint8 if len(boxes) <= 8 else np.uint16
+
+        # 채널별 LUT: 값 v가 박스 b의 채널 범위에 들어가면 b번째 비트 ON
+        values = np.arange(256)
+        lut = np.zeros((1, 256, 3), dtype=dtype)
+        for bit, (lower, upper) in enumerate(boxes):
+            for c in range(3):
+                inside = (values >= lower[c]) & (values <= upper[c])
+                lut[0, inside, c] |= dtype(1 << bit)
+
+        # 코드 -> 색상 포함 여부 행렬 (색상별 면적을 bincount 결과에서 한 번에 집계)
+        codes = np.arange(1 << len(boxes))
+        color_bits = [sum(1 << i for i in indices) for indices in color_boxes]
+        membership = (codes & np.array(color_bits, dtype=np.int64).reshape(-1, 1)) != 0
+
+        # 코드 -> 색상 라벨 (1부터 color_ranges 순서, 0은 해당 색상 없음 / 여러 색상에 속하면 앞 색상)
+        label_lut = np.where(membership.any(axis=0), membership.argmax(axis=0) + 1, 0).astype(np.uint8)
+
+        self._lut = lut
+        self._label_lut = label_lut
+        self._lut_key = (white, colors)
+        self._white_bit = 1
+        self._color_bits = dict(zip(self.color_ranges.keys(), color_bits))
+        self._color_membership = membership.astype(np.int64)
+
+    def _classify(self, hsv, start_row=0):
+        """
+        HSV 이미지의 모든 픽셀을 한 번에 범위 코드로 변환
+        start_row 위쪽 행은 분류하지 않고 0으로 채움 (바닥 ROI에서 항상 제외되는 상단 영역)
+        """
+        if self._lut_key != self._range_key():
+            self._build_lut()
+
+        shape, dtype = hsv.shape[:2], self._lut.dtype
+        code = self._buffer('code', shape, dtype)
+        if code is None:
+            code = np.empty(shape, dtype)
+        code[:start_row] = 0
+        if start_row >= shape[0]:
+            return code
+
+        body = hsv[start_row:]
+        body_code = code[start_row:]
+        per_channel = cv2.LUT(body, self._lut, dst=self._buffer('lut', body.shape, dtype))
+        # 채널 3개를 한 번에 분리 (extractChannel 3회보다 빠름)
+        if self.workspace is None:
+            h, s, v = cv2.split(per_channel)
+        else:
+            h, s, v = cv2.split(per_channel, [self._buffer(f'code_{c}', body.shape[:2], dtype) for c in 'hsv'])
+        cv2.bitwise_and(h, s, dst=body_code)
+        cv2.bitwise_and(body_code, v, dst=body_code)
+        return code
+
+    def _classify_start_row(self, h):
+        # 바닥 마스크에서 항상 0이 되는 상단 행 수 (include_bottom_ratio가 더 작으면 그 위치까지)
+        top_limit = int(h * self.exclude_top_ratio)
+        bottom_limit = int(h * self.include_bottom_ratio)
+        return min(max(0, min(top_limit, bottom_limit)), h)
+
+    def _buffer(self, name, shape, dtype=np.uint8):
+        # workspace 모드가 아니면 None을 반환해 cv2/numpy가 새로 할당하도록 함
+        if self.workspace is None:
+            return None
+        return self.workspace.get(name, shape, dtype)
+
+    def _bits_to_mask(self, code, bits, name=None):
+        # name이 없으면 (반환용 마스크 등) 항상 새 배열로 생성
+        bits_buf = self._buffer(f'{name}_bits', code.shape, code.dtype) if name else None
+        mask_buf = self._buffer(name, code.shape) if name else None
+        return cv2.compare(np.bitwise_and(code, bits, out=bits_buf), 0, cv2.CMP_GT, dst=mask_buf)
+
+    def _get_floor_mask(self, code, h):
         # 흰색 바닥 추출
-        floor_mask = cv2.inRange(hsv, self.white_range[0], self.white_range[1])
+        floor_mask = self._bits_to_mask(code, self._white_bit, name='floor_raw')
 
         # 상단 영역은 강제로 제외 (배경 노이즈 제거)
         top_limit = int(h * self.exclude_top_ratio)
@@ -46,78 +178,324 @@ class ColorRecognizer:
         floor_mask[:top_limit, :] = 0
         floor_mask[bottom_limit:, :] = 255
 
+        # 연속 프레임 추적 모드: 바닥 경계 밴드의 흰색 마스크가 그대로면 이전 결과 재사용
+        if self.track_floor and self._floor_unchanged(floor_mask, top_limit, bottom_limit):
+            self._floor_misses = 0
+            return self._floor_prev
+
         # 바닥 마스크 내부의 구멍(타일)을 채우기
+        filled_mask, area = self._fill_largest_contour(floor_mask)
+
+        if self.track_floor:
+            # 바닥 경계가 계속 바뀌는 동안은 추적 기준 저장 비용을 줄이기 위해 주기적으로만 저장
+            self._floor_prev = None
+            self._floor_misses += 1
+            if (self._floor_misses - 1) % self.FLOOR_RETRY_INTERVAL == 0:
+                self._remember_floor(floor_mask, filled_mask, area, top_limit, bottom_limit)
+
+        return filled_mask
+
+    def _fill_largest_contour(self, floor_mask):
+        """가장 큰 외곽 윤곽선 안쪽을 채운 마스크와 그 윤곽선 면적 반환"""
         # 1. 마스크에서 윤곽선 찾기
         contours, _ = cv2.findContours(floor_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        filled_mask = np.zeros_like(floor_mask)
+        if self.workspace is None:
+            filled_mask = np.zeros_like(floor_mask)
+        else:
+            filled_mask = self.workspace.zeros('floor', floor_mask.shape)
+        area = 0
         if contours:
             # 2. 그중 가장 면적이 넓은 컨투어(바닥일 확률 높음) 선택
             largest_contour = max(contours, key=cv2.contourArea)
+            area = cv2.contourArea(largest_contour)
 
             # 3. 해당 컨투어 안쪽을 흰색(255)으로 꽉 채움 (두께 -1이 채우기 옵션)
             cv2.drawContours(filled_mask, [largest_contour], -1, 255, thickness=cv2.FILLED)
 
-        return filled_mask
+        return filled_mask, area
+
+    def _remember_floor(self, floor_mask, filled_mask, area, top_limit, bottom_limit):
+        """
+        전체 계산 결과를 추적 기준으로 저장
+        바닥 경계 안팎 1픽셀 밴드의 흰색 마스크가 같으면 바닥 외곽 윤곽선도 같고,
+        바닥 밖 면적이 바닥 윤곽선 면적보다 작으면 다른 윤곽선이 더 커질 수 없으므로 채운 결과가 전체 계산과 동일
+        위 조건을 보장할 수 없으면(하단 강제 포함 영역이 없거나 가장 큰 영역이 바닥이 아님) 저장하지 않음
+        """
+        h = floor_mask.shape[0]
+        if not top_limit < bottom_limit < h or not filled_mask[h - 1, 0]:
+            return
+        if filled_mask[top_limit:].size - cv2.countNonZero(filled_mask[top_limit:]) >= area:
+            return
 
-    def _get_color_masks(self, hsv):
+        # 상단 제외/하단 포함 행은 매 프레임 값이 같으므로 그 사이 행에서만 밴드 계산 (위아래 1행은 이웃 확인용)
+        y0 = max(top_limit - 1, 0)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+        band = cv2.morphologyEx(
+            filled_mask[y0:bottom_limit + 1], cv2.MORPH_GRADIENT, kernel,
+            borderType=cv2.BORDER_CONSTANT, borderValue=0    # 이미지 가장자리 픽셀도 경계로 취급
+        )[top_limit - y0:bottom_limit - y0]
+
+        # 밴드의 외접 사각형 안만 비교
+        x, y, w, band_h = cv2.boundingRect(band)
+        if w == 0:
+            return
+        y += top_limit
+        self._floor_rect = (y, y + band_h, x, x + w)
+        self._floor_band = band[y - top_limit:y - top_limit + band_h, x:x + w]
+        self._floor_ref = floor_mask[y:y + band_h, x:x + w].copy()
+        self._floor_key = (floor_mask.shape, top_limit, bottom_limit)
+        self._floor_prev = filled_mask
+
+    def _floor_unchanged(self, floor_mask, top_limit, bottom_limit):
+        """마지막 전체 계산 대비 바닥 경계 밴드 안의 흰색 마스크가 그대로인지 확인"""
+        if self._floor_prev is None or self._floor_key != (floor_mask.shape, top_limit, bottom_limit):
+            return False
+        y1, y2, x1, x2 = self._floor_rect
+        return cv2.norm(floor_mask[y1:y2, x1:x2], self._floor_ref, cv2.NORM_INF, mask=self._floor_band) == 0
+
+    def reset_floor_tracking(self):
+        """추적 상태 초기화 (다음 프레임에서 바닥 마스크를 전체 재계산)"""
+        self._floor_prev = None
+        self._floor_ref = None
+        self._floor_band = None
+        self._floor_rect = None
+        self._floor_key = None
+        self._floor_misses = 0
+
+    def _get_color_masks(self, code):
         masks = {}
-        for color_name, boundaries in self.color_ranges.items():
-            if color_name == 'red': # 빨간색은 두 범위를 합침
-                mask1 = cv2.inRange(hsv, boundaries[0], boundaries[1])
-                mask2 = cv2.inRange(hsv, boundaries[2], boundaries[3])
-                masks[color_name] = cv2.bitwise_or(mask1, mask2)
-            else:
-                masks[color_name] = cv2.inRange(hsv, boundaries[0], boundaries[1])
+        for color_name, bits in self._color_bits.items():
+            masks[color_name] = self._bits_to_mask(code, bits)
         return masks
 
-    def recognize(
-            self,
-            frame,
-            min_detection_area_ratio = None,
-            return_mask = False  # 반환 시 인식한 색 영역의 마스크도 반환할지
-    ):
-        if min_detection_area_ratio is None:
-            min_detection_area_ratio = self.min_detection_area_ratio
+    def _count_color_areas(self, code, floor_mask, start_row=0):
+        """
+        바닥 마스크 안쪽 코드 히스토그램 한 번으로 색상별 픽셀 수 집계
+        (calcHist의 mask로 ROI 안쪽만 세므로 ROI 코드 영상을 따로 만들지 않음, start_row 위쪽은 ROI 밖)
+        """
+        n_codes = self._color_membership.shape[1]
+        if start_row >= code.shape[0]:
+            hist = np.zeros(n_codes, dtype=np.int64)
+        else:
+            hist = cv2.calcHist([code[start_row:]], [0], floor_mask[start_row:], [n_codes], [0, n_codes])
+            hist = hist.ravel().astype(np.int64)
+        counts = self._color_membership @ hist
+        return dict(zip(self._color_bits.keys(), (int(c) for c in counts)))
+
+    def _label_image(self, roi_code):
+        # 범위 코드 -> 색상 라벨 영상 (uint8, 0은 배경)
+        if roi_code.dtype == np.uint8:
+            return cv2.LUT(roi_code, self._label_lut, dst=self._buffer('labels', roi_code.shape))
+        return self._label_lut[roi_code]
 
-        img = frame.copy()
-        h, w = img.shape[:2]
+    def _analysis_size(self, h, w):
+        if self.analysis_width is not None:
+            scale = min(1.0, self.analysis_width / w)
+        else:
+            scale = self.analysis_scale
+        if scale >= 1.0:
+            return h, w
+        return max(1, round(h * scale)), max(1, round(w * scale))
+
+    def _preprocess(self, frame, size, timer):
+        # 전처리 함수들은 모두 새 배열(또는 workspace 버퍼)에 결과를 쓰므로 원본 frame은 변경되지 않음
+        img = frame
+        w, h = size
+
+        # 축소 분석 모드: 이후 모든 단계를 축소된 프레임에서 수행
+        if (h, w) != frame.shape[:2]:
+            img = cv2.resize(
+                frame, (w, h), dst=self._buffer('analysis', (h, w, frame.shape[2])),
+                interpolation=cv2.INTER_AREA
+            )
+            timer.lap('resize')
 
         # 밝기 조정 옵션
         if self.apply_enhance_brightness:
-            img = apply_clahe_color(img)
+            img = apply_clahe_color(img, dst=self._buffer('clahe', img.shape), workspace=self.workspace)
+            timer.lap('clahe')
 
         # 톤 밸런싱 적용
-        img = apply_white_balance(img, self.white_balancing_p)
+        img = apply_white_balance(
+            img, self.white_balancing_p,
+            dst=self._buffer('white_balance', img.shape), sample_step=self.white_balance_sample_step
+        )
+        timer.lap('white_balance')
 
         # HSV 값 구하기
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV, dst=self._buffer('hsv', img.shape))
+        timer.lap('hsv')
+        return hsv
+
+    def _preprocess_context(self, context, size, timer):
+        # FrameContext에 저장된 전처리 결과 사용 (없으면 계산 후 저장, workspace 버퍼는 사용하지 않음)
+        if size != (context.shape[1], context.shape[0]):
+            context.resized(size)
+            timer.lap('resize')
+
+        if self.apply_enhance_brightness:
+            context.clahe(size)
+            timer.lap('clahe')
+
+        params = (self.white_balancing_p, self.white_balance_sample_step, size, self.apply_enhance_brightness)
+        context.white_balanced(*params)
+        timer.lap('white_balance')
+
+        hsv = context.hsv(*params)
+        timer.lap('hsv')
+        return hsv
+
+    def _floor_code(self, frame, timer):
+        """
+        전처리 -> 범위 코드 분류 -> 바닥 ROI 마스크
+        반환: (code, floor_roi_mask, 분류 시작 행, 분석 해상도 (h, w), 원본 (h, w))
+        """
+        if self.workspace is not None:
+            self.workspace.begin_frame()
+
+        frame_h, frame_w = frame.shape[:2]
+        h, w = self._analysis_size(frame_h, frame_w)
+        if isinstance(frame, FrameContext):
+            hsv = self._preprocess_context(frame, (w, h), timer)
+        else:
+            hsv = self._preprocess(frame, (w, h), timer)
+
+        # 모든 픽셀을 HSV 범위 코드로 한 번에 분류 (바닥 ROI에서 항상 제외되는 상단 행은 생략)
+        start_row = self._classify_start_row(h)
+        code = self._classify(hsv, start_row)
+        timer.lap('classify')
 
         # 바닥 ROI 마스크 생성
-        floor_roi_mask = self._get_floor_mask(hsv, h)
+        floor_roi_mask = self._get_floor_mask(code, h)
+        timer.lap('floor_mask')
+        return code, floor_roi_mask, start_row, (h, w), (frame_h, frame_w)
 
-        # 색상별 마스크 생성
-        color_masks = self._get_color_masks(hsv)
+    def _roi_code(self, frame, timer):
+        """전처리 -> 범위 코드 분류 -> 바닥 ROI 밖 코드 제거, 반환: (roi_code, 분석 해상도 (h, w), 원본 (h, w))"""
+        code, floor_roi_mask, _, (h, w), (frame_h, frame_w) = self._floor_code(frame, timer)
 
-        # 색상 영역을 추출하여 가장 큰 색상 영역 찾기
+        # 바닥 ROI 내부 코드만 남김
+        if self.workspace is None:
+            roi_code = cv2.bitwise_and(code, code, mask=floor_roi_mask)
+        else:
+            # dst를 지정하면 마스크 밖 픽셀은 그대로 남으므로 0으로 초기화 후 사용
+            roi_code = self.workspace.zeros('roi_code', code.shape, code.dtype)
+            cv2.bitwise_and(code, code, dst=roi_code, mask=floor_roi_mask)
+        return roi_code, (h, w), (frame_h, frame_w)
+
+    def recognize(
+            self,
+            frame,  # BGR 프레임 또는 FrameContext (다른 인식기와 전처리 결과 공유)
+            min_detection_area_ratio = None,
+            return_mask = False  # 반환 시 인식한 색 영역의 마스크도 반환할지
+    ):
+        if min_detection_area_ratio is None:
+            min_detection_area_ratio = self.min_detection_area_ratio
+
+        timer = start_timer(self.timing_sink, 'color')
+        code, floor_roi_mask, start_row, (h, w), (frame_h, frame_w) = self._floor_code(frame, timer)
+
+        # 색상별 면적 집계
+        color_areas = self._count_color_areas(code, floor_roi_mask, start_row)
+
+        # 가장 큰 색상 영역 찾기
         largest_area_size = 0
         largest_color = None
-        largest_color_mask = None
-        for color_name, color_mask in color_masks.items():
-            roi_color_mask = cv2.bitwise_and(floor_roi_mask, color_mask)
-            area_size = cv2.countNonZero(roi_color_mask)
+        for color_name, area_size in color_areas.items():
             area_size_ratio = area_size / (h * w)
 
             if area_size_ratio > largest_area_size:
                 largest_area_size = area_size_ratio
                 largest_color = color_name
-                largest_color_mask = roi_color_mask
 
         if largest_area_size >= min_detection_area_ratio:
+            largest_color_mask = None
+            if return_mask and largest_color is not None:
+                largest_color_mask = self._bits_to_mask(code, self._color_bits[largest_color])
+                cv2.bitwise_and(largest_color_mask, floor_roi_mask, dst=largest_color_mask)
+                if (h, w) != (frame_h, frame_w):
+                    largest_color_mask = cv2.resize(
+                        largest_color_mask, (frame_w, frame_h), interpolation=cv2.INTER_NEAREST
+                    )
+            timer.lap('color_masks')
+
             return ColorRecognitionResult(
                 color=largest_color,
                 area_ratio=largest_area_size,
-                mask=largest_color_mask if return_mask else None
+                mask=largest_color_mask,
+                timings=timer.finish()
             )
         else:
+            timer.lap('color_masks')
+            timer.finish()
             return None
 
+    def recognize_blobs(
+            self,
+            frame,  # BGR 프레임 또는 FrameContext
+            min_detection_area_ratio = None,
+    ) -> Dict[str, List[ColorBlob]]:
+        """
+        바닥 ROI 내 모든 색상의 연결 영역(blob)을 한 번에 분석
+        색상 라벨 영상(0: 배경, 1~: 색상)의 전경에 connectedComponentsWithStats를 한 번만 실행하고,
+        서로 다른 색이 맞닿아 하나로 묶인 컴포넌트만 해당 bbox 안에서 색상별로 다시 분리
+        반환: {색상: 면적 내림차순 ColorBlob 목록} (면적 비율이 min_detection_area_ratio 이상인 blob만, 모든 색상 키 포함)
+        """
+        if min_detection_area_ratio is None:
+            min_detection_area_ratio = self.min_detection_area_ratio
+
+        timer = start_timer(self.timing_sink, 'color_blobs')
+        roi_code, (h, w), (frame_h, frame_w) = self._roi_code(frame, timer)
+
+        labels = self._label_image(roi_code)
+        timer.lap('labels')
+
+        n, components, stats, centroids = cv2.connectedComponentsWithStats(labels, connectivity=8)
+        timer.lap('components')
+
+        color_names = list(self._color_bits)
+        blobs = {color_name: [] for color_name in color_names}
+        min_area = max(1, math.ceil(min_detection_area_ratio * h * w))
+
+        # 기준 면적 이상인 컴포넌트만 색상 구성 확인 (컴포넌트보다 작은 조각도 기준 미달)
+        n_labels = len(color_names) + 1
+        for i in np.flatnonzero(stats[1:, cv2.CC_STAT_AREA] >= min_area) + 1:
+            x, y, bw, bh = stats[i, :4]
+            component = components[y:y + bh, x:x + bw] == i
+            label_crop = labels[y:y + bh, x:x + bw]
+            counts = np.bincount(label_crop[component], minlength=n_labels)[1:]
+
+            # 단일 색상 컴포넌트: 통계 그대로 사용
+            if np.count_nonzero(counts) == 1:
+                blobs[color_names[counts.argmax()]].append((stats[i], centroids[i]))
+                continue
+
+            # 여러 색상이 맞닿은 컴포넌트: bbox 안에서 색상별 연결 영역 다시 계산
+            for color_idx in np.flatnonzero(counts >= min_area):
+                mask = (component & (label_crop == color_idx + 1)).view(np.uint8)
+                _, _, sub_stats, sub_centroids = cv2.connectedComponentsWithStats(mask, connectivity=8)
+                for j in np.flatnonzero(sub_stats[1:, cv2.CC_STAT_AREA] >= min_area) + 1:
+                    sub_stats[j, 0] += x
+                    sub_stats[j, 1] += y
+                    blobs[color_names[color_idx]].append((sub_stats[j], sub_centroids[j] + (x, y)))
+
+        # 분석 해상도 -> 원본 좌표
+        sx, sy = frame_w / w, frame_h / h
+        result = {}
+        for color_name, items in blobs.items():
+            items.sort(key=lambda item: -item[0][cv2.CC_STAT_AREA])
+            result[color_name] = [
+                ColorBlob(
+                    color=color_name,
+                    area_ratio=float(stat[cv2.CC_STAT_AREA]) / (h * w),
+                    centroid=(float((cx + 0.5) * sx - 0.5), float((cy + 0.5) * sy - 0.5)),
+                    bbox=(
+                        int(round(stat[0] * sx)), int(round(stat[1] * sy)),
+                        int(round((stat[0] + stat[2]) * sx)), int(round((stat[1] + stat[3]) * sy))
+                    ),
+                )
+                for stat, (cx, cy) in items
+            ]
+        timer.lap('blobs')
+        timer.finish()
+        return result
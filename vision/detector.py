@@ -1,12 +1,20 @@
-from typing import Optional
+from typing import List, Optional, Union
 import numpy as np
-from vision.utils.verifier import is_plate_like, plate_similarity
-from vision.result import PlateResult
+from vision.frame import FrameContext
+from vision.utils.verifier import filter_plate_like, plate_similarity_matrix
+from vision.result import OCRBatch, PlateResult
+from vision.plate_index import PlateIndex
 from vision.utils.image_proc import apply_clahe_color
+from vision.utils.proposal import propose_plate_regions
+from vision.utils.timing import NULL_TIMER, TimingSink, start_timer
+from vision.utils.workspace import FrameWorkspace
 
 
 class PlateNumberDetector:
 
+    # 겹치는 후보 영역에서 중복 인식된 라인으로 볼 bbox IoU
+    PROPOSAL_DEDUP_IOU = 0.5
+
     def __init__(
             self,
             *,
@@ -14,16 +22,32 @@ class PlateNumberDetector:
             plate_similarity_thresh: float = 80,
             apply_preprocess: bool = True,
             ocr_params: Optional[dict] = None,
+            use_workspace: bool = False,
+            use_proposals: bool = False,
+            proposal_params: Optional[dict] = None,
+            lazy_load: bool = False,
+            verbose: bool = False,
+            timing_sink: Optional[TimingSink] = None,
             **engine_kwargs,
     ):
+        # 단계별 소요 시간 계측 (None이면 비활성화, 결과의 timings에도 기록)
+        self.timing_sink = timing_sink
+        # 문자열 타겟 탐지 시 후보별 유사도와 최종 결과 출력 여부
+        self.verbose = verbose
         self.apply_preprocess = apply_preprocess
+        # 프레임 간 전처리 버퍼 재사용 (workspace.stats()로 할당 절감량 확인 가능)
+        self.workspace = FrameWorkspace() if use_workspace else None
         self.plate_similarity_thresh = plate_similarity_thresh
+        # 번호판 후보 영역만 잘라 OCR (후보가 없으면 전체 프레임 OCR)
+        self.use_proposals = use_proposals
+        self.proposal_params = proposal_params or {}
         ocr_params = ocr_params or {}
 
         if model == "paddle":
             try:
                 from vision.engines.paddle import PaddleOCREngine
-                self.engine = PaddleOCREngine(**ocr_params, **engine_kwargs)
+                # lazy_load=True면 모델은 첫 detect 또는 warmup() 시점에 로드
+                self.engine = PaddleOCREngine(lazy_load=lazy_load, **ocr_params, **engine_kwargs)
             except Exception as e:
                 raise RuntimeError(
                     f"It appears that the required environment for PaddleOCR has not been set up correctly. \
@@ -36,39 +60,183 @@ class PlateNumberDetector:
         else:
             raise ValueError(f"Unsupported OCR model: {model} (support only 'paddle', 'clova'")
 
-    def detect(self, frame: np.ndarray, target: str = '') -> Optional[PlateResult]:
-        img = frame.copy()
+    def warmup(self, background: bool = False):
+        """
+        OCR 엔진 준비 (지연 로드된 모델 로드 + 더미 추론)
+        background=True면 별도 스레드에서 실행하고 해당 스레드 반환
+        (그동안 detect 호출 가능, 추론은 엔진 내부에서 직렬화되어 warmup 추론이 끝난 뒤 실행)
+        """
+        return self.engine.warmup(background=background)
 
-        # 전처리
-        if self.apply_preprocess:
-            img = apply_clahe_color(img)
+    def detect(
+            self,
+            frame: Union[np.ndarray, FrameContext],
+            target: Union[str, PlateIndex] = '',
+    ) -> Union[Optional[PlateResult], List[PlateResult]]:
+        """
+        target이 문자열이면 가장 유사한 번호판 1개(없으면 None),
+        PlateIndex이면 OCR 라인별로 전체 타겟 중 가장 유사한 번호판 목록 반환
+        frame에 FrameContext를 넘기면 ColorRecognizer 등과 CLAHE 결과를 공유
+        """
+        timer = start_timer(self.timing_sink, 'plate')
+        img = self._preprocess(frame)
+        timer.lap('preprocess')
+
+        # OCR
+        ocr_result = self._recognize_images([img], timer, [frame])[0]
+
+        result = self._select_target(ocr_result, target)
+        timer.lap('verify')
+        return self._attach_timings(result, timer.finish())
+
+    def detect_many(
+            self,
+            frames: List[Union[np.ndarray, FrameContext]],
+            target: Union[str, PlateIndex] = '',
+    ) -> List[Union[Optional[PlateResult], List[PlateResult]]]:
+        """
+        여러 프레임을 한 번에 탐지 (엔진의 배치 호출로 모델 호출/전처리/HTTP 오버헤드 분산)
+        반환: 입력 프레임 순서대로 프레임별 탐지 결과 (없으면 None)
+        """
+        # 단계별 시간은 배치 전체 기준으로 기록되어 모든 결과에 같은 값이 붙음
+        timer = start_timer(self.timing_sink, 'plate_batch')
+
+        # 배치 내 프레임들이 같은 workspace 버퍼를 덮어쓰지 않도록 프레임별로 새로 할당
+        images = [self._preprocess(frame, use_workspace=False) for frame in frames]
+        timer.lap('preprocess')
 
         # OCR
-        ocr_result = self.engine.recognize(img)
+        ocr_results = self._recognize_images(images, timer, frames)
+
+        results = [self._select_target(ocr_result, target) for ocr_result in ocr_results]
+        timer.lap('verify')
+        timings = timer.finish()
+        return [self._attach_timings(result, timings) for result in results]
+
+    @staticmethod
+    def _attach_timings(result, timings):
+        if timings is None or result is None:
+            return result
+        for plate in (result if isinstance(result, list) else [result]):
+            plate.timings = timings
+        return result
+
+    def _recognize_images(self, images: List[np.ndarray], timer=NULL_TIMER, frames=None) -> List[OCRBatch]:
+        """
+        전처리된 이미지들의 OCR 결과 (이미지별 OCRBatch)
+        후보 영역 모드에서는 모든 이미지의 후보 영역을 한 번의 배치 호출로 OCR한 뒤
+        bbox를 원본 좌표로 되돌리고 겹치는 영역에서 중복 인식된 라인은 제거 (후보가 없는 이미지는 전체 이미지로 OCR)
+        디버그 모드에서는 저장된 전체 프레임 결과를 사용하므로 후보 영역 검출 생략
+        frames: 이미지별 입력 프레임 (FrameContext이면 후보 영역 검출에 저장된 그레이스케일 사용)
+        """
+        if not self.use_proposals or self.engine.debug_mode:
+            if len(images) == 1:
+                return [self.engine.recognize_columnar(images[0], timer)]
+            return self.engine.recognize_batch_columnar(images, timer)
+
+        crops, owners = [], []
+        for i, img in enumerate(images):
+            frame = frames[i] if frames is not None else None
+            if isinstance(frame, FrameContext):
+                regions = propose_plate_regions(frame.gray(clahe=self.apply_preprocess), **self.proposal_params)
+            else:
+                regions = propose_plate_regions(img, **self.proposal_params)
+            if not regions:
+                regions = [(0, 0, img.shape[1], img.shape[0])]
+            for x1, y1, x2, y2 in regions:
+                crops.append(img[y1:y2, x1:x2])
+                owners.append((i, x1, y1))
+        timer.lap('proposals')
+
+        results = [[] for _ in images]
+        for (i, ox, oy), crop_result in zip(owners, self.engine.recognize_batch_columnar(crops, timer)):
+            results[i].append(crop_result.offset(ox, oy))
+        return [OCRBatch.concat(batches).deduplicate(self.PROPOSAL_DEDUP_IOU) for batches in results]
+
+    def detect_candidates(self, frame: Union[np.ndarray, FrameContext], target: Union[str, PlateIndex] = '') -> List[PlateResult]:
+        """
+        번호판 형식인 모든 OCR 라인을 유사도 임계치와 관계없이 반환 (다중 프레임 투표 등 후처리용)
+        """
+        timer = start_timer(self.timing_sink, 'plate')
+        img = self._preprocess(frame)
+        timer.lap('preprocess')
+        ocr_result = self._recognize_images([img], timer, [frame])[0]
+        candidates = self._plate_candidates(ocr_result, target)
+        timer.lap('verify')
+        return self._attach_timings(candidates, timer.finish())
+
+    def _plate_candidates(self, ocr_result: OCRBatch, target: Union[str, PlateIndex]) -> List[PlateResult]:
+        # 번호판 형식인 OCR 라인만 골라 타겟과의 유사도 계산 (PlateResult는 후보에 대해서만 생성)
+        indices = np.flatnonzero(filter_plate_like(ocr_result.texts))
+        texts = [ocr_result.texts[i].replace(' ', '') for i in indices]
+
+        if isinstance(target, PlateIndex):
+            # 전체 타겟과 한 번에 비교
+            best = target.best_matches(texts)
+        else:
+            best = [(None, float(similarity)) for similarity in plate_similarity_matrix(texts, [target])[:, 0]]
+
+        confidences = ocr_result.confidences[indices].tolist()
+        bboxes = ocr_result.bboxes[indices].tolist()
+        return [
+            PlateResult(
+                text=text,
+                similarity=similarity,
+                bbox=tuple(bbox),
+                target=matched_target,
+                confidence=confidence
+            )
+            for text, confidence, bbox, (matched_target, similarity) in zip(texts, confidences, bboxes, best)
+        ]
+
+    def _select_target(
+            self,
+            ocr_result: OCRBatch,
+            target: Union[str, PlateIndex],
+    ) -> Union[Optional[PlateResult], List[PlateResult]]:
+        plates = self._plate_candidates(ocr_result, target)
+
+        if isinstance(target, PlateIndex):
+            return [
+                plate for plate in plates
+                if plate.target is not None and plate.similarity >= self.plate_similarity_thresh
+            ]
 
         # 타겟 번호판과의 유사도 측정
-        plates = []
         target_plate = None
         best_similarity = 0
 
-        for res in ocr_result:
-            res.text = res.text.replace(' ', '')
-            if not is_plate_like(res.text):
-                continue
-
-            similarity = plate_similarity(target, res.text)
-            plate = PlateResult(text=res.text, similarity=similarity, bbox=res.bbox)
-            plates.append(plate)
-            print(target, res.text, similarity, sep=' | ')
+        for plate in plates:
+            if self.verbose:
+                print(target, plate.text, plate.similarity, sep=' | ')
 
-            if similarity < self.plate_similarity_thresh:
+            if plate.similarity < self.plate_similarity_thresh:
                 continue
-            if similarity > best_similarity:
-                best_similarity = similarity
+            if plate.similarity > best_similarity:
+                best_similarity = plate.similarity
                 target_plate = plate
 
-        print('찾은 타겟 번호판')
-        print(target_plate)
-        print('유사도 점수:', best_similarity)
+        if self.verbose:
+            print('찾은 타겟 번호판')
+            print(target_plate)
+            print('유사도 점수:', best_similarity)
 
         return target_plate
+
+    def _preprocess(self, frame: Union[np.ndarray, FrameContext], use_workspace: bool = True) -> np.ndarray:
+        # FrameContext: 저장된 CLAHE 결과를 그대로 사용 (읽기 전용, 다른 인식기와 공유)
+        if isinstance(frame, FrameContext):
+            return frame.clahe() if self.apply_preprocess else frame.frame
+
+        # 원본 frame은 변경하지 않고 새 배열(또는 workspace 버퍼)에 결과를 씀
+        if self.workspace is None or not use_workspace:
+            if self.apply_preprocess:
+                return apply_clahe_color(frame)
+            return frame.copy()
+
+        self.workspace.begin_frame()
+        img = self.workspace.get('frame', frame.shape, frame.dtype)
+        if self.apply_preprocess:
+            return apply_clahe_color(frame, dst=img, workspace=self.workspace)
+        np.copyto(img, frame)
+        return img
@@ -0,0 +1,19 @@
+# 엔진 모듈은 사용할 때 import (paddleocr / requests 로드 지연)
+_EXPORTS = {
+    'OCRBase': 'vision.engines.base',
+    'OCRResultCache': 'vision.engines.cache',
+    'PaddleOCREngine': 'vision.engines.paddle',
+    'ClovaOCREngine': 'vision.engines.clova',
+    'ClovaOCRError': 'vision.engines.clova',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'vision.engines' has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
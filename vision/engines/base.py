@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from vision.result import RawOCR, PlateResult
-from typing import List
+from vision.result import OCRBatch, RawOCR, PlateResult
+from vision.engines.cache import OCRResultCache
+from vision.utils.timing import NULL_TIMER
+from typing import List, Optional, Union
+import threading
 import numpy as np
 
 class OCRBase(ABC):
@@ -11,9 +14,12 @@ class OCRBase(ABC):
             y_center_ratio=0.2,
             min_height_ratio=0.6,
             max_spacing_ratio=0.1,
-            debug_mode=False
+            debug_mode=False,
+            cache: Optional[OCRResultCache] = None
     ):
         self.debug_mode = debug_mode
+        # 동일한(유사한) 입력 이미지에 대한 OCR 결과 캐시 (None이면 사용 안 함)
+        self.cache = cache
         self.y_center_ratio = y_center_ratio
         self.min_height_ratio = min_height_ratio
         self.max_spacing_ratio = max_spacing_ratio
@@ -22,10 +28,38 @@ class OCRBase(ABC):
     def _recognize_raw(self, image: np.ndarray):
         """
         엔진별 raw OCR 결과 반환하는 raw 메소드
-        예: [(text, score, bbox), ...]
+        OCRBatch (또는 RawOCR 리스트) 반환
         """
         pass
 
+    def warmup(self, background: bool = False) -> Optional[threading.Thread]:
+        """
+        모델/클라이언트를 미리 준비 (지연 로드된 모델 로드 + 더미 추론)
+        background=True면 데몬 스레드에서 실행하고 해당 스레드 반환
+        """
+        if background:
+            thread = threading.Thread(target=self._warmup, name=f'{type(self).__name__}-warmup', daemon=True)
+            thread.start()
+            return thread
+
+        self._warmup()
+        return None
+
+    def _warmup(self):
+        """엔진별 준비 작업 (기본: 더미 이미지 1장 인식)"""
+        self._recognize_raw(self._dummy_image())
+
+    @staticmethod
+    def _dummy_image() -> np.ndarray:
+        return np.full((48, 160, 3), 255, dtype=np.uint8)
+
+    def _recognize_raw_batch(self, images: List[np.ndarray]) -> List[OCRBatch]:
+        """
+        여러 이미지의 raw OCR 결과를 입력 순서대로 반환
+        네이티브 배치를 지원하는 엔진은 재정의하고, 기본 구현은 이미지별로 순차 호출
+        """
+        return [self._recognize_raw(image) for image in images]
+
     def _merge_ocr_boxes(
             self,
             results: List[RawOCR],
@@ -34,75 +68,157 @@ class OCRBase(ABC):
             min_height_ratio: float,
             max_spacing_ratio: float
     ) -> List[RawOCR]:
+        """
+        인식 결과 중 병합해야 하는 문자열을 병합 (RawOCR 리스트용 호환 메소드, 구현은 _merge_batch)
+        """
+        return self._merge_batch(
+            OCRBatch.from_raw(results),
+            y_center_ratio=y_center_ratio,
+            min_height_ratio=min_height_ratio,
+            max_spacing_ratio=max_spacing_ratio
+        ).to_raw()
+
+    @staticmethod
+    def _merge_batch(
+            batch: OCRBatch,
+            *,
+            y_center_ratio: float,
+            min_height_ratio: float,
+            max_spacing_ratio: float
+    ) -> OCRBatch:
         """
         인식 결과 중 병합해야 하는 문자열을 병합
         예를 들어 '640오8800'처럼 붙어있는 문자열인데 '640오'와 '8800'으로 분리되어 인식된 경우
+        1. y축 중심으로 정렬 후 간격이 큰 곳에서 끊어 라인 단위로 묶음 (여러 줄의 글자가 x 순서로 섞이지 않도록)
+        2. 라인 안에서 x1 순으로 인접한 두 박스씩 병합 조건을 계산해 연속 구간을 하나로 병합
+        입력 배치는 변경하지 않으며, 결과는 (x1, y1) 순으로 정렬
         """
-        if not results:
-            return []
+        n = len(batch)
+        if n == 0:
+            return OCRBatch.empty()
+
+        boxes = batch.bboxes.astype(np.float64)
+        x1, y1, x2, y2 = boxes.T
+        heights = y2 - y1
+        widths = x2 - x1
+        centers = (y1 + y2) / 2
+
+        # 1. 라인 분리: y 중심 순으로 인접한 박스의 중심 차이가 허용치를 넘으면 새 라인
+        order = np.argsort(centers, kind='stable')
+        gaps = np.diff(centers[order])
+        tol = np.minimum(heights[order][:-1], heights[order][1:]) * y_center_ratio
+        line = np.empty(n, dtype=np.int64)
+        line[order] = np.concatenate(([0], np.cumsum(gaps > tol)))
+
+        # 라인 -> x1 순 정렬
+        order = np.lexsort((x1, line))
+        x1, y1, x2, y2 = x1[order], y1[order], x2[order], y2[order]
+        heights, widths, centers, line = heights[order], widths[order], centers[order], line[order]
 
-        # x1 기준 정렬
-        results = sorted(results, key=lambda r: r.bbox[0])
-        merged: List[RawOCR] = [results[0]]
-
-        for result in results[1:]:
-            text, score, bbox = result.text, result.confidence, result.bbox
-            prev_text, prev_score, prev_bbox = merged[-1].text, merged[-1].confidence, merged[-1].bbox
-
-            px1, py1, px2, py2 = prev_bbox
-            x1, y1, x2, y2 = bbox
-            prev_h = py2 - py1
-            curr_h = y2 - y1
-            prev_w = px2 - px1
-            curr_w = x2 - x1
-
-            # 1. -y축 정렬
-            # center 기준 y축 중심이 비슷한 라인에 있는지
-            prev_center_y = (py1 + py2) / 2
-            curr_center_y = (y1 + y2) / 2
-            y_center_diff = abs(prev_center_y - curr_center_y)
-            y_align_ok = y_center_diff <= min(prev_h, curr_h) * y_center_ratio
-
-            # 2. 높이 비율
-            height_ratio = min(prev_h, curr_h) / max(prev_h, curr_h)
-            height_ok = height_ratio >= min_height_ratio
-
-            # 3. 문자 간 평균 폭 대비 거리
-            avg_char_width = (prev_w + curr_w) / 2
-            x_gap = x1 - px2
-            spacing_ok = x_gap <= avg_char_width * max_spacing_ratio
-
-            # 4. 병합 여부 판단
-            if y_align_ok and height_ok and spacing_ok:
-                new_text = prev_text + text
-                new_score = min(prev_score, score)
-                new_bbox = (
-                    px1,
-                    min(py1, y1),
-                    x2,
-                    max(py2, y2),
-                )
-                merged[-1].text = new_text
-                merged[-1].confidence = new_score
-                merged[-1].bbox = new_bbox
-            else:
-                merged.append(RawOCR(text=text, confidence=score, bbox=bbox))
+        # 2. 인접한 두 박스(prev, curr)의 병합 조건
+        min_h = np.minimum(heights[:-1], heights[1:])
+        max_h = np.maximum(heights[:-1], heights[1:])
+        # -y축 정렬: center 기준 y축 중심이 비슷한 라인에 있는지
+        y_align_ok = np.abs(centers[:-1] - centers[1:]) <= min_h * y_center_ratio
+        # 높이 비율
+        height_ratio = np.divide(min_h, max_h, out=np.ones_like(min_h), where=max_h > 0)
+        height_ok = height_ratio >= min_height_ratio
+        # 문자 간 평균 폭 대비 거리
+        spacing_ok = x1[1:] - x2[:-1] <= (widths[:-1] + widths[1:]) / 2 * max_spacing_ratio
 
+        merge = (line[:-1] == line[1:]) & y_align_ok & height_ok & spacing_ok
+
+        # 병합되지 않는 지점마다 새 그룹 시작
+        starts = np.flatnonzero(np.concatenate(([True], ~merge)))
+        ends = np.append(starts[1:], n)
+
+        merged_boxes = np.stack((
+            x1[starts],
+            np.minimum.reduceat(y1, starts),
+            x2[ends - 1],
+            np.maximum.reduceat(y2, starts),
+        ), axis=1)
+        merged_scores = np.minimum.reduceat(batch.confidences[order], starts)
+        texts = [batch.texts[i] for i in order]
+        merged_texts = [''.join(texts[s:e]) for s, e in zip(starts, ends)]
+
+        out = np.lexsort((merged_boxes[:, 1], merged_boxes[:, 0]))
+        return OCRBatch([merged_texts[i] for i in out], merged_scores[out], merged_boxes[out])
+
+    def recognize_columnar(self, image: np.ndarray, timer=NULL_TIMER) -> OCRBatch:
+        """
+        공통 파이프라인 (열 단위 결과)
+        (캐시 조회) → OCR → bbox 병합 → OCRBatch
+        timer: 단계별 시간 기록용 StageTimer (cache / ocr_raw / merge)
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(image)
+            cached = self.cache.get(key)
+            timer.lap('cache')
+            if cached is not None:
+                return cached
+
+        raw_results = self._recognize_raw(image)
+        timer.lap('ocr_raw')
+        merged = self._merge(raw_results)
+        timer.lap('merge')
+
+        if key is not None:
+            self.cache.put(key, merged)
+            timer.lap('cache')
         return merged
 
+    def recognize_batch_columnar(self, images: List[np.ndarray], timer=NULL_TIMER) -> List[OCRBatch]:
+        """
+        배치 파이프라인 (열 단위 결과)
+        여러 이미지를 엔진의 배치 호출 한 번으로 OCR → 이미지별 bbox 병합
+        """
+        if not images:
+            return []
+        if self.cache is None:
+            raw_batches = self._recognize_raw_batch(list(images))
+            timer.lap('ocr_raw')
+            results = [self._merge(raw_results) for raw_results in raw_batches]
+            timer.lap('merge')
+            return results
+
+        # 캐시에 없는 이미지만 모아 배치 호출
+        keys = [self.cache.key(image) for image in images]
+        results = [self.cache.get(key) for key in keys]
+        missing = [i for i, cached in enumerate(results) if cached is None]
+        timer.lap('cache')
+        if missing:
+            raw_batches = self._recognize_raw_batch([images[i] for i in missing])
+            timer.lap('ocr_raw')
+            for i, raw_results in zip(missing, raw_batches):
+                results[i] = self._merge(raw_results)
+            timer.lap('merge')
+            for i in missing:
+                self.cache.put(keys[i], results[i])
+            timer.lap('cache')
+        return results
+
     def recognize(self, image: np.ndarray) -> List[RawOCR]:
         """
         공통 파이프라인
-        OCR → bbox 병합 → RawOCR 리스트 생성
+        (캐시 조회) → OCR → bbox 병합 → RawOCR 리스트 생성
         """
-        raw_results = self._recognize_raw(image)
+        return self.recognize_columnar(image).to_raw()
 
-        h, w = image.shape[:2]
-        merged = self._merge_ocr_boxes(
+    def recognize_batch(self, images: List[np.ndarray]) -> List[List[RawOCR]]:
+        """
+        배치 파이프라인 (recognize_batch_columnar 결과를 RawOCR 리스트로 변환)
+        """
+        return [batch.to_raw() for batch in self.recognize_batch_columnar(images)]
+
+    def _merge(self, raw_results: Union[OCRBatch, List[RawOCR]]) -> OCRBatch:
+        # 엔진이 RawOCR 리스트를 반환하는 경우도 지원
+        if not isinstance(raw_results, OCRBatch):
+            raw_results = OCRBatch.from_raw(raw_results)
+        return self._merge_batch(
             raw_results,
             y_center_ratio=self.y_center_ratio,
             min_height_ratio=self.min_height_ratio,
             max_spacing_ratio=self.max_spacing_ratio
         )
-
-        return merged
\ No newline at end of file
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+import cv2
+import numpy as np
+from vision.result import OCRBatch, RawOCR
+
+
+class OCRResultCache:
+    """
+    OCR 결과 캐시 (전처리된 입력 이미지의 해시 기준)
+    - 메모리: 항목 수 / 바이트 기준 LRU
+    - 디스크(선택): disk_dir에 JSON으로 저장하여 재시작 후에도 재사용
+    - 기본(hamming_tolerance=0): 픽셀까지 같은 이미지만 같은 항목으로 간주 (dHash + 이미지 내용 해시)
+    - 유사 이미지 매칭(hamming_tolerance > 0)은 선택 사항: dHash 간 해밍 거리가 hamming_tolerance 이하이고
+      이미지 크기가 같으면 같은 이미지로 간주
+      전체 프레임의 dHash는 번호판처럼 작은 영역의 차이를 거의 반영하지 않으므로,
+      같은 위치의 다른 차량 결과가 반환될 수 있음 (번호판 후보 영역처럼 작은 입력에서만 사용 권장)
+    """
+
+    def __init__(
+            self,
+            *,
+            max_entries: int = 256,
+            max_bytes: int = 4 * 1024 * 1024,
+            hamming_tolerance: int = 0,     # 0: 정확히 같은 이미지만, > 0: 유사 이미지 매칭 (선택)
+            hash_size: int = 16,    # dHash 격자 크기 (hash_size^2 비트)
+            disk_dir: Optional[str] = None,
+            max_disk_entries: int = 10000,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hamming_tolerance = hamming_tolerance
+        self.hash_size = hash_size
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (results, nbytes)
+        self._bytes = 0
+        self._disk_index = OrderedDict()    # key -> 파일 경로 (오래된 순)
+
+        # 통계
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    # 키 계산 ##################################################################
+
+    def key(self, image: np.ndarray) -> Tuple[bytes, Tuple[int, ...]]:
+        """(dHash 비트열, 이미지 shape) 반환 (hamming_tolerance=0이면 비트열 뒤에 이미지 내용 해시 추가)"""
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(gray, (self.hash_size + 1, self.hash_size), interpolation=cv2.INTER_AREA)
+        bits = small[:, 1:] > small[:, :-1]
+        digest = np.packbits(bits).tobytes()
+        if self.hamming_tolerance == 0:
+            digest += hashlib.blake2b(np.ascontiguousarray(image).data, digest_size=16).digest()
+        return digest, tuple(image.shape)
+
+    def _find(self, keys, key):
+        # 정확히 일치하는 키만 찾는 기본 모드는 dict 조회
+        if self.hamming_tolerance == 0:
+            return key if key in keys else None
+
+        # 유사 이미지 매칭: 같은 shape(와 같은 키 형식) 중 해밍 거리가 가장 가까운 키 검색
+        digest, shape = key
+        candidates = [k for k in keys if k[1] == shape and len(k[0]) == len(digest)]
+        if not candidates:
+            return None
+
+        hashes = np.frombuffer(b''.join(k[0] for k in candidates), dtype=np.uint8).reshape(len(candidates), -1)
+        query = np.frombuffer(digest, dtype=np.uint8)
+        distances = np.bitwise_count(hashes ^ query).sum(axis=1)
+        best = int(distances.argmin())
+        if distances[best] > self.hamming_tolerance:
+            return None
+        return candidates[best]
+
+    # 조회 / 저장 ###############################################################
+
+    def get(self, key) -> Optional[OCRBatch]:
+        with self._lock:
+            found = self._find(self._entries, key)
+            if found is not None:
+                self._entries.move_to_end(found)
+                self.hits += 1
+                return self._entries[found][0].copy()
+
+            path = None
+            if self.disk_dir is not None:
+                found = self._find(self._disk_index, key)
+                if found is not None:
+                    path = self._disk_index[found]
+
+        # 파일 읽기는 잠금 밖에서 수행 (디스크 IO 동안 다른 워커의 조회를 막지 않도록)
+        results = self._read_disk(path) if path is not None else None
+
+        with self._lock:
+            if results is None:
+                # 동시에 진행된 디스크 정리로 파일이 사라진 경우 인덱스에서도 제거
+                if path is not None and self._disk_index.get(found) == path and not os.path.exists(path):
+                    del self._disk_index[found]
+                self.misses += 1
+                return None
+            self._put_memory(found, results)
+            self.disk_hits += 1
+            return results.copy()
+
+    def put(self, key, results: Union[OCRBatch, List[RawOCR]]):
+        # 호출 측에서 결과를 수정해도 캐시가 바뀌지 않도록 복사본 저장
+        if isinstance(results, OCRBatch):
+            stored = results.copy()
+        else:
+            stored = OCRBatch.from_raw(results)
+        with self._lock:
+            self._put_memory(key, stored)
+        if self.disk_dir is not None:
+            self._write_disk(key, stored)
+
+    def _put_memory(self, key, stored):
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+
+        nbytes = (
+            len(key[0]) + stored.confidences.nbytes + stored.bboxes.nbytes
+            + sum(sys.getsizeof(text) for text in stored.texts)
+        )
+        self._entries[key] = (stored, nbytes)
+        self._bytes += nbytes
+
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self._bytes -= evicted_bytes
+            self.evictions += 1
+
+    # 디스크 계층 ###############################################################
+
+    @staticmethod
+    def _file_name(key):
+        digest, shape = key
+        return f"{digest.hex()}_{'x'.join(map(str, shape))}.json"
+
+    def _load_disk_index(self):
+        paths = [os.path.join(self.disk_dir, name) for name in os.listdir(self.disk_dir) if name.endswith('.json')]
+        for path in sorted(paths, key=os.path.getmtime):
+            name = os.path.basename(path)[:-len('.json')]
+            try:
+                digest_hex, shape = name.split('_')
+                key = (bytes.fromhex(digest_hex), tuple(int(v) for v in shape.split('x')))
+            except ValueError:
+                continue
+            self._disk_index[key] = path
+
+    def _read_disk(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                rows = json.load(f)
+            return OCRBatch(
+                [text for text, _, _ in rows],
+                [confidence for _, confidence, _ in rows],
+                [bbox for _, _, bbox in rows]
+            )
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, stored):
+        # 파일 쓰기/삭제는 잠금 밖에서, 인덱스 갱신만 잠금 안에서 수행
+        path = os.path.join(self.disk_dir, self._file_name(key))
+        # 같은 키를 동시에 저장해도 임시 파일이 겹치지 않도록 스레드별 임시 파일 사용
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            rows = list(zip(stored.texts, stored.confidences.tolist(), stored.bboxes.tolist()))
+            json.dump(rows, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        removed = []
+        with self._lock:
+            self._disk_index.pop(key, None)
+            self._disk_index[key] = path
+            while len(self._disk_index) > self.max_disk_entries:
+                removed.append(self._disk_index.popitem(last=False)[1])
+
+        for old_path in removed:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+    # 통계 ######################################################################
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'disk_entries': len(self._disk_index),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def clear(self):
+        """메모리 계층 비우기 (디스크 계층은 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
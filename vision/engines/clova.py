@@ -1,27 +1,129 @@
 from vision.engines.base import OCRBase
-from vision.result import RawOCR
-import requests
+from vision.result import OCRBatch
+import threading
 import uuid
 import time
 import json
 import os
-from dotenv import load_dotenv
 from io import BytesIO
 from cv2 import imencode
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ClovaOCRError(RuntimeError):
+    """Clova OCR API 호출 실패 (status_code: HTTP 상태 코드, 네트워크 오류 시 None)"""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class ClovaOCREngine(OCRBase):
 
-    def __init__(self, **ocr_params):
+    # 재시도 대상 HTTP 상태 코드 (요청 한도 초과, 서버 오류)
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(
+            self,
+            *,
+            api_url: str = None,
+            api_key: str = None,
+            timeout=(3.05, 10.0),
+            max_retries: int = 3,
+            backoff_factor: float = 0.5,
+            max_concurrency: int = 4,
+            **ocr_params
+    ):
         super().__init__(**ocr_params)
 
-        # .env 파일 로드
-        load_dotenv()
-        self.api_url = os.environ["CLOVA_OCR_API_URL"]
-        self.api_key = os.environ["CLOVA_OCR_API_KEY"]
-
+        # 동시에 진행할 최대 요청 수 (배치/비동기 인식 및 커넥션 풀 크기)
+        self.max_concurrency = max_concurrency
+
+        # 요청 타임아웃 (connect, read) 초, 재시도 횟수 및 지수 백오프 계수
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # .env 파일 로드 (인자로 지정하면 환경 변수보다 우선)
+        if api_url is None or api_key is None:
+            from dotenv import load_dotenv
+            load_dotenv()
+        self.api_url = api_url or os.environ["CLOVA_OCR_API_URL"]
+        self.api_key = api_key or os.environ["CLOVA_OCR_API_KEY"]
+
+        self._session = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self._inflight = threading.BoundedSemaphore(max_concurrency)
+
+    @property
+    def session(self):
+        """커넥션을 재사용하는 세션 (최초 사용 시 생성, requests도 이때 import)"""
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                # POST는 멱등이 아니므로 서버가 요청을 받았을 수 있는 읽기 오류/타임아웃은 재시도하지 않음
+                # (연결 실패와 RETRY_STATUS 응답만 재시도, 그 외는 ClovaOCRError로 전달)
+                retry = Retry(
+                    total=self.max_retries,
+                    read=0,
+                    other=0,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=self.RETRY_STATUS,
+                    allowed_methods=frozenset({'POST'}),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.max_concurrency,
+                    max_retries=retry
+                )
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers['X-OCR-SECRET'] = self.api_key
+                self._session = session
+            return self._session
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """배치/비동기 요청용 스레드 풀 (최초 사용 시 생성)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix='clova-ocr'
+                )
+            return self._executor
+
+    def close(self):
+        """세션과 스레드 풀 정리"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _warmup(self):
+        # 더미 요청은 API 호출 수를 소모하므로 세션/스레드 풀만 미리 생성
+        self.session
+        self.executor
+
+    def _send_request(self, image_bytes: BytesIO):
+        import requests
 
-    def _send_request(self, image_bytes: BytesIO) -> requests.Response:
         request_json = {
             'images': [{'format': 'jpg', 'name': 'demo'}],
             'requestId': str(uuid.uuid4()),
@@ -38,24 +140,49 @@ class ClovaOCREngine(OCRBase):
             ('file', ('plate.jpg', image_bytes, 'image/jpeg'))
         ]
 
-        headers = {
-            'X-OCR-SECRET': self.api_key
-        }
-
-        response = requests.request("POST", self.api_url, headers=headers, data=payload, files=files)
+        # 동시 요청 수 제한 (429/5xx 재시도와 백오프는 세션 어댑터가 처리)
+        with self._inflight:
+            try:
+                response = self.session.post(self.api_url, data=payload, files=files, timeout=self.timeout)
+            except requests.RequestException as e:
+                raise ClovaOCRError(f"API request failed: {e}") from e
+
+        if not response.ok:
+            raise ClovaOCRError(
+                f"API call failed with status {response.status_code}: {response.text[:200]}",
+                status_code=response.status_code
+            )
         return response
 
+    async def recognize_async(self, image):
+        """
+        asyncio용 인식 (요청은 엔진 스레드 풀에서 수행되어 이벤트 루프를 막지 않음)
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.recognize, image)
+
+    def _load_debug_result(self):
+        json_path = "./data/demo/test1_clova_res.json"
+        with open(json_path, 'r') as f:
+            return json.load(f)
+
+    def _recognize_raw_batch(self, images) -> [OCRBatch]:
+        # 디버그 모드: 사전 OCR 데이터를 한 번만 읽어 모든 이미지에 사용
+        if self.debug_mode:
+            raw_res = self._load_debug_result()
+            return [self._parse_fields(raw_res) for _ in images]
+
+        # Clova 요청은 이미지 1장 단위이므로 인코딩+요청을 동시에 수행해 대기 시간을 겹침
+        return list(self.executor.map(self._recognize_raw, images))
 
-    def _recognize_raw(self, image) -> [RawOCR]:
+    def _recognize_raw(self, image) -> OCRBatch:
 
-        result = []
         raw_res = None
 
         # 디버그 모드: 사전 OCR 데이터 사용(API 호출 수 절약용)
         if self.debug_mode:
-            json_path = "./data/demo/test1_clova_res.json"
-            with open(json_path, 'r') as f:
-                raw_res = json.load(f)
+            raw_res = self._load_debug_result()
 
         # OCR API 호출
         else:
@@ -66,26 +193,28 @@ class ClovaOCREngine(OCRBase):
             image_bytes = BytesIO(encoded_img.tobytes())
 
             # api 요청
+            response = self._send_request(image_bytes)
             try:
-                response = self._send_request(image_bytes)
-                raw_res = response.json()['images'][0]['fields']
-            except Exception as e:
-                raise RuntimeError("API call failed")
-
-        # Clova OCR 응답 결과 -> RawOCR 형식으로
-        for raw in raw_res:
-            text = raw['inferText']
-            vertices = raw['boundingPoly']['vertices']
-            score = raw['inferConfidence']
-
-            # 바운딩 박스 좌표 추출 (x, y)
-            p1 = (int(vertices[0]['x']), int(vertices[0]['y']))  # 좌상단
-            p3 = (int(vertices[2]['x']), int(vertices[2]['y']))  # 우하단
-
-            result.append(RawOCR(
-                text=text,
-                confidence=score,
-                bbox=(p1[0], p1[1], p3[0], p3[1])
-            ))
-
-        return result
\ No newline at end of file
+                image_res = response.json()['images'][0]
+            except (ValueError, KeyError, IndexError) as e:
+                raise ClovaOCRError("Unexpected API response format", status_code=response.status_code) from e
+
+            if image_res.get('inferResult', 'SUCCESS') != 'SUCCESS':
+                raise ClovaOCRError(f"OCR inference failed: {image_res.get('message', '')}")
+            raw_res = image_res.get('fields', [])
+
+        return self._parse_fields(raw_res)
+
+    def _parse_fields(self, raw_res) -> OCRBatch:
+
+        # Clova OCR 응답 결과 -> OCRBatch 형식으로
+        texts = [raw['inferText'] for raw in raw_res]
+        scores = [raw['inferConfidence'] for raw in raw_res]
+
+        # 바운딩 박스 좌표 추출 (좌상단 = 0번, 우하단 = 2번 꼭짓점)
+        polys = [
+            [(vertex['x'], vertex['y']) for vertex in raw['boundingPoly']['vertices']]
+            for raw in raw_res
+        ]
+
+        return OCRBatch.from_polys(texts, scores, polys)
@@ -1,59 +1,85 @@
 from vision.engines.base import OCRBase
-from vision.result import RawOCR
-from paddleocr import PaddleOCR
+from vision.result import OCRBatch
 import pickle
+import threading
+
+PADDLE_SETUP_ERROR = (
+    "It appears that the required environment for PaddleOCR has not been set up correctly. "
+    "Please check the compatibility of your environment by referring to the following link: "
+    "https://github.com/PaddlePaddle/PaddleOCR"
+)
+
 
 class PaddleOCREngine(OCRBase):
 
-    def __init__(self, **ocr_params):
+    def __init__(self, *, lazy_load: bool = False, **ocr_params):
         super().__init__(**ocr_params)
-        self.model = None
+        self._model = None
+        self._model_lock = threading.Lock()
+        # PaddleOCR 추론은 스레드 안전하지 않으므로 predict 호출을 직렬화 (백그라운드 warmup과 detect 동시 호출 대비)
+        self._predict_lock = threading.Lock()
 
         # 디버그 모드일 때는 모델 로드 생략
-        if not self.debug_mode:
+        # lazy_load=True면 첫 인식(또는 warmup) 시점에 paddleocr import 및 모델 로드
+        if not self.debug_mode and not lazy_load:
+            self._load_model()
 
-            # paddleocr 모델 로드
-            self.model = PaddleOCR(
+    @property
+    def model(self):
+        if self._model is None and not self.debug_mode:
+            self._load_model()
+        return self._model
+
+    def _load_model(self):
+        # 백그라운드 warmup과 첫 인식이 동시에 호출되어도 모델은 한 번만 로드
+        with self._model_lock:
+            if self._model is not None:
+                return
+
+            # paddleocr 모델 로드 (lazy_load 시에도 설치 문제는 같은 안내 메시지로 전달)
+            try:
+                from paddleocr import PaddleOCR
+            except ImportError as e:
+                raise RuntimeError(PADDLE_SETUP_ERROR) from e
+            self._model = PaddleOCR(
                 lang="korean",
                 use_doc_orientation_classify=False,
                 use_doc_unwarping=False,
                 use_textline_orientation=False
             )
 
-    def _recognize_raw(self, image) -> [RawOCR]:
+    def _warmup(self):
+        # 모델 로드 후 더미 이미지로 1회 추론 (첫 프레임의 초기화 지연 제거)
+        if not self.debug_mode:
+            self._recognize_raw(self._dummy_image())
 
-        result = []
-        raw_res = None
+    def _recognize_raw(self, image) -> OCRBatch:
+        return self._recognize_raw_batch([image])[0]
+
+    def _recognize_raw_batch(self, images) -> [OCRBatch]:
 
         if self.debug_mode:
             pkl_path = "./data/demo/test1_paddle_res.pkl"
             with open(pkl_path, 'rb') as f:
                 raw_res = pickle.load(f)
-        else:
-            raw_res = self.model.predict(image)
-            if len(raw_res) == 0:
-                return []
-            raw_res = raw_res[0]
+            return [self._parse_result(raw_res) for _ in images]
+
+        # predict는 이미지 리스트를 받아 이미지별 결과를 순서대로 반환
+        model = self.model
+        with self._predict_lock:
+            raw_batch = model.predict(images)
+        if len(raw_batch) == 0:
+            return [OCRBatch.empty() for _ in images]
+        return [self._parse_result(raw_res) for raw_res in raw_batch]
 
+    def _parse_result(self, raw_res) -> OCRBatch:
 
         texts = raw_res['rec_texts']
         scores = raw_res['rec_scores']
         polys = raw_res['rec_polys']
 
-        if not texts or not scores or not polys:
-            return []
-
-        for i in range(len(texts)):
-            vertices = polys[i]
-            # 바운딩 박스 좌표 추출 (x, y)
-            p1 = (int(vertices[0][0]), int(vertices[0][1]))  # 좌상단
-            p3 = (int(vertices[2][0]), int(vertices[2][1]))  # 우하단
-
-            result.append(RawOCR(
-                text=texts[i],
-                confidence=scores[i],
-                bbox=(p1[0], p1[1], p3[0], p3[1])
-            ))
-
+        if not len(texts) or not len(scores) or not len(polys):
+            return OCRBatch.empty()
 
-        return result
+        # 꼭짓점 배열에서 바운딩 박스(좌상단, 우하단) 좌표를 한 번에 추출
+        return OCRBatch.from_polys(texts, scores, polys)
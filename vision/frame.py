@@ -0,0 +1,117 @@
+import threading
+from typing import Callable, Optional, Tuple
+import cv2
+import numpy as np
+from vision.utils.image_proc import apply_clahe_color, apply_white_balance
+
+
+class FrameContext:
+    """
+    카메라 프레임 1장과 파생 이미지(축소, CLAHE, 화이트 밸런스, HSV, 그레이스케일)를 함께 보관
+    파생 이미지는 처음 요청될 때 계산해 저장하므로, 같은 프레임을 ColorRecognizer와
+    PlateNumberDetector에 함께 넘기면 같은 파라미터의 전처리는 프레임당 한 번만 수행됨
+
+    - 반환되는 이미지는 여러 소비자가 공유하므로 읽기 전용 (수정이 필요하면 복사해서 사용)
+    - 서로 다른 스레드에서 동시에 요청해도 같은 이미지는 한 번만 계산 (키별 잠금)
+    - size는 (width, height), None이면 원본 해상도
+    """
+
+    def __init__(self, frame: np.ndarray):
+        self.frame = frame
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+        # 재사용 통계 (computed: 실제 계산 횟수, reused: 저장된 결과 반환 횟수)
+        self.computed = 0
+        self.reused = 0
+
+    @property
+    def shape(self):
+        return self.frame.shape
+
+    def _memo(self, key, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        with self._lock:
+            if key in self._cache:
+                self.reused += 1
+                return self._cache[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # 다른 스레드가 먼저 계산했으면 그 결과 사용
+            with self._lock:
+                if key in self._cache:
+                    self.reused += 1
+                    return self._cache[key]
+
+            img = compute()
+            img.flags.writeable = False
+            with self._lock:
+                self._cache[key] = img
+                self.computed += 1
+            return img
+
+    def resized(self, size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """INTER_AREA로 축소한 프레임 (size가 None이거나 원본 크기면 원본 프레임)"""
+        h, w = self.frame.shape[:2]
+        if size is None or tuple(size) == (w, h):
+            return self.frame
+        return self._memo(
+            ('resized', tuple(size)),
+            lambda: cv2.resize(self.frame, tuple(size), interpolation=cv2.INTER_AREA)
+        )
+
+    def clahe(
+            self,
+            size: Optional[Tuple[int, int]] = None,
+            clip_limit: float = 3.0,
+            tile_size: Tuple[int, int] = (8, 8),
+    ) -> np.ndarray:
+        """명도 채널에 CLAHE를 적용한 BGR 이미지 (apply_clahe_color와 동일)"""
+        return self._memo(
+            ('clahe', self._size_key(size), float(clip_limit), tuple(tile_size)),
+            lambda: apply_clahe_color(self.resized(size), clip_limit, tile_size)
+        )
+
+    def white_balanced(
+            self,
+            p: float = 0.5,
+            sample_step: int = 1,
+            size: Optional[Tuple[int, int]] = None,
+            clahe: bool = True,
+    ) -> np.ndarray:
+        """(clahe=True면 CLAHE 적용 후) 화이트 밸런스를 적용한 BGR 이미지"""
+        return self._memo(
+            ('white_balanced', self._size_key(size), bool(clahe), float(p), int(sample_step)),
+            lambda: apply_white_balance(self._base(size, clahe), p, sample_step=sample_step)
+        )
+
+    def hsv(
+            self,
+            p: float = 0.5,
+            sample_step: int = 1,
+            size: Optional[Tuple[int, int]] = None,
+            clahe: bool = True,
+    ) -> np.ndarray:
+        """white_balanced(p, sample_step, size, clahe)의 HSV 변환 (ColorRecognizer 입력)"""
+        return self._memo(
+            ('hsv', self._size_key(size), bool(clahe), float(p), int(sample_step)),
+            lambda: cv2.cvtColor(self.white_balanced(p, sample_step, size, clahe), cv2.COLOR_BGR2HSV)
+        )
+
+    def gray(self, size: Optional[Tuple[int, int]] = None, clahe: bool = False) -> np.ndarray:
+        """그레이스케일 이미지 (clahe=True면 CLAHE 적용 이미지 기준, 번호판 후보 영역 검출용)"""
+        return self._memo(
+            ('gray', self._size_key(size), bool(clahe)),
+            lambda: cv2.cvtColor(self._base(size, clahe), cv2.COLOR_BGR2GRAY)
+        )
+
+    def _base(self, size, clahe):
+        return self.clahe(size) if clahe else self.resized(size)
+
+    def _size_key(self, size):
+        # 원본 크기를 명시한 요청과 None 요청이 같은 결과를 공유하도록 정규화
+        h, w = self.frame.shape[:2]
+        if size is None or tuple(size) == (w, h):
+            return None
+        return tuple(size)
@@ -0,0 +1,52 @@
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+from vision.utils.verifier import segment_buckets, segment_scores
+
+
+class PlateIndex:
+    """
+    다수의 타겟 번호판(예: 차량 화이트리스트)을 미리 인덱싱해 OCR 결과와 한 번에 비교
+    앞 번호(3자리) / 가운데 글자 / 뒷 번호(4자리) 구간별로 고유값만 모아 두고,
+    OCR 텍스트와 구간별 유사도 행렬을 rapidfuzz.process.cdist로 계산한 뒤
+    타겟별 구간 인덱스로 조합 (plate_similarity와 동일한 0.45/0.1/0.45 가중치)
+    """
+
+    def __init__(self, targets: Iterable[str]):
+        plates = []
+        seen = set()
+        for target in targets:
+            plate = target.replace(' ', '')
+            if len(plate) != 8:
+                raise ValueError(f"Invalid target plate: {target!r} (expected 8 characters)")
+            if plate not in seen:
+                seen.add(plate)
+                plates.append(plate)
+
+        self.targets: List[str] = plates
+        # 포함 여부 조회용 (정규화된 타겟 집합)
+        self._target_set = seen
+
+        # 구간별 고유값(버킷)과 타겟 -> 버킷 인덱스
+        self._buckets = segment_buckets(plates)
+
+    def __len__(self):
+        return len(self.targets)
+
+    def __contains__(self, plate: str):
+        return plate.replace(' ', '') in self._target_set
+
+    def scores(self, texts: List[str]) -> np.ndarray:
+        """
+        OCR 텍스트 목록과 전체 타겟 간의 유사도 행렬 (len(texts), len(targets)) 반환
+        8자가 아닌 텍스트는 plate_similarity와 같이 모든 타겟에 대해 0점
+        """
+        return segment_scores([text.replace(' ', '') for text in texts], self._buckets)
+
+    def best_matches(self, texts: List[str]) -> List[Tuple[Optional[str], float]]:
+        """OCR 텍스트별로 가장 유사한 타겟과 유사도 반환 (동점이면 먼저 등록된 타겟)"""
+        if not self.targets:
+            return [(None, 0.0) for _ in texts]
+
+        scores = self.scores(texts)
+        best = scores.argmax(axis=1)
+        return [(self.targets[j], float(scores[i, j])) for i, j in enumerate(best)]
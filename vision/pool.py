@@ -0,0 +1,239 @@
+import multiprocessing as mp
+import queue
+import threading
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+import numpy as np
+
+
+def _worker_main(worker_id, task_queue, result_queue, detector_kwargs):
+    """
+    워커 프로세스: PlateNumberDetector(엔진/모델)를 프로세스당 한 번만 로드하고
+    공유 메모리 슬롯에 담긴 프레임을 받아 탐지 결과를 반환
+    결과 메시지: ('init_failed', worker_id, None, 예외) / ('done', worker_id, task_id, (ok, 결과))
+    """
+    from vision.detector import PlateNumberDetector
+
+    try:
+        detector = PlateNumberDetector(**detector_kwargs)
+    except Exception as e:
+        result_queue.put(('init_failed', worker_id, None, e))
+        return
+
+    attached = {}
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            task_id, slot_name, shape, dtype, target = task
+            try:
+                shm = attached.get(slot_name)
+                if shm is None:
+                    shm = attached[slot_name] = shared_memory.SharedMemory(name=slot_name)
+                frame = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+                result = detector.detect(frame, target)
+                del frame
+                result_queue.put(('done', worker_id, task_id, (True, result)))
+            except Exception as e:
+                result_queue.put(('done', worker_id, task_id, (False, e)))
+    finally:
+        for shm in attached.values():
+            shm.close()
+
+
+class PlateDetectorPool:
+    """
+    프로세스 풀 기반 번호판 탐지 서비스
+    - 워커마다 PlateNumberDetector를 한 번만 생성 (PaddleOCR 추론을 여러 코어로 분산)
+    - 프레임은 pickle 대신 공유 메모리 슬롯으로 전달
+    - 슬롯 수(max_pending)만큼만 동시에 처리 대기 가능 (초과 시 submit이 대기 -> backpressure)
+    - 워커마다 작업 큐를 따로 두고 대기 작업이 가장 적은 워커에 배정
+      (워커가 죽으면 그 워커에 배정된 작업만 실패, 남은 워커로 계속 처리)
+    """
+
+    def __init__(
+            self,
+            n_workers: int = 2,
+            *,
+            max_pending: Optional[int] = None,      # 동시에 대기/처리 중일 수 있는 프레임 수 (기본: 워커 수 x 2)
+            max_frame_shape: Tuple[int, ...] = (1080, 1920, 3),     # 슬롯 크기 기준 최대 프레임 shape (uint8)
+            detector_kwargs: Optional[dict] = None,  # 워커에서 PlateNumberDetector 생성 시 사용할 인자
+            start_method: str = 'spawn',
+    ):
+        self.n_workers = n_workers
+        self.max_pending = max_pending or n_workers * 2
+        self.slot_bytes = int(np.prod(max_frame_shape))
+
+        ctx = mp.get_context(start_method)
+        self._task_queues = [ctx.Queue() for _ in range(n_workers)]
+        self._result_queue = ctx.Queue()
+
+        # 공유 메모리 슬롯
+        self._slots = [shared_memory.SharedMemory(create=True, size=self.slot_bytes) for _ in range(self.max_pending)]
+        self._free_slots = queue.Queue()
+        for i in range(self.max_pending):
+            self._free_slots.put(i)
+
+        self._futures = {}      # task_id -> (future, slot, 배정된 워커 번호)
+        self._loads = [0] * n_workers   # 워커별 대기/처리 중인 작업 수
+        self._dead = set()      # 초기화 실패 또는 비정상 종료한 워커 번호
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._closed = False
+        self._broken = None     # 모든 워커가 사용 불가능해진 원인 예외
+
+        self._workers = [
+            ctx.Process(
+                target=_worker_main,
+                args=(worker_id, self._task_queues[worker_id], self._result_queue, detector_kwargs or {}),
+                daemon=True
+            )
+            for worker_id in range(n_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    def _collect(self):
+        # 워커 결과를 받아 Future를 완료하고 슬롯 반환
+        # 슬롯은 해당 작업의 결과가 도착했거나 작업을 가진 워커가 죽었을 때만 반환 (워커가 읽는 중인 슬롯 재사용 방지)
+        while True:
+            try:
+                item = self._result_queue.get(timeout=0.5)
+            except queue.Empty:
+                self._check_workers()
+                continue
+            if item is None:
+                break
+
+            kind, worker_id, task_id, payload = item
+            if kind == 'done':
+                with self._lock:
+                    entry = self._futures.pop(task_id, None)
+                    if entry is not None:
+                        self._loads[entry[2]] -= 1
+                if entry is None:
+                    continue
+                future, slot, _ = entry
+                self._free_slots.put(slot)
+                ok, result = payload
+                if ok:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+            elif kind == 'init_failed':
+                self._worker_died(worker_id, payload)
+
+    def _check_workers(self):
+        # 결과 없이 종료된 워커(크래시 등) 처리
+        if self._closed:
+            return
+        for worker_id, worker in enumerate(self._workers):
+            if worker_id not in self._dead and not worker.is_alive():
+                self._worker_died(
+                    worker_id, RuntimeError(f"PlateDetectorPool worker {worker_id} exited (code {worker.exitcode})")
+                )
+
+    def _worker_died(self, worker_id, error):
+        """죽은 워커에 배정된 작업만 실패 처리, 살아있는 워커가 없으면 이후 submit도 실패"""
+        with self._lock:
+            self._dead.add(worker_id)
+            if len(self._dead) == len(self._workers):
+                self._broken = error
+            failed = [task_id for task_id, (_, _, owner) in self._futures.items() if owner == worker_id]
+            entries = [self._futures.pop(task_id) for task_id in failed]
+            self._loads[worker_id] = 0
+
+        # 죽은 워커에 배정된 슬롯은 더 이상 읽는 프로세스가 없으므로 반환
+        for future, slot, _ in entries:
+            future.set_exception(error)
+            self._free_slots.put(slot)
+
+    def submit(self, frame: np.ndarray, target='', timeout: Optional[float] = None) -> Future:
+        """
+        프레임 탐지 요청 후 Future 반환 (Future.result()는 detect와 같은 형식)
+        빈 슬롯이 없으면 timeout(초)까지 대기, 초과 시 queue.Full 발생
+        """
+        if self._closed:
+            raise RuntimeError("PlateDetectorPool is shut down")
+        if self._broken is not None:
+            raise RuntimeError("PlateDetectorPool has no running workers") from self._broken
+        if frame.nbytes > self.slot_bytes:
+            raise ValueError(f"Frame too large for pool slots: {frame.shape} ({frame.nbytes} > {self.slot_bytes} bytes)")
+
+        try:
+            slot = self._free_slots.get(timeout=timeout)
+        except queue.Empty:
+            raise queue.Full("No free frame slot (too many pending frames)") from None
+
+        shm = self._slots[slot]
+        np.copyto(np.ndarray(frame.shape, dtype=frame.dtype, buffer=shm.buf), frame)
+
+        future = Future()
+        with self._lock:
+            alive = [i for i in range(len(self._workers)) if i not in self._dead]
+            if not alive:
+                self._free_slots.put(slot)
+                raise RuntimeError("PlateDetectorPool has no running workers") from self._broken
+            worker_id = min(alive, key=self._loads.__getitem__)
+            task_id = self._next_id
+            self._next_id += 1
+            self._futures[task_id] = (future, slot, worker_id)
+            self._loads[worker_id] += 1
+            # 배정과 큐 입력을 같은 잠금 안에서 수행 (워커 사망 처리와 순서 보장)
+            self._task_queues[worker_id].put((task_id, shm.name, frame.shape, frame.dtype.str, target))
+
+        return future
+
+    def detect(self, frame: np.ndarray, target=''):
+        return self.submit(frame, target).result()
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._futures)
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None):
+        """
+        새 요청을 막고 워커 종료
+        wait=True면 이미 제출된 요청을 모두 처리한 뒤 종료
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if not wait:
+            for worker in self._workers:
+                worker.terminate()
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+
+        self._result_queue.put(None)
+        self._collector.join()
+
+        # 처리되지 못한 요청 정리
+        with self._lock:
+            pending = list(self._futures.values())
+            self._futures.clear()
+        for future, _, _ in pending:
+            future.cancel()
+
+        for shm in self._slots:
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
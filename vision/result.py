@@ -1,6 +1,7 @@
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from typing import Dict, List, Sequence, Tuple, Optional
 import numpy as np
+from vision.utils.bbox import bbox_iou
 
 @dataclass
 class RawOCR:
@@ -8,11 +9,108 @@ class RawOCR:
     confidence: float
     bbox: Tuple[int, int, int, int]  # (x1, y1, x2, y2)
 
+class OCRBatch:
+    """
+    이미지 1장의 OCR 결과를 열(column) 단위로 저장하는 컨테이너 (박스별 객체 생성 없이 병합/검증)
+    texts: 인식 문자열 리스트
+    confidences: 인식 신뢰도 (N,) float32
+    bboxes: (x1, y1, x2, y2) (N, 4) int32
+    RawOCR 리스트가 필요한 경우 to_raw()로 변환
+    """
+
+    __slots__ = ('texts', 'confidences', 'bboxes')
+
+    def __init__(self, texts: Sequence[str], confidences, bboxes):
+        self.texts = list(texts)
+        self.confidences = np.asarray(confidences, dtype=np.float32).reshape(-1)
+        self.bboxes = np.asarray(bboxes, dtype=np.int32).reshape(-1, 4)
+        if not (len(self.texts) == len(self.confidences) == len(self.bboxes)):
+            raise ValueError(
+                f"OCRBatch column lengths differ: texts={len(self.texts)}, "
+                f"confidences={len(self.confidences)}, bboxes={len(self.bboxes)}"
+            )
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __repr__(self):
+        return f"OCRBatch(n={len(self)}, texts={self.texts!r})"
+
+    @classmethod
+    def empty(cls) -> 'OCRBatch':
+        return cls([], np.empty(0, dtype=np.float32), np.empty((0, 4), dtype=np.int32))
+
+    @classmethod
+    def from_raw(cls, results: Sequence[RawOCR]) -> 'OCRBatch':
+        if not results:
+            return cls.empty()
+        return cls([r.text for r in results], [r.confidence for r in results], [r.bbox for r in results])
+
+    @classmethod
+    def from_polys(cls, texts: Sequence[str], scores, polys) -> 'OCRBatch':
+        """
+        꼭짓점 4개 polygon 배열 (N, 4, 2)로부터 생성 (좌상단 = 0번, 우하단 = 2번 꼭짓점)
+        """
+        if len(texts) == 0:
+            return cls.empty()
+        polys = np.asarray(polys).reshape(len(texts), 4, 2)
+        return cls(texts, scores, np.concatenate((polys[:, 0], polys[:, 2]), axis=1))
+
+    @classmethod
+    def concat(cls, batches: Sequence['OCRBatch']) -> 'OCRBatch':
+        if not batches:
+            return cls.empty()
+        return cls(
+            [text for batch in batches for text in batch.texts],
+            np.concatenate([batch.confidences for batch in batches]),
+            np.concatenate([batch.bboxes for batch in batches])
+        )
+
+    def take(self, indices) -> 'OCRBatch':
+        """indices 순서대로 선택한 새 배치"""
+        indices = np.asarray(indices, dtype=np.intp)
+        return OCRBatch([self.texts[i] for i in indices], self.confidences[indices], self.bboxes[indices])
+
+    def offset(self, dx: int, dy: int) -> 'OCRBatch':
+        """bbox를 (dx, dy)만큼 이동한 새 배치 (잘라낸 영역 좌표 -> 원본 좌표)"""
+        return OCRBatch(self.texts, self.confidences, self.bboxes + np.array([dx, dy, dx, dy], dtype=np.int32))
+
+    def deduplicate(self, iou_thresh: float = 0.5) -> 'OCRBatch':
+        """
+        같은 문자열(공백 무시)이면서 bbox IoU가 iou_thresh 이상인 라인을 하나로 줄인 새 배치
+        (겹치는 후보 영역에서 같은 라인이 여러 번 인식된 경우, 신뢰도가 가장 높은 라인만 남기고 기존 순서 유지)
+        """
+        keep = []
+        for i in np.argsort(-self.confidences, kind='stable'):
+            text = self.texts[i].replace(' ', '')
+            if not any(
+                    self.texts[j].replace(' ', '') == text and bbox_iou(self.bboxes[i], self.bboxes[j]) >= iou_thresh
+                    for j in keep
+            ):
+                keep.append(i)
+        if len(keep) == len(self):
+            return self
+        return self.take(sorted(keep))
+
+    def copy(self) -> 'OCRBatch':
+        return OCRBatch(self.texts, self.confidences.copy(), self.bboxes.copy())
+
+    def to_raw(self) -> List[RawOCR]:
+        """호환용 RawOCR 리스트로 변환"""
+        return [
+            RawOCR(text=text, confidence=float(confidence), bbox=tuple(bbox))
+            for text, confidence, bbox in zip(self.texts, self.confidences.tolist(), self.bboxes.tolist())
+        ]
+
+
 @dataclass
 class PlateResult:
     text: str
     similarity: float
     bbox: Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+    target: Optional[str] = None  # PlateIndex로 탐지한 경우 매칭된 타겟 번호판
+    confidence: Optional[float] = None  # OCR 인식 신뢰도
+    timings: Optional[Dict[str, float]] = None  # 계측 활성화 시 단계별 소요 시간 (ms)
 
 
 @dataclass
@@ -20,3 +118,12 @@ class ColorRecognitionResult:
     color: str
     area_ratio: float
     mask: Optional[np.ndarray] = None
+    timings: Optional[Dict[str, float]] = None  # 계측 활성화 시 단계별 소요 시간 (ms)
+
+
+@dataclass
+class ColorBlob:
+    color: str
+    area_ratio: float  # 분석 해상도 전체 대비 면적 비율
+    centroid: Tuple[float, float]  # (x, y), 원본 프레임 좌표
+    bbox: Tuple[int, int, int, int]  # (x1, y1, x2, y2), 원본 프레임 좌표
@@ -0,0 +1,503 @@
+"""
+녹화 영상 / 이미지 폴더 일괄 인식 CLI (색상 범위, 번호판 유사도 임계치 튜닝용 오프라인 재처리)
+
+- 입력: 영상 파일 또는 이미지 폴더 (여러 개 지정 시 순서대로 처리)
+- 디코딩은 백그라운드 스레드(이미지 폴더는 --decode-workers개 병렬), 인식은 --workers개 스레드에서 수행
+- 각 단계 사이 대기열과 처리 중인 프레임 수가 제한되어 입력 길이와 관계없이 메모리 사용량이 일정
+- 결과는 입력 순서대로 프레임당 한 행씩 JSONL 파일 또는 Parquet 폴더(pyarrow 필요)에 기록
+- --resume: 기존 결과의 입력별 마지막 프레임 다음부터 이어서 처리 (지정하지 않으면 기존 결과를 지우고 새로 기록)
+
+실행:
+  python -m vision.run data/logs/day1.mp4 data/logs/day2.mp4 --tasks color -o results.jsonl
+  python -m vision.run data/frames/ --tasks color plate --target 630모8800 --model clova -o results.jsonl --resume
+  python -m vision.run data/logs/day1.mp4 --tasks color --every 5 -o results.parquet
+"""
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import cv2
+import numpy as np
+from vision.color import ColorRecognizer
+from vision.frame import FrameContext
+from vision.plate_index import PlateIndex
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.webp')
+
+# 결과 행의 열 (JSONL 키 / Parquet 열 순서)
+COLUMNS = (
+    'source', 'frame', 'timestamp',
+    'color', 'color_area_ratio',
+    'plate_text', 'plate_similarity', 'plate_confidence', 'plate_target', 'plate_bbox',
+)
+
+
+# 파이프라인 단계 ###############################################################
+
+def bounded_map(executor, fn, items: Iterable, window: int) -> Iterator:
+    """
+    executor.map과 같이 입력 순서대로 fn(item) 결과를 반환하되,
+    동시에 제출된 작업을 window개로 제한 (입력을 미리 전부 읽지 않음)
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def prefetch(items: Iterable, size: int) -> Iterator:
+    """items를 백그라운드 스레드에서 최대 size개까지 미리 읽어 둠 (디코딩과 인식을 겹쳐 실행)"""
+    buffer = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        # 소비 측이 멈추면(stop) 대기 중인 put도 포기
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+            put(done)
+        except BaseException as e:
+            put(e)
+        finally:
+            # 생성기 입력이면 정리 코드 실행 (예: VideoCapture 해제)
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name='vision-run-decode', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # 소비 측이 중간에 멈춘 경우 생산 스레드도 종료
+        stop.set()
+        thread.join()
+
+
+# 입력 ##########################################################################
+
+def list_images(directory: str) -> List[str]:
+    names = sorted(name for name in os.listdir(directory) if name.lower().endswith(IMAGE_EXTENSIONS))
+    return [os.path.join(directory, name) for name in names]
+
+
+def iter_video(path: str, start: int = 0, every: int = 1) -> Iterator[Tuple[int, Optional[float], np.ndarray]]:
+    """영상의 start번째 프레임부터 every 간격으로 (프레임 번호, 시각(초), 프레임) 반환"""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise ValueError(f"Cannot open video: {path}")
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        index = 0
+        if start > 0:
+            # 탐색이 정확하지 않은 코덱은 grab으로 건너뜀
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+            index = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+            if index != start:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                index = 0
+                while index < start and cap.grab():
+                    index += 1
+
+        while True:
+            if (index - start) % every:
+                # 처리하지 않을 프레임은 디코딩 결과를 가져오지 않음
+                if not cap.grab():
+                    return
+            else:
+                ret, frame = cap.read()
+                if not ret:
+                    return
+                yield index, (index / fps if fps > 0 else None), frame
+            index += 1
+    finally:
+        cap.release()
+
+
+def iter_image_dir(
+        path: str,
+        start: int = 0,
+        every: int = 1,
+        executor: Optional[ThreadPoolExecutor] = None,
+        window: int = 8,
+) -> Iterator[Tuple[int, Optional[float], np.ndarray]]:
+    """이름순 정렬된 이미지 중 start번째부터 every 간격으로 (번호, None, 프레임) 반환 (executor가 있으면 병렬 디코딩)"""
+    files = list_images(path)
+    indices = range(start, len(files), every)
+
+    def load(index):
+        frame = cv2.imread(files[index])
+        if frame is None:
+            print(f"[vision.run] skip unreadable image: {files[index]}", file=sys.stderr)
+        return index, None, frame
+
+    loaded = bounded_map(executor, load, indices, window) if executor is not None else map(load, indices)
+    for item in loaded:
+        if item[2] is not None:
+            yield item
+
+
+# 인식 ##########################################################################
+
+class FrameProcessor:
+    """
+    프레임 1장 -> 결과 행(dict) 변환
+    인식 객체는 상태(workspace, 캐시, 엔진 세션)를 가지므로 스레드마다 따로 생성
+    색상/번호판을 함께 실행하면 FrameContext로 전처리 결과 공유
+    """
+
+    def __init__(self, tasks, color_kwargs=None, detector_kwargs=None, target=''):
+        self.tasks = set(tasks)
+        self.color_kwargs = color_kwargs or {}
+        self.detector_kwargs = detector_kwargs or {}
+        self.target = target
+        self._local = threading.local()
+
+    def _recognizers(self):
+        local = self._local
+        if not hasattr(local, 'color'):
+            local.color = ColorRecognizer(**self.color_kwargs) if 'color' in self.tasks else None
+            local.detector = None
+            if 'plate' in self.tasks:
+                from vision.detector import PlateNumberDetector
+                local.detector = PlateNumberDetector(**self.detector_kwargs)
+        return local.color, local.detector
+
+    def __call__(self, source: str, index: int, timestamp: Optional[float], frame: np.ndarray) -> dict:
+        color_recognizer, detector = self._recognizers()
+        image = FrameContext(frame) if color_recognizer is not None and detector is not None else frame
+
+        row = dict.fromkeys(COLUMNS)
+        row.update(source=source, frame=index, timestamp=timestamp)
+
+        if color_recognizer is not None:
+            color = color_recognizer.recognize(image)
+            if color is not None:
+                row.update(color=color.color, color_area_ratio=float(color.area_ratio))
+
+        if detector is not None:
+            plate = detector.detect(image, self.target)
+            if isinstance(plate, list):
+                # PlateIndex 타겟: 유사도가 가장 높은 결과 1개만 기록
+                plate = max(plate, key=lambda p: p.similarity, default=None)
+            if plate is not None:
+                row.update(
+                    plate_text=plate.text,
+                    plate_similarity=float(plate.similarity),
+                    plate_confidence=None if plate.confidence is None else float(plate.confidence),
+                    plate_target=plate.target,
+                    plate_bbox=[int(v) for v in plate.bbox],
+                )
+        return row
+
+
+# 출력 ##########################################################################
+
+class JSONLWriter:
+    """프레임당 한 줄씩 기록 (flush_every행마다 디스크에 반영, append=False면 기존 파일을 비우고 기록)"""
+
+    def __init__(self, path: str, flush_every: int = 100, append: bool = False):
+        self.path = path
+        self.flush_every = flush_every
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+        self._pending = 0
+
+    @staticmethod
+    def progress(path: str) -> Dict[str, int]:
+        """기존 결과의 입력별 마지막 프레임 번호 (중간에 끊긴 마지막 줄은 파일에서 잘라냄)"""
+        last = {}
+        if not os.path.exists(path):
+            return last
+
+        valid_size = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b'\n'):
+                    break
+                valid_size += len(line)
+                last[row['source']] = max(last.get(row['source'], -1), row['frame'])
+
+        if valid_size != os.path.getsize(path):
+            with open(path, 'r+b') as f:
+                f.truncate(valid_size)
+        return last
+
+    def write(self, row: dict):
+        self._file.write(json.dumps(row, ensure_ascii=False) + '\n')
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+        self._pending = 0
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class ParquetWriter:
+    """
+    Parquet 폴더에 실행마다 part-XXXXX.parquet 파일 1개를 만들고 flush_every행마다 row group으로 기록
+    append=False면 기존 part 파일을 지우고 기록 (pyarrow가 설치되어 있어야 함)
+    """
+
+    def __init__(self, path: str, flush_every: int = 1000, append: bool = False):
+        pa, pq = self._import()
+        self.path = path
+        self.flush_every = flush_every
+        self._pa = pa
+        self._schema = pa.schema([
+            ('source', pa.string()),
+            ('frame', pa.int64()),
+            ('timestamp', pa.float64()),
+            ('color', pa.string()),
+            ('color_area_ratio', pa.float64()),
+            ('plate_text', pa.string()),
+            ('plate_similarity', pa.float64()),
+            ('plate_confidence', pa.float64()),
+            ('plate_target', pa.string()),
+            ('plate_bbox', pa.list_(pa.int32())),
+        ])
+
+        os.makedirs(path, exist_ok=True)
+        parts = self._parts(path)
+        if not append:
+            for old in parts:
+                os.remove(old)
+            parts = []
+        # 중간 part가 삭제되어도 기존 파일을 덮어쓰지 않도록 마지막 번호 다음 사용
+        part = int(os.path.basename(parts[-1])[5:-8]) + 1 if parts else 0
+        self._writer = pq.ParquetWriter(os.path.join(path, f"part-{part:05d}.parquet"), self._schema)
+        self._rows = []
+
+    @staticmethod
+    def _import():
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow), or use a .jsonl output path")
+        return pa, pq
+
+    @staticmethod
+    def _parts(path):
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            os.path.join(path, name) for name in os.listdir(path)
+            if name.startswith('part-') and name.endswith('.parquet')
+        )
+
+    @staticmethod
+    def _has_footer(part):
+        # Parquet 파일은 footer 끝에 매직 바이트 'PAR1'이 기록됨 (중단된 파일에는 없음)
+        size = os.path.getsize(part)
+        if size < 12:
+            return False
+        with open(part, 'rb') as f:
+            f.seek(size - 4)
+            return f.read(4) == b'PAR1'
+
+    @classmethod
+    def progress(cls, path: str) -> Dict[str, int]:
+        """
+        기존 part 파일들의 입력별 마지막 프레임 번호 (source, frame 열만 읽음)
+        중단되어 footer가 기록되지 않은 파일만 삭제, 그 외 읽기 오류는 경고 후 건너뜀
+        """
+        _, pq = cls._import()
+        last = {}
+        for part in cls._parts(path):
+            if not cls._has_footer(part):
+                print(f"[vision.run] remove incomplete part: {part}", file=sys.stderr)
+                os.remove(part)
+                continue
+            try:
+                table = pq.read_table(part, columns=['source', 'frame'])
+            except Exception as e:
+                print(f"[vision.run] skip unreadable part: {part} ({e})", file=sys.stderr)
+                continue
+            for source, frame in zip(table.column('source').to_pylist(), table.column('frame').to_pylist()):
+                last[source] = max(last.get(source, -1), frame)
+        return last
+
+    def write(self, row: dict):
+        self._rows.append(row)
+        if len(self._rows) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+
+def writer_class(path: str):
+    return ParquetWriter if path.endswith('.parquet') else JSONLWriter
+
+
+# 실행 ##########################################################################
+
+def run(
+        inputs: List[str],
+        output: str,
+        processor: FrameProcessor,
+        *,
+        workers: int = 2,
+        decode_workers: int = 2,
+        queue_size: int = 16,
+        every: int = 1,
+        max_frames: Optional[int] = None,
+        resume: bool = False,
+        flush_every: Optional[int] = None,
+        log_every: float = 10.0,
+) -> Dict[str, int]:
+    """
+    inputs를 순서대로 처리해 output에 기록, 반환: 입력별 처리 프레임 수
+    처리 중인 프레임은 (디코딩 대기열 queue_size) + (인식 중 workers * 2)개 이하
+    """
+    cls = writer_class(output)
+    done = cls.progress(output) if resume else {}
+    writer = cls(output, append=resume, **({'flush_every': flush_every} if flush_every else {}))
+
+    counts = {}
+    started = last_log = time.perf_counter()
+    total = 0
+    try:
+        with ThreadPoolExecutor(decode_workers, thread_name_prefix='vision-run-imread') as decode_pool, \
+                ThreadPoolExecutor(workers, thread_name_prefix='vision-run-recognize') as recognize_pool:
+            for path in inputs:
+                source = os.path.normpath(path)
+                start = done.get(source, -1) + 1
+                if start > 0 and every > 1:
+                    # every 간격을 처음 실행과 같게 유지
+                    start = -(-start // every) * every
+
+                if os.path.isdir(path):
+                    frames = iter_image_dir(path, start, every, decode_pool, window=max(2, decode_workers * 2))
+                else:
+                    frames = iter_video(path, start, every)
+
+                counts[source] = 0
+                items = prefetch(frames, queue_size)
+                rows = bounded_map(
+                    recognize_pool, lambda item: processor(source, *item), items, window=max(2, workers * 2)
+                )
+                try:
+                    for row in rows:
+                        writer.write(row)
+                        counts[source] += 1
+                        total += 1
+
+                        now = time.perf_counter()
+                        if log_every and now - last_log >= log_every:
+                            print(f"[vision.run] {source} frame {row['frame']} | {total} frames, "
+                                  f"{total / (now - started):.1f} fps", file=sys.stderr)
+                            last_log = now
+                        if max_frames is not None and total >= max_frames:
+                            return counts
+                finally:
+                    rows.close()
+                    items.close()
+    finally:
+        writer.close()
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m vision.run', description=__doc__.split('\n\n')[0])
+    parser.add_argument('inputs', nargs='+', help='영상 파일 또는 이미지 폴더')
+    parser.add_argument('-o', '--output', required=True, help='결과 경로 (.jsonl 파일 또는 .parquet 폴더)')
+    parser.add_argument('--tasks', nargs='+', choices=('color', 'plate'), default=['color'])
+    parser.add_argument('--resume', action='store_true', help='기존 결과의 마지막 프레임 다음부터 처리 (생략 시 기존 결과를 덮어씀)')
+    parser.add_argument('--every', type=int, default=1, help='N프레임마다 1장 처리')
+    parser.add_argument('--max-frames', type=int, help='이번 실행에서 처리할 최대 프레임 수')
+    parser.add_argument('--workers', type=int, default=2, help='인식 스레드 수 (스레드마다 인식 객체 생성)')
+    parser.add_argument('--decode-workers', type=int, default=2, help='이미지 폴더 디코딩 스레드 수')
+    parser.add_argument('--queue-size', type=int, default=16, help='디코딩된 프레임 대기열 크기')
+    parser.add_argument('--flush-every', type=int, help='디스크 반영 주기 (행 수)')
+
+    color = parser.add_argument_group('color')
+    color.add_argument('--min-area-ratio', type=float, help='ColorRecognizer min_detection_area_ratio')
+    color.add_argument('--analysis-width', type=int, help='ColorRecognizer analysis_width')
+
+    plate = parser.add_argument_group('plate')
+    plate.add_argument('--target', nargs='+', default=[''], help='타겟 번호판 (2개 이상이면 PlateIndex로 매칭)')
+    plate.add_argument('--model', choices=('paddle', 'clova'), default='paddle')
+    plate.add_argument('--plate-thresh', type=float, default=80, help='plate_similarity_thresh')
+    plate.add_argument('--proposals', action='store_true', help='번호판 후보 영역만 OCR')
+    plate.add_argument('--debug', action='store_true', help='debug_mode (사전 OCR 결과 사용)')
+    args = parser.parse_args(argv)
+
+    if args.every < 1:
+        parser.error('--every must be >= 1')
+
+    color_kwargs = {}
+    if args.min_area_ratio is not None:
+        color_kwargs['min_detection_area_ratio'] = args.min_area_ratio
+    if args.analysis_width is not None:
+        color_kwargs['analysis_width'] = args.analysis_width
+
+    detector_kwargs = {
+        'model': args.model,
+        'plate_similarity_thresh': args.plate_thresh,
+        'use_proposals': args.proposals,
+    }
+    if args.debug:
+        detector_kwargs['debug_mode'] = True
+    target = PlateIndex(args.target) if len(args.target) > 1 else args.target[0]
+
+    processor = FrameProcessor(args.tasks, color_kwargs, detector_kwargs, target)
+    started = time.perf_counter()
+    counts = run(
+        args.inputs, args.output, processor,
+        workers=args.workers, decode_workers=args.decode_workers, queue_size=args.queue_size,
+        every=args.every, max_frames=args.max_frames, resume=args.resume, flush_every=args.flush_every,
+    )
+
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    for source, count in counts.items():
+        print(f"{source}: {count} frames")
+    print(f"total {total} frames in {elapsed:.1f}s ({total / elapsed if elapsed > 0 else 0:.1f} fps) -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
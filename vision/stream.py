@@ -0,0 +1,308 @@
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Tuple, Union
+import cv2
+import numpy as np
+from vision.color import ColorRecognizer
+
+
+@dataclass
+class StreamResult:
+    seq: int                # 입력 프레임 순번 (캡처 순서, 0부터)
+    captured_at: float      # 프레임 캡처 시각 (clock 기준, 초)
+    processed_at: float     # 처리 완료 시각 (clock 기준, 초)
+    result: Any             # 처리 함수 반환값 (예: ColorRecognitionResult 또는 None)
+
+    @property
+    def latency(self) -> float:
+        """캡처부터 결과 생성까지 걸린 시간 (초)"""
+        return self.processed_at - self.captured_at
+
+
+class LatestFrameSlot:
+    """
+    최신 프레임 1장만 보관하는 슬롯
+    처리되지 않은 프레임이 있어도 새 프레임으로 덮어쓰고(latest-frame-wins),
+    Condition으로 대기 중인 소비자를 즉시 깨움 (폴링/sleep 없음)
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._item = None       # (seq, captured_at, frame)
+        self._closed = False
+
+    def put(self, seq: int, captured_at: float, frame: np.ndarray) -> bool:
+        """프레임 저장, 아직 처리되지 않은 프레임을 덮어썼으면 True (= 드롭)"""
+        with self._cond:
+            dropped = self._item is not None
+            self._item = (seq, captured_at, frame)
+            self._cond.notify()
+            return dropped
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[int, float, np.ndarray]]:
+        """새 프레임이 들어올 때까지 대기 후 꺼내 반환 (닫혔거나 timeout이면 None)"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._item is not None or self._closed, timeout):
+                return None
+            item, self._item = self._item, None
+            return item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class _RateCounter:
+    # 최근 window개 이벤트 시각으로 초당 처리량 계산
+    def __init__(self, window: int = 30):
+        self._times = deque(maxlen=window)
+        self.count = 0
+
+    def tick(self, now):
+        self._times.append(now)
+        self.count += 1
+
+    @property
+    def fps(self) -> float:
+        if len(self._times) < 2 or self._times[-1] == self._times[0]:
+            return 0.0
+        return (len(self._times) - 1) / (self._times[-1] - self._times[0])
+
+
+class StreamProcessor:
+    """
+    캡처 스레드 + 처리 스레드로 구성된 실시간 프레임 처리기
+    - 캡처 스레드는 source(cv2.VideoCapture 또는 프레임 이터레이터)에서 읽은 프레임을 슬롯에 덮어씀
+      (source가 None이면 submit()으로 외부에서 프레임 전달)
+    - 처리 스레드는 항상 가장 최근 프레임만 process_fn으로 처리 -> 밀린 프레임을 처리하느라 늦어지지 않음
+    - 결과에는 프레임 순번과 캡처/처리 시각이 포함되어 end-to-end 지연 측정 가능
+    - 처리/캡처 스레드에서 예외가 발생하면 stderr에 출력하고 스트림을 멈춘 뒤,
+      이후 latest / wait_frame / wait_result / with 블록 종료 시 RuntimeError로 다시 발생
+    """
+
+    def __init__(
+            self,
+            process_fn: Callable[[np.ndarray], Any],
+            source: Union[cv2.VideoCapture, Iterable[np.ndarray], None] = None,
+            *,
+            on_result: Optional[Callable[[StreamResult], None]] = None,    # 결과마다 처리 스레드에서 호출
+            clock=time.monotonic,
+            name: str = 'stream',
+    ):
+        self.process_fn = process_fn
+        self.source = source
+        self.on_result = on_result
+        self.clock = clock
+        self.name = name
+
+        self._slot = LatestFrameSlot()
+        self._cond = threading.Condition()      # 최신 프레임/결과 갱신 알림
+        self._stop = threading.Event()
+        self._capture_done = False      # source 입력 종료 여부
+        self._process_done = False      # 처리 스레드 종료 여부
+        self._threads = []
+
+        self._next_seq = 0
+        self._latest_frame = None   # (seq, captured_at, frame)
+        self._latest = None         # StreamResult
+        self.error = None           # 처리/캡처 스레드에서 발생한 예외
+
+        # 통계
+        self._captured = _RateCounter()
+        self._processed = _RateCounter()
+        self.dropped = 0            # 처리되기 전에 새 프레임으로 덮어쓴 프레임 수
+
+    # 실행 제어 ##################################################################
+
+    def start(self) -> 'StreamProcessor':
+        self._threads = [threading.Thread(target=self._process_loop, name=f'{self.name}-process', daemon=True)]
+        if self.source is not None:
+            self._threads.append(threading.Thread(target=self._capture_loop, name=f'{self.name}-capture', daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        self._slot.close()
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        # with 블록 자체의 예외를 가리지 않도록 블록이 정상 종료된 경우에만 발생
+        if exc_type is None:
+            self._raise_error()
+
+    def _fail(self, stage: str, error: Exception):
+        # 스레드 예외를 기록/출력하고 대기 중인 호출을 깨움
+        print(f"[vision.stream] {self.name}: {stage} failed: {error!r}", file=sys.stderr)
+        self._stop.set()
+        self._slot.close()
+        with self._cond:
+            if self.error is None:
+                self.error = error
+            self._cond.notify_all()
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise RuntimeError(f"StreamProcessor '{self.name}' stopped: {self.error!r}") from self.error
+
+    # 입력 ######################################################################
+
+    def submit(self, frame: np.ndarray, captured_at: Optional[float] = None) -> int:
+        """프레임 1장 입력 (처리 중이면 대기 중인 이전 프레임을 대체), 프레임 순번 반환"""
+        now = self.clock() if captured_at is None else captured_at
+        with self._cond:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._latest_frame = (seq, now, frame)
+            self._captured.tick(now)
+            if self._slot.put(seq, now, frame):
+                self.dropped += 1
+            self._cond.notify_all()
+        return seq
+
+    def _capture_loop(self):
+        if hasattr(self.source, 'read'):
+            def frames():
+                while True:
+                    ret, frame = self.source.read()
+                    if not ret:
+                        return
+                    yield frame
+            source = frames()
+        else:
+            source = iter(self.source)
+
+        try:
+            for frame in source:
+                if self._stop.is_set():
+                    break
+                self.submit(frame)
+        except Exception as e:
+            self._fail('capture', e)
+        finally:
+            # 입력이 끝나면 남은 프레임까지 처리한 뒤 처리 스레드 종료
+            self._slot.close()
+            with self._cond:
+                self._capture_done = True
+                self._cond.notify_all()
+
+    # 처리 ######################################################################
+
+    def _process_loop(self):
+        while not self._stop.is_set():
+            item = self._slot.get()
+            if item is None:
+                break
+
+            seq, captured_at, frame = item
+            try:
+                result = self.process_fn(frame)
+
+                now = self.clock()
+                stream_result = StreamResult(seq=seq, captured_at=captured_at, processed_at=now, result=result)
+                with self._cond:
+                    self._latest = stream_result
+                    self._processed.tick(now)
+                    self._cond.notify_all()
+
+                if self.on_result is not None:
+                    self.on_result(stream_result)
+            except Exception as e:
+                self._fail('process', e)
+                break
+
+        with self._cond:
+            self._process_done = True
+            self._cond.notify_all()
+
+    # 출력 ######################################################################
+
+    @property
+    def latest(self) -> Optional[StreamResult]:
+        """가장 최근 처리 결과 (아직 없으면 None, 스레드에서 예외가 발생했으면 RuntimeError)"""
+        self._raise_error()
+        with self._cond:
+            return self._latest
+
+    def latest_frame(self) -> Optional[Tuple[int, float, np.ndarray]]:
+        """가장 최근 입력 프레임 (seq, captured_at, frame) (화면 표시용)"""
+        with self._cond:
+            return self._latest_frame
+
+    def wait_frame(self, after_seq: int = -1, timeout: Optional[float] = None):
+        """순번이 after_seq보다 큰 입력 프레임이 들어올 때까지 대기 (종료/timeout 시 None)"""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: (self._latest_frame is not None and self._latest_frame[0] > after_seq)
+                or self._stop.is_set() or self._capture_done,
+                timeout
+            )
+            item = self._latest_frame
+        self._raise_error()
+        return item if item is not None and item[0] > after_seq else None
+
+    def wait_result(self, after_seq: int = -1, timeout: Optional[float] = None) -> Optional[StreamResult]:
+        """순번이 after_seq보다 큰 프레임의 결과가 나올 때까지 대기 (종료/timeout 시 None)"""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: (self._latest is not None and self._latest.seq > after_seq)
+                or self._stop.is_set() or self._process_done,
+                timeout
+            )
+            result = self._latest
+        self._raise_error()
+        return result if result is not None and result.seq > after_seq else None
+
+    def stats(self):
+        with self._cond:
+            latest = self._latest
+        return {
+            'captured': self._captured.count,
+            'processed': self._processed.count,
+            'dropped': self.dropped,
+            'capture_fps': self._captured.fps,
+            'process_fps': self._processed.fps,
+            'last_latency_ms': latest.latency * 1000 if latest else None,
+            'staleness_frames': self._next_seq - 1 - latest.seq if latest else None,
+        }
+
+
+class ColorRecognitionStream(StreamProcessor):
+    """
+    ColorRecognizer 실시간 처리기
+    (결과의 result는 ColorRecognizer.recognize 반환값: ColorRecognitionResult 또는 None)
+    """
+
+    def __init__(
+            self,
+            recognizer: ColorRecognizer,
+            source: Union[cv2.VideoCapture, Iterable[np.ndarray], None] = None,
+            *,
+            recognize_kwargs: Optional[dict] = None,    # recognize에 전달할 인자 (예: return_mask=True)
+            **kwargs,
+    ):
+        self.recognizer = recognizer
+        recognize_kwargs = recognize_kwargs or {}
+        kwargs.setdefault('name', 'color')
+        super().__init__(
+            lambda frame: recognizer.recognize(frame, **recognize_kwargs),
+            source,
+            **kwargs
+        )
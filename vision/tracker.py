@@ -0,0 +1,171 @@
+import time
+from typing import Iterable, Iterator, Optional, Tuple, Union
+import cv2
+import numpy as np
+from vision.detector import PlateNumberDetector
+from vision.plate_index import PlateIndex
+from vision.result import PlateResult
+from vision.voting import PlateVoter
+
+
+class PlateTracker:
+    """
+    연속 프레임용 번호판 탐지기
+    프레임 차이(움직임) 점수와 초당 OCR 호출 예산으로 OCR 실행 여부를 결정하고,
+    마지막으로 확인된 탐지 결과는 무효화될 때까지 이후 프레임에도 유지
+    -> OCR 비용이 프레임 레이트가 아닌 장면 변화량에 비례
+    """
+
+    def __init__(
+            self,
+            detector: PlateNumberDetector,
+            target: Union[str, PlateIndex] = '',
+            *,
+            motion_thresh: float = 4.0,     # OCR을 다시 실행할 평균 밝기 차이 (0~255, 마지막 OCR 프레임 기준)
+            max_ocr_per_sec: float = 2.0,   # 초당 최대 OCR 호출 수 (토큰 버킷)
+            refresh_interval: float = 5.0,  # 움직임이 없어도 OCR을 다시 실행할 주기 (초, None이면 안 함)
+            miss_tolerance: int = 2,        # 연속으로 이 횟수만큼 탐지에 실패하면 유지 중인 결과 무효화
+            motion_width: int = 160,        # 움직임 점수 계산용 축소 너비
+            voter: Optional[PlateVoter] = None,     # 다중 프레임 투표 (None이면 프레임 단독 판정)
+            clock=time.monotonic,
+    ):
+        self.detector = detector
+        self.target = target
+
+        self.motion_thresh = motion_thresh
+        self.max_ocr_per_sec = max_ocr_per_sec
+        self.refresh_interval = refresh_interval
+        self.miss_tolerance = miss_tolerance
+        self.motion_width = motion_width
+        self.voter = voter
+        self.clock = clock
+
+        self.reset()
+
+    def reset(self):
+        """추적 상태 및 통계 초기화"""
+        self.result = None          # 유지 중인 탐지 결과
+        self.ocr_invoked = False    # 마지막 update에서 OCR을 실행했는지
+        self.last_motion = 0.0      # 마지막 update의 움직임 점수
+
+        self._reference = None      # 마지막 OCR 시점의 축소 그레이 프레임
+        self._last_ocr_time = None
+        self._misses = 0
+        self._tokens = max(1.0, self.max_ocr_per_sec)
+        self._token_time = None
+
+        # 통계
+        self.frames = 0
+        self.ocr_calls = 0
+        self.skipped_static = 0     # 움직임이 없어 생략한 프레임 수
+        self.skipped_budget = 0     # 예산 초과로 생략한 프레임 수
+
+        if self.voter is not None:
+            self.voter.reset()
+
+    def _motion_frame(self, frame):
+        h, w = frame.shape[:2]
+        scale = min(1.0, self.motion_width / w)
+        small = cv2.resize(frame, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    def _take_token(self, now):
+        # 토큰 버킷: 초당 max_ocr_per_sec개 충전, 최대 max(1, max_ocr_per_sec)개 보유
+        capacity = max(1.0, self.max_ocr_per_sec)
+        if self._token_time is not None:
+            self._tokens = min(capacity, self._tokens + (now - self._token_time) * self.max_ocr_per_sec)
+        self._token_time = now
+
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def update(self, frame: np.ndarray, timestamp: Optional[float] = None):
+        """
+        프레임 1장 처리 후 현재 유지 중인 탐지 결과 반환
+        timestamp: 프레임 시각 (초, None이면 clock() 사용)
+        """
+        now = self.clock() if timestamp is None else timestamp
+        self.frames += 1
+        self.ocr_invoked = False
+
+        small = self._motion_frame(frame)
+        if self._reference is None or self._reference.shape != small.shape:
+            need_ocr = True
+            self.last_motion = float('inf')
+        else:
+            self.last_motion = float(cv2.absdiff(small, self._reference).mean())
+            need_ocr = self.last_motion >= self.motion_thresh
+            if not need_ocr and self.voter is not None:
+                # 투표 중인 번호판이 있으면 확정될 때까지 계속 OCR (예산 범위 내, 트랙별 max_pending_reads회까지)
+                need_ocr = self.voter.pending
+            if not need_ocr and self.refresh_interval is not None:
+                need_ocr = now - self._last_ocr_time >= self.refresh_interval
+
+        if not need_ocr:
+            self.skipped_static += 1
+            return self.result
+        if not self._take_token(now):
+            # 기준 프레임을 갱신하지 않으므로 움직임은 다음 프레임에서 다시 감지됨
+            self.skipped_budget += 1
+            return self.result
+
+        self.ocr_invoked = True
+        self.ocr_calls += 1
+        self._reference = small
+        self._last_ocr_time = now
+
+        if self.voter is None:
+            detected = self.detector.detect(frame, self.target)
+            seen = bool(detected)
+        else:
+            candidates = self.detector.detect_candidates(frame, self.target)
+            # 확정 문자열은 트래커의 타겟과 비교 (voter 생성 시 target을 지정하지 않아도 됨)
+            detected = self._select_confirmed(self.voter.update(candidates, self.target))
+            seen = bool(candidates)
+
+        if detected:
+            self.result = detected
+            self._misses = 0
+        elif not seen:
+            self._misses += 1
+            if self._misses >= self.miss_tolerance:
+                self.result = None
+
+        return self.result
+
+    def _select_confirmed(self, confirmed):
+        # 투표로 확정된 결과 중 유사도 임계치를 넘는 결과 선택 (detect와 같은 반환 형식)
+        thresh = self.detector.plate_similarity_thresh
+        if isinstance(self.target, PlateIndex):
+            return [plate for plate in confirmed if plate.target is not None and plate.similarity >= thresh]
+
+        matches = [plate for plate in confirmed if plate.similarity >= thresh]
+        return max(matches, key=lambda plate: plate.similarity) if matches else None
+
+    def run(self, source: Union[cv2.VideoCapture, Iterable[np.ndarray]]) -> Iterator[Tuple[int, Optional[PlateResult]]]:
+        """
+        cv2.VideoCapture 또는 프레임 이터레이터를 끝까지 처리하며 (프레임 번호, 탐지 결과) 생성
+        """
+        if hasattr(source, 'read'):
+            def frames():
+                while True:
+                    ret, frame = source.read()
+                    if not ret:
+                        return
+                    yield frame
+            source = frames()
+
+        for index, frame in enumerate(source):
+            yield index, self.update(frame)
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'ocr_calls': self.ocr_calls,
+            'skipped_static': self.skipped_static,
+            'skipped_budget': self.skipped_budget,
+        }
@@ -0,0 +1,364 @@
+"""
+ColorRecognizer HSV 범위 / 임계치 일괄 탐색 (라벨이 있는 프레임 집합 기준 정확도)
+
+프레임마다 전처리(HSV)와 바닥 마스크는 바닥 설정(white_range, exclude_top_ratio, include_bottom_ratio)별로 한 번만 계산하고,
+바닥 영역 픽셀의 3차원 HSV 히스토그램을 후보 범위 경계값으로만 나눈 격자에 누적한 뒤
+누적합(적분 히스토그램) 8번 조회로 모든 후보 범위 박스의 픽셀 수를 구함 -> 설정 수와 관계없이 픽셀 순회는 프레임당 한 번
+결과는 ColorRecognizer.recognize를 해당 설정으로 실행한 것과 동일
+
+실행:
+  python -m vision.tuning data/labeled/ --labels labels.json --grid grid.json --top 20 --output sweep.csv
+
+labels.json: {"파일명": "red" 또는 null(마커 없음), ...}
+grid.json (모든 항목 생략 가능, 생략 시 기본 ColorRecognizer 값 사용):
+  {
+    "color_ranges": {"red": [[[0, 70, 115], [7, 255, 255], [167, 80, 83], [179, 255, 255]], ...], ...},
+    "min_detection_area_ratio": [0.05, 0.09],
+    "floor": [{"exclude_top_ratio": 0.2}, {"exclude_top_ratio": 0.3, "white_range": [[0, 0, 150], [179, 60, 255]]}]
+  }
+"""
+import argparse
+import copy
+import csv
+import itertools
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import cv2
+import numpy as np
+from vision.color import ColorRecognizer
+from vision.utils.timing import NULL_TIMER
+from vision.utils.workspace import FrameWorkspace
+
+
+# HSV 채널별 값 범위 (OpenCV 8bit HSV: H 0~179, S/V 0~255)
+CHANNEL_SIZES = (180, 256, 256)
+
+
+@dataclass
+class SweepResult:
+    accuracy: float
+    color_ranges: Dict[str, list]
+    min_detection_area_ratio: float
+    floor: dict     # 바닥 설정 (white_range, exclude_top_ratio, include_bottom_ratio 중 변경한 값)
+
+
+def _boxes(boundaries) -> List[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+    # color_ranges 형식 [(lower, upper, lower, upper, ...)] -> [(lower, upper), ...]
+    return [
+        (tuple(int(v) for v in boundaries[i]), tuple(int(v) for v in boundaries[i + 1]))
+        for i in range(0, len(boundaries) - 1, 2)
+    ]
+
+
+def _union_terms(boxes):
+    """
+    박스 합집합 픽셀 수 = 포함-배제 원리의 (부호, 교집합 박스) 항 목록
+    (빨간색처럼 박스가 여러 개인 범위, 겹치지 않는 교집합은 제외)
+    """
+    terms = []
+    for r in range(1, len(boxes) + 1):
+        for subset in itertools.combinations(boxes, r):
+            lower = tuple(max(box[0][c] for box in subset) for c in range(3))
+            upper = tuple(min(box[1][c] for box in subset) for c in range(3))
+            if all(lo <= up for lo, up in zip(lower, upper)):
+                terms.append((1 if r % 2 else -1, (lower, upper)))
+    return terms
+
+
+class _BoxCounter:
+    """
+    후보 박스 경계값으로 나눈 격자의 3차원 HSV 히스토그램 -> 적분 히스토그램으로 박스별 픽셀 수 계산
+    """
+
+    def __init__(self, boxes):
+        # 채널별 격자 경계: 0, 각 박스의 lower, upper + 1, 채널 최대값 + 1
+        self.edges = []
+        for c, size in enumerate(CHANNEL_SIZES):
+            values = {0, size}
+            for lower, upper in boxes:
+                values.add(min(max(lower[c], 0), size))
+                values.add(min(max(upper[c] + 1, 0), size))
+            self.edges.append(np.array(sorted(values)))
+
+        # 값 -> 격자 번호 LUT (256개, H는 180 이상 값도 마지막 격자로)
+        self.luts = [
+            np.clip(np.searchsorted(edges, np.arange(256), side='right') - 1, 0, len(edges) - 2).astype(np.int32)
+            for edges in self.edges
+        ]
+        self.shape = tuple(len(edges) - 1 for edges in self.edges)
+
+        # 박스별 적분 히스토그램 조회 위치 (빈 박스는 lower 격자 = upper 격자)
+        lo = np.array([[np.searchsorted(self.edges[c], min(max(lower[c], 0), CHANNEL_SIZES[c])) for c in range(3)]
+                       for lower, _ in boxes], dtype=np.intp).reshape(-1, 3)
+        hi = np.array([[np.searchsorted(self.edges[c], min(max(upper[c] + 1, 0), CHANNEL_SIZES[c])) for c in range(3)]
+                       for _, upper in boxes], dtype=np.intp).reshape(-1, 3)
+        self._corners = []
+        for corner in itertools.product((0, 1), repeat=3):
+            # 꼭짓점 8개: lower 쪽 좌표를 고른 채널 수가 짝수면 +, 홀수면 -
+            sign = 1 if (3 - sum(corner)) % 2 == 0 else -1
+            index = tuple(hi[:, c] if use_hi else lo[:, c] for c, use_hi in enumerate(corner))
+            self._corners.append((sign, index))
+        self._empty = np.any(hi <= lo, axis=1)
+
+    def count(self, hsv_pixels: np.ndarray) -> np.ndarray:
+        """(N, 3) HSV 픽셀 -> 박스별 픽셀 수 (n_boxes,)"""
+        nh, ns, nv = self.shape
+        index = (self.luts[0][hsv_pixels[:, 0]] * ns + self.luts[1][hsv_pixels[:, 1]]) * nv + self.luts[2][hsv_pixels[:, 2]]
+        hist = np.bincount(index, minlength=nh * ns * nv).reshape(self.shape)
+
+        integral = np.zeros((nh + 1, ns + 1, nv + 1), dtype=np.int64)
+        integral[1:, 1:, 1:] = hist.cumsum(0).cumsum(1).cumsum(2)
+
+        counts = np.zeros(len(self._empty), dtype=np.int64)
+        for sign, index in self._corners:
+            counts += sign * integral[index]
+        counts[self._empty] = 0
+        return counts
+
+
+class ColorRangeSweep:
+    """
+    라벨이 있는 프레임 집합에서 ColorRecognizer 설정 조합별 정확도 계산
+    - color_candidates: {색상: [color_ranges 형식 후보, ...]} (없는 색상은 base의 현재 범위 1개)
+    - min_area_ratios: min_detection_area_ratio 후보
+    - floor_candidates: 바닥 설정 후보 dict 목록 (white_range, exclude_top_ratio, include_bottom_ratio)
+    조합 = 색상별 후보 x 임계치 x 바닥 설정의 모든 곱
+    """
+
+    def __init__(
+            self,
+            color_candidates: Optional[Dict[str, Sequence]] = None,
+            min_area_ratios: Optional[Sequence[float]] = None,
+            floor_candidates: Optional[Sequence[dict]] = None,
+            base: Optional[ColorRecognizer] = None,
+    ):
+        self.base = base or ColorRecognizer()
+        self.color_names = list(self.base.color_ranges)
+        color_candidates = color_candidates or {}
+        unknown = set(color_candidates) - set(self.color_names)
+        if unknown:
+            raise ValueError(f"Unknown colors in candidates: {sorted(unknown)} (support only {self.color_names})")
+
+        self.color_candidates = {
+            name: [list(map(tuple, ranges)) for ranges in color_candidates.get(name, [self.base.color_ranges[name]])]
+            for name in self.color_names
+        }
+        self.min_area_ratios = np.asarray(
+            min_area_ratios if min_area_ratios is not None else [self.base.min_detection_area_ratio], dtype=np.float64
+        )
+        self.floor_candidates = [dict(floor) for floor in (floor_candidates or [{}])]
+
+        # 모든 후보의 포함-배제 항에서 쓰이는 고유 박스 -> 후보별 (박스 번호, 부호) 계수 행렬
+        boxes, box_index = [], {}
+        self._coefficients = {}
+        for name, candidates in self.color_candidates.items():
+            coefficients = []
+            for ranges in candidates:
+                row = {}
+                for sign, box in _union_terms(_boxes(ranges)):
+                    if box not in box_index:
+                        box_index[box] = len(boxes)
+                        boxes.append(box)
+                    row[box_index[box]] = row.get(box_index[box], 0) + sign
+                coefficients.append(row)
+            self._coefficients[name] = coefficients
+        self._counter = _BoxCounter(boxes)
+        self._n_boxes = len(boxes)
+
+        # 바닥 설정별 마스크 계산용 인식기 (전처리 설정은 base와 동일)
+        self._floor_recognizers = []
+        for floor in self.floor_candidates:
+            recognizer = copy.copy(self.base)
+            recognizer.workspace = None
+            recognizer.track_floor = False
+            for key, value in floor.items():
+                if key == 'white_range':
+                    value = (np.asarray(value[0]), np.asarray(value[1]))
+                elif key not in ('exclude_top_ratio', 'include_bottom_ratio'):
+                    raise ValueError(f"Unsupported floor parameter: {key}")
+                setattr(recognizer, key, value)
+            recognizer._lut_key = None
+            self._floor_recognizers.append(recognizer)
+
+        self._box_counts = []   # 프레임별 (n_floor, n_boxes)
+        self._pixels = []       # 프레임별 분석 해상도 픽셀 수
+        self._labels = []
+
+    @property
+    def n_configs(self) -> int:
+        return int(np.prod(self._dims()))
+
+    def _dims(self):
+        return [len(self.color_candidates[name]) for name in self.color_names] + \
+            [len(self.min_area_ratios), len(self.floor_candidates)]
+
+    def add_frame(self, frame: np.ndarray, label: Optional[str]):
+        """프레임 1장의 바닥 설정별 박스 픽셀 수 누적 (프레임 자체는 보관하지 않음)"""
+        if label is not None and label not in self.color_names:
+            raise ValueError(f"Unknown label: {label} (support only {self.color_names} or None)")
+
+        h, w = self.base._analysis_size(*frame.shape[:2])
+        hsv = self.base._preprocess(frame, (w, h), NULL_TIMER)
+
+        counts = np.empty((len(self._floor_recognizers), self._n_boxes), dtype=np.int64)
+        for i, recognizer in enumerate(self._floor_recognizers):
+            floor_mask = recognizer._get_floor_mask(recognizer._classify(hsv), h)
+            counts[i] = self._counter.count(hsv[floor_mask > 0])
+
+        self._box_counts.append(counts)
+        self._pixels.append(h * w)
+        self._labels.append(label)
+
+    def add_frames(self, frames: Iterable[Tuple[np.ndarray, Optional[str]]]):
+        for frame, label in frames:
+            self.add_frame(frame, label)
+        return self
+
+    def evaluate(self, chunk_bytes: int = 64 << 20) -> np.ndarray:
+        """
+        모든 조합의 정확도 (조합 순서: 색상별 후보(color_ranges 순서) -> 임계치 -> 바닥 설정, 마지막 축이 가장 빠르게 변함)
+        """
+        if not self._labels:
+            raise ValueError("No frames added")
+
+        n_frames = len(self._labels)
+        counts = np.stack(self._box_counts)                     # (n_frames, n_floor, n_boxes)
+        pixels = np.asarray(self._pixels, dtype=np.float64)
+
+        # 색상별 후보 면적 비율 (n_floor, n_candidates, n_frames)
+        areas = []
+        for name in self.color_names:
+            coefficients = np.zeros((self._n_boxes, len(self._coefficients[name])), dtype=np.int64)
+            for j, row in enumerate(self._coefficients[name]):
+                for box, sign in row.items():
+                    coefficients[box, j] = sign
+            ratio = (counts @ coefficients) / pixels[:, None, None]   # (n_frames, n_floor, n_candidates)
+            areas.append(np.ascontiguousarray(ratio.transpose(1, 2, 0)))
+
+        # 라벨 -> 색상 번호 (마커 없음 = -1)
+        labels = np.array([-1 if label is None else self.color_names.index(label) for label in self._labels])
+
+        dims = self._dims()
+        total = int(np.prod(dims))
+        accuracy = np.empty(total, dtype=np.float64)
+        chunk = max(1, chunk_bytes // (8 * len(self.color_names) * n_frames))
+        for start in range(0, total, chunk):
+            index = np.unravel_index(np.arange(start, min(start + chunk, total)), dims)
+            thresholds = self.min_area_ratios[index[-2]]
+            floor = index[-1]
+
+            stacked = np.stack([areas[c][floor, index[c]] for c in range(len(self.color_names))])  # (n_colors, chunk, n_frames)
+            # recognize와 동일: 면적이 가장 큰 색상(동률이면 앞 색상), 임계치 미만 또는 면적 0이면 None
+            best = stacked.argmax(axis=0)
+            largest = np.take_along_axis(stacked, best[None], axis=0)[0]
+            predicted = np.where((largest >= thresholds[:, None]) & (largest > 0), best, -1)
+            accuracy[start:start + len(floor)] = (predicted == labels).mean(axis=1)
+        return accuracy
+
+    def config(self, index: int) -> dict:
+        """조합 번호 -> ColorRecognizer 설정"""
+        index = np.unravel_index(index, self._dims())
+        return {
+            'color_ranges': {
+                name: [list(bound) for bound in self.color_candidates[name][index[c]]]
+                for c, name in enumerate(self.color_names)
+            },
+            'min_detection_area_ratio': float(self.min_area_ratios[index[-2]]),
+            'floor': self.floor_candidates[index[-1]],
+        }
+
+    def results(self, top: Optional[int] = None) -> List[SweepResult]:
+        """정확도 내림차순 결과 (동률이면 조합 순서)"""
+        accuracy = self.evaluate()
+        order = np.argsort(-accuracy, kind='stable')
+        if top is not None:
+            order = order[:top]
+        return [SweepResult(accuracy=float(accuracy[i]), **self.config(int(i))) for i in order]
+
+    def recognizer(self, result: SweepResult, **kwargs) -> ColorRecognizer:
+        """탐색 결과 설정을 적용한 ColorRecognizer"""
+        recognizer = copy.copy(self.base)
+        recognizer.workspace = FrameWorkspace() if self.base.workspace is not None else None
+        recognizer.color_ranges = {name: [tuple(bound) for bound in ranges] for name, ranges in result.color_ranges.items()}
+        recognizer.min_detection_area_ratio = result.min_detection_area_ratio
+        for key, value in result.floor.items():
+            if key == 'white_range':
+                value = (np.asarray(value[0]), np.asarray(value[1]))
+            setattr(recognizer, key, value)
+        for key, value in kwargs.items():
+            setattr(recognizer, key, value)
+        recognizer._lut_key = None
+        recognizer.reset_floor_tracking()
+        return recognizer
+
+
+# CLI ###########################################################################
+
+def _load_labeled_frames(directory, labels):
+    for name, label in labels.items():
+        frame = cv2.imread(os.path.join(directory, name))
+        if frame is None:
+            print(f"skip unreadable image: {name}")
+            continue
+        yield frame, label
+
+
+def _format_ranges(color_ranges, base):
+    # 기본값과 다른 색상 범위만 표시
+    changed = {
+        name: ranges for name, ranges in color_ranges.items()
+        if [tuple(bound) for bound in ranges] != [tuple(bound) for bound in base.color_ranges[name]]
+    }
+    return json.dumps(changed) if changed else '(default)'
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m vision.tuning')
+    parser.add_argument('frames', help='라벨링된 이미지 폴더')
+    parser.add_argument('--labels', required=True, help='{"파일명": 색상 또는 null} JSON')
+    parser.add_argument('--grid', help='탐색할 후보 JSON (생략 시 기본 설정 1개만 평가)')
+    parser.add_argument('--analysis-width', type=int, help='ColorRecognizer analysis_width')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--output', help='전체 조합 결과 CSV 경로')
+    args = parser.parse_args()
+
+    with open(args.labels, 'r', encoding='utf-8') as f:
+        labels = json.load(f)
+    grid = {}
+    if args.grid:
+        with open(args.grid, 'r', encoding='utf-8') as f:
+            grid = json.load(f)
+
+    base = ColorRecognizer(analysis_width=args.analysis_width)
+    sweep = ColorRangeSweep(
+        grid.get('color_ranges'), grid.get('min_detection_area_ratio'), grid.get('floor'), base=base
+    )
+    print(f"{sweep.n_configs} configurations, {len(labels)} frames")
+
+    start = time.perf_counter()
+    sweep.add_frames(_load_labeled_frames(args.frames, labels))
+    prepared = time.perf_counter()
+    results = sweep.results(None if args.output else args.top)
+    evaluated = time.perf_counter()
+    print(f"histograms {prepared - start:.1f}s, evaluation {evaluated - prepared:.2f}s")
+
+    print(f"\n{'accuracy':>8}  {'min_area':>8}  floor / color_ranges")
+    for result in results[:args.top]:
+        print(f"{result.accuracy:8.1%}  {result.min_detection_area_ratio:8.3f}  "
+              f"{json.dumps(result.floor) if result.floor else '(default)'} / {_format_ranges(result.color_ranges, base)}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['accuracy', 'min_detection_area_ratio', 'floor', 'color_ranges'])
+            for result in results:
+                writer.writerow([result.accuracy, result.min_detection_area_ratio,
+                                 json.dumps(result.floor), json.dumps(result.color_ranges)])
+        print(f"saved: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
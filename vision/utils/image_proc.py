@@ -1,3 +1,4 @@
+import threading
 import cv2
 import numpy as np
 
@@ -26,24 +27,126 @@ def adjust_gamma(img, gamma=1.0):
     table = np.array([((i / 255.0) ** inv_gamma) * 255 for i in range(256)]).astype("uint8")
     return cv2.LUT(img, table)
 
-def apply_clahe_color(img, clip_limit=3.0, tile_size=(8, 8)):
+_clahe_cache = threading.local()
+
+def get_clahe(clip_limit=3.0, tile_size=(8, 8)):
+    """
+    (clip_limit, tile_size)별로 CLAHE 객체를 재사용
+    CLAHE 객체는 내부 버퍼를 가지므로 스레드별로 따로 캐싱
+    """
+    cache = getattr(_clahe_cache, 'objects', None)
+    if cache is None:
+        cache = _clahe_cache.objects = {}
+
+    key = (float(clip_limit), tuple(tile_size))
+    clahe = cache.get(key)
+    if clahe is None:
+        clahe = cache[key] = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tuple(tile_size))
+    return clahe
+
+def apply_clahe_color(img, clip_limit=3.0, tile_size=(8, 8), dst=None, workspace=None, output='bgr'):
     """
     LAB 공간에서 명도(L/Y) 채널에만 CLAHE 적용하여 색상 왜곡 최소화하며 히스토그램 평활화
+    dst: 결과를 저장할 배열 (None이면 새로 할당)
+    workspace: 중간 버퍼를 재사용할 FrameWorkspace (None이면 매번 할당)
+    output: 반환 형식
+      'bgr' - 보정된 BGR 이미지 (기본값)
+      'lab' - 보정된 LAB 이미지 (LAB -> BGR 역변환 생략)
+      'l'   - 보정된 명도(L) 채널만 (그레이스케일 입력이 필요한 후처리용, 채널 합치기/역변환 생략)
     """
+    if output not in ('bgr', 'lab', 'l'):
+        raise ValueError(f"Unsupported output: {output} (support only 'bgr', 'lab', 'l')")
+
+    def buffer(name, shape):
+        return None if workspace is None else workspace.get(name, shape)
+
+    clahe = get_clahe(clip_limit, tile_size)
+
     # LAB 색공간으로 변환 (L: 밝기, A/B: 색상)
-    lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB)
-    l, a, b = cv2.split(lab)
+    lab_dst = dst if output == 'lab' else buffer('clahe_lab', img.shape)
+    lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB, dst=lab_dst)
+    l = cv2.extractChannel(lab, 0, dst=buffer('clahe_l', img.shape[:2]))
 
     # 대비 제한 적응형 히스토그램 평활화 적용
-    clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_size)
-    l = clahe.apply(l)
+    if output == 'l':
+        return clahe.apply(l, dst=dst)
+    enhanced_l = clahe.apply(l, dst=buffer('clahe_l_out', img.shape[:2]))
 
-    # 다시 합치기
-    enhanced_lab = cv2.merge((l, a, b))
-    return cv2.cvtColor(enhanced_lab, cv2.COLOR_LAB2BGR)
+    # 보정된 L 채널만 다시 넣기 (split/merge 없이)
+    cv2.insertChannel(enhanced_l, lab, 0)
+    if output == 'lab':
+        return lab
+    return cv2.cvtColor(lab, cv2.COLOR_LAB2BGR, dst=dst)
 
-def apply_white_balance(img, p=0.5):
-    """White Patch 가설 기반 자동 화이트 밸런스"""
+def _channel_percentile(hist, p):
+    """
+    256-bin 히스토그램에서 np.percentile(channel, p)와 동일한 값 계산
+    (numpy 기본 'linear' 보간: 정렬된 값의 (n-1)*p/100 위치를 선형 보간)
+    """
+    cumsum = np.cumsum(hist)
+    n = int(cumsum[-1])
+
+    virtual_index = (n - 1) * (p / 100)
+    prev_index = int(np.floor(virtual_index))
+    gamma = virtual_index - prev_index
+    if virtual_index >= n - 1:
+        prev_index, gamma = n - 1, 0.0
+
+    # k번째(0부터) 정렬 값 = 누적 개수가 k를 처음 넘는 bin
+    prev_value = np.float32(np.searchsorted(cumsum, prev_index, side='right'))
+    next_value = np.float32(np.searchsorted(cumsum, min(prev_index + 1, n - 1), side='right'))
+
+    diff = next_value - prev_value
+    if gamma >= 0.5:
+        return next_value - diff * (1 - gamma)
+    return prev_value + diff * gamma
+
+def white_balance_lut(img, p=0.5, sample_step=1):
+    """
+    화이트 밸런스 채널별 변환 테이블(1x256x3) 계산
+    sample_step > 1이면 sample_step 간격 격자의 픽셀만으로 히스토그램을 계산
+    """
+    assert img.dtype == np.uint8
+    sample = np.ascontiguousarray(img[::sample_step, ::sample_step]) if sample_step > 1 else img
+    n_pixels = sample.shape[0] * sample.shape[1]
+
+    values = np.arange(256, dtype=np.float32)
+    lut = np.empty((1, 256, 3), dtype=np.uint8)
+    for c in range(3):
+        # calcHist는 float32로 개수를 세므로 2^24 픽셀을 넘으면 정확한 bincount 사용
+        if n_pixels <= (1 << 24):
+            hist = cv2.calcHist([sample], [c], None, [256], [0, 256]).ravel().astype(np.int64)
+        else:
+            hist = np.bincount(sample[:, :, c].ravel(), minlength=256)
+
+        low = _channel_percentile(hist, p)
+        high = _channel_percentile(hist, 100 - p)
+
+        channel = values
+        if high > low:
+            channel = (values - low) / (high - low) * 255
+        lut[0, :, c] = np.clip(channel, 0, 255).astype(np.uint8)
+
+    return lut
+
+def apply_white_balance(img, p=0.5, dst=None, sample_step=1):
+    """
+    White Patch 가설 기반 자동 화이트 밸런스
+    채널별 256-bin 히스토그램에서 percentile 구간을 구하고 cv2.LUT로 한 번에 적용
+    sample_step=1이면 apply_white_balance_float와 결과가 동일함
+
+    sample_step: 히스토그램 계산 시 픽셀 샘플링 간격 (s이면 1/s^2 픽셀만 사용)
+      샘플 m개로 구한 구간은 샘플의 정확한 percentile이며, 샘플이 프레임을 대표한다고 보면
+      DKW 부등식에 의해 확률 1-δ 이상으로 전체 프레임 기준 p ± 100*sqrt(ln(2/δ)/(2m)) 백분위 사이에 위치
+      (예: 1280x720, sample_step=4 -> m=57600, δ=0.001 이면 ±0.81 백분위)
+      격자 주기와 겹치는 반복 패턴이 있는 영상에서는 이 한계가 성립하지 않을 수 있음
+    dst: 결과를 저장할 배열 (None이면 새로 할당)
+    """
+    lut = white_balance_lut(img, p, sample_step)
+    return cv2.LUT(img, lut, dst=dst)
+
+def apply_white_balance_float(img, p=0.5):
+    """apply_white_balance의 float/np.percentile 기반 기존 구현 (비교 및 검증용)"""
     assert img.dtype == np.uint8
     out = img.astype(np.float32)
 
@@ -72,3 +175,22 @@ def binarize_adaptive(img, block_size=11, c=2):
         img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
         cv2.THRESH_BINARY, block_size, c
     )
+
+
+# 형태학 연산 및 에지 (Morphology & Edges) #################################
+
+def apply_blackhat(gray, kernel_size=(13, 5)):
+    """밝은 배경 위의 어두운 글자 강조 (Black-hat = Closing - 원본), kernel_size: (가로, 세로)"""
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, kernel_size)
+    return cv2.morphologyEx(gray, cv2.MORPH_BLACKHAT, kernel)
+
+def morph_close(img, kernel_size=(15, 3)):
+    """가까운 전경 영역끼리 연결 (예: 글자들을 하나의 문자열 영역으로), kernel_size: (가로, 세로)"""
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, kernel_size)
+    return cv2.morphologyEx(img, cv2.MORPH_CLOSE, kernel)
+
+def gradient_x(gray):
+    """x 방향 Sobel 에지 크기를 0~255 uint8로 정규화 (세로 획이 많은 문자열 영역 검출용)"""
+    grad = np.abs(cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3))
+    return cv2.normalize(grad, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+
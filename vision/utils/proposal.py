@@ -0,0 +1,77 @@
+from typing import List, Tuple
+import cv2
+import numpy as np
+from vision.utils.image_proc import to_grayscale, apply_blackhat, gradient_x, morph_close
+from vision.utils.bbox import bbox_iou
+
+
+def propose_plate_regions(
+        img: np.ndarray,
+        *,
+        max_proposals: int = 8,
+        min_aspect: float = 1.5,
+        max_aspect: float = 7.0,
+        min_area_ratio: float = 0.0003,
+        max_area_ratio: float = 0.2,
+        min_edge_density: float = 0.15,
+        pad_ratio: float = 0.2,
+        char_kernel: Tuple[int, int] = (13, 5),
+        join_kernel: Tuple[int, int] = (15, 3),
+        nms_iou: float = 0.3,
+) -> List[Tuple[int, int, int, int]]:
+    """
+    번호판 후보 영역 검출 (OCR 전에 잘라낼 영역 제안)
+    1. black-hat으로 밝은 판 위의 어두운 글자를 강조
+    2. x 방향 에지 -> 가로로 닫기 -> Otsu 이진화로 문자열 덩어리 생성
+    3. 외곽 컨투어의 가로세로 비율, 면적, 에지 밀도로 필터링 후 점수 순 정렬
+    반환: 여백(pad_ratio)을 포함한 (x1, y1, x2, y2) 목록 (점수 내림차순, 최대 max_proposals개)
+    """
+    gray = img if img.ndim == 2 else to_grayscale(img)
+    h, w = gray.shape[:2]
+    frame_area = h * w
+
+    blackhat = apply_blackhat(gray, char_kernel)
+    grad = gradient_x(blackhat)
+    grad = cv2.GaussianBlur(grad, (5, 5), 0)
+    joined = morph_close(grad, join_kernel)
+    _, binary = cv2.threshold(joined, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    binary = cv2.dilate(cv2.erode(binary, None, iterations=1), None, iterations=1)
+
+    # 에지 밀도 계산용 적분 영상 (후보마다 O(1))
+    _, edges = cv2.threshold(grad, 0, 1, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    edge_integral = cv2.integral(edges)
+
+    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    candidates = []
+    for contour in contours:
+        x, y, bw, bh = cv2.boundingRect(contour)
+        area = bw * bh
+        if bh == 0 or not (min_aspect <= bw / bh <= max_aspect):
+            continue
+        if not (min_area_ratio <= area / frame_area <= max_area_ratio):
+            continue
+
+        edge_count = (edge_integral[y + bh, x + bw] - edge_integral[y, x + bw]
+                      - edge_integral[y + bh, x] + edge_integral[y, x])
+        density = edge_count / area
+        if density < min_edge_density:
+            continue
+        candidates.append((density * np.sqrt(area), (x, y, x + bw, y + bh)))
+
+    candidates.sort(key=lambda c: c[0], reverse=True)
+
+    # 겹치는 후보 제거 후 여백 추가
+    proposals = []
+    for _, box in candidates:
+        if any(bbox_iou(box, kept) > nms_iou for kept in proposals):
+            continue
+        proposals.append(box)
+        if len(proposals) >= max_proposals:
+            break
+
+    padded = []
+    for x1, y1, x2, y2 in proposals:
+        pad_x = int((x2 - x1) * pad_ratio)
+        pad_y = int((y2 - y1) * pad_ratio)
+        padded.append((max(0, x1 - pad_x), max(0, y1 - pad_y), min(w, x2 + pad_x), min(h, y2 + pad_y)))
+    return padded
@@ -0,0 +1,221 @@
+from abc import ABC, abstractmethod
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, Optional, Sequence
+import numpy as np
+
+
+class StageTimer:
+    """
+    프레임 1장 처리 중 단계별 소요 시간(ms) 기록
+    lap(name)은 직전 lap(또는 생성) 이후 경과 시간을 name 단계에 누적하고,
+    finish()는 전체 시간을 'total'로 추가해 sink에 전달한 뒤 단계별 시간 dict 반환
+    """
+
+    __slots__ = ('sink', 'component', 'stages', '_start', '_last')
+
+    def __init__(self, sink: 'TimingSink', component: str):
+        self.sink = sink
+        self.component = component
+        self.stages: Dict[str, float] = {}
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, name: str):
+        now = time.perf_counter()
+        self.stages[name] = self.stages.get(name, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def skip(self):
+        """직전 lap 이후 시간을 어느 단계에도 포함하지 않음 (계측 대상이 아닌 구간)"""
+        self._last = time.perf_counter()
+
+    def finish(self) -> Dict[str, float]:
+        self.stages['total'] = (time.perf_counter() - self._start) * 1000
+        self.sink.record(self.component, self.stages)
+        return self.stages
+
+
+class _NullTimer:
+    """계측 비활성화 시 사용하는 빈 타이머 (모든 호출이 아무 일도 하지 않음)"""
+
+    __slots__ = ()
+
+    def lap(self, name):
+        pass
+
+    def skip(self):
+        pass
+
+    def finish(self):
+        return None
+
+
+NULL_TIMER = _NullTimer()
+
+
+def start_timer(sink: Optional['TimingSink'], component: str):
+    """sink가 None이면 NULL_TIMER 반환 (비활성화 시 시간 측정/할당 없음)"""
+    if sink is None:
+        return NULL_TIMER
+    return StageTimer(sink, component)
+
+
+# 싱크 ##########################################################################
+
+class TimingSink(ABC):
+    """단계별 시간 수신 인터페이스 (component: 'plate', 'color' 등, stages: 단계 -> ms)"""
+
+    @abstractmethod
+    def record(self, component: str, stages: Dict[str, float]):
+        pass
+
+
+class HistogramSink(TimingSink):
+    """
+    메모리 내 단계별 최근 window개 샘플을 유지하고 p50/p95/p99 요약 제공
+    """
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))   # (component, stage) -> ms
+        self._counts = defaultdict(int)
+
+    def record(self, component, stages):
+        with self._lock:
+            for stage, ms in stages.items():
+                self._samples[(component, stage)].append(ms)
+                self._counts[(component, stage)] += 1
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """{component: {stage: {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}}} (백분위는 최근 window개 기준)"""
+        with self._lock:
+            items = [(key, np.array(samples), self._counts[key]) for key, samples in self._samples.items()]
+
+        result = defaultdict(dict)
+        for (component, stage), samples, count in items:
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+            result[component][stage] = {
+                'count': count,
+                'mean_ms': float(samples.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+                'max_ms': float(samples.max()),
+            }
+        return dict(result)
+
+    def format(self) -> str:
+        lines = []
+        for component, stages in self.summary().items():
+            for stage, s in stages.items():
+                lines.append(
+                    f"{component:<12} {stage:<16} n={s['count']:<6} mean {s['mean_ms']:8.2f} | "
+                    f"p50 {s['p50_ms']:8.2f} | p95 {s['p95_ms']:8.2f} | p99 {s['p99_ms']:8.2f} ms"
+                )
+        return '\n'.join(lines)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+class JSONLSink(TimingSink):
+    """
+    프레임마다 {"ts", "component", "stages"} 한 줄씩 JSONL 파일에 기록
+    """
+
+    def __init__(self, path: str, flush_every: int = 1):
+        self.path = path
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+        self._pending = 0
+
+    def record(self, component, stages):
+        line = json.dumps({
+            'ts': time.time(),
+            'component': component,
+            'stages': {stage: round(ms, 4) for stage, ms in stages.items()},
+        })
+        with self._lock:
+            self._file.write(line + '\n')
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._file.flush()
+                self._pending = 0
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class PrometheusSink(TimingSink):
+    """
+    단계별 누적 히스토그램을 Prometheus 텍스트 형식으로 제공
+    render() 결과를 HTTP 응답으로 내보내거나 write()로 node_exporter textfile collector 경로에 저장
+    """
+
+    DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+    def __init__(self, metric: str = 'vision_stage_latency_seconds', buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.metric = metric
+        self.buckets = np.asarray(sorted(buckets), dtype=np.float64)
+        self._lock = threading.Lock()
+        # (component, stage) -> [버킷별 누적 개수, 합계(초), 개수]
+        self._series = {}
+
+    def record(self, component, stages):
+        with self._lock:
+            for stage, ms in stages.items():
+                seconds = ms / 1000
+                series = self._series.get((component, stage))
+                if series is None:
+                    series = self._series[(component, stage)] = [np.zeros(len(self.buckets), dtype=np.int64), 0.0, 0]
+                series[0][self.buckets >= seconds] += 1
+                series[1] += seconds
+                series[2] += 1
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.metric} Vision pipeline stage latency in seconds.",
+            f"# TYPE {self.metric} histogram",
+        ]
+        with self._lock:
+            for (component, stage), (bucket_counts, total, count) in sorted(self._series.items()):
+                labels = f'component="{component}",stage="{stage}"'
+                for le, bucket_count in zip(self.buckets, bucket_counts):
+                    lines.append(f'{self.metric}_bucket{{{labels},le="{le:g}"}} {bucket_count}')
+                lines.append(f'{self.metric}_bucket{{{labels},le="+Inf"}} {count}')
+                lines.append(f'{self.metric}_sum{{{labels}}} {total:.6f}')
+                lines.append(f'{self.metric}_count{{{labels}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str):
+        # 수집기가 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+class MultiSink(TimingSink):
+    """여러 싱크에 동시에 기록"""
+
+    def __init__(self, *sinks: TimingSink):
+        self.sinks = sinks
+
+    def record(self, component, stages):
+        for sink in self.sinks:
+            sink.record(component, stages)
@@ -1,19 +1,40 @@
 import re
-from rapidfuzz import fuzz
+from typing import List, Sequence, Tuple
+import numpy as np
+from rapidfuzz import fuzz, process
+
+# 글자 오인식 고려해 가운데 한글 글자는
+# 한글 1자 또는 영어 1자 또는 숫자 1자인 경우까지 번호판으로 판별
+PLATE_PATTERN = re.compile(r'\d{3}[가-힣A-Za-z0-9]\d{4}')
+
+# 앞 번호(3자리) / 가운데 글자 / 뒷 번호(4자리) 유사도 가중치
+FRONT_WEIGHT = 0.45
+MID_WEIGHT = 0.1
+BACK_WEIGHT = 0.45
+
+# plate_similarity_matrix에서 쌍별 계산을 사용할 최대 비교 쌍 수
+_PAIRWISE_LIMIT = 16
 
 
 def is_plate_like(text: str) -> bool:
     """
     번호판 인식 결과가 맞는지 텍스트 형식으로 판별
     """
-    # 글자 오인식 고려해 가운데 한글 글자는
-    # 한글 1자 또는 영어 1자 또는 숫자 1자인 경우까지 번호판으로 판별
-    return bool(re.fullmatch(r'\d{3}[가-힣A-Za-z0-9]\d{4}', text))
+    return PLATE_PATTERN.fullmatch(text) is not None
+
+
+def filter_plate_like(texts: Sequence[str]) -> np.ndarray:
+    """
+    텍스트 목록 중 번호판 형식인 항목의 bool 마스크 반환 (공백은 제거 후 판별)
+    """
+    fullmatch = PLATE_PATTERN.fullmatch
+    return np.fromiter((fullmatch(text.replace(' ', '')) is not None for text in texts), dtype=bool, count=len(texts))
 
 
 def plate_similarity(target: str, ocr: str) -> float:
     """
     target 차량번호와 인식 결과 ocr이 얼마나 유사한지 유사도 측정
+    (여러 쌍을 비교할 때는 plate_similarity_matrix 사용)
     """
     # 공백 제거
     target = target.replace(" ", "")
@@ -22,20 +43,81 @@ def plate_similarity(target: str, ocr: str) -> float:
     if len(target) != 8 or len(ocr) != 8:
         return 0.0
 
-    # 구간 분할
-    t_front, t_mid, t_back = target[:3], target[3], target[4:]
-    o_front, o_mid, o_back = ocr[:3], ocr[3], ocr[4:]
+    # 앞/가운데/뒤 구성요소별 가중치 적용해 타겟과의 차량번호 유사도 집계
+    return (
+            fuzz.ratio(target[:3], ocr[:3]) * FRONT_WEIGHT +
+            fuzz.ratio(target[3], ocr[3]) * MID_WEIGHT +
+            fuzz.ratio(target[4:], ocr[4:]) * BACK_WEIGHT
+    )
+
+
+def _bucket(parts: List[str]) -> Tuple[List[str], np.ndarray]:
+    # 구간별 고유값과 원래 항목 -> 고유값 인덱스
+    positions = {}
+    inverse = np.fromiter((positions.setdefault(part, len(positions)) for part in parts), dtype=np.intp, count=len(parts))
+    return list(positions), inverse
+
+
+def segment_buckets(plates: Sequence[str]):
+    """
+    8자리 번호판 목록을 앞/가운데/뒤 구간별 (고유값, 인덱스)로 분해
+    (같은 타겟 목록과 반복 비교할 때 미리 계산해 두고 segment_scores에 전달)
+    """
+    return (
+        _bucket([p[:3] for p in plates]),
+        _bucket([p[3] for p in plates]),
+        _bucket([p[4:] for p in plates]),
+    )
+
+
+def segment_scores(texts: Sequence[str], buckets) -> np.ndarray:
+    """
+    공백이 제거된 텍스트 목록과 segment_buckets로 분해한 타겟 간의 유사도 행렬
+    구간별 고유값에 대해서만 rapidfuzz.process.cdist로 계산한 뒤 타겟별로 조합
+    8자가 아닌 텍스트는 모든 타겟에 대해 0점
+    """
+    (front_keys, front_idx), (mid_keys, mid_idx), (back_keys, back_idx) = buckets
+    result = np.zeros((len(texts), len(front_idx)), dtype=np.float64)
 
-    front_score = fuzz.ratio(t_front, o_front)  # 앞 번호 유사도
-    mid_score = fuzz.ratio(t_mid, o_mid)  # 가운데 글자 유사도
-    back_score = fuzz.ratio(t_back, o_back)  # 뒷 번호 유사도
+    valid = [i for i, text in enumerate(texts) if len(text) == 8]
+    if not valid or not len(front_idx):
+        return result
+
+    queries = [texts[i] for i in valid]
+    front = process.cdist([q[:3] for q in queries], front_keys, scorer=fuzz.ratio, dtype=np.float64)
+    mid = process.cdist([q[3] for q in queries], mid_keys, scorer=fuzz.ratio, dtype=np.float64)
+    back = process.cdist([q[4:] for q in queries], back_keys, scorer=fuzz.ratio, dtype=np.float64)
 
     # 앞/가운데/뒤 구성요소별 가중치 적용해 타겟과의 차량번호 유사도 집계
-    score = (
-            front_score * 0.45 +
-            mid_score * 0.1 +
-            back_score * 0.45
+    result[valid] = (
+            front[:, front_idx] * FRONT_WEIGHT +
+            mid[:, mid_idx] * MID_WEIGHT +
+            back[:, back_idx] * BACK_WEIGHT
     )
+    return result
+
+
+def plate_similarity_matrix(texts: Sequence[str], targets: Sequence[str]) -> np.ndarray:
+    """
+    OCR 텍스트 목록과 타겟 번호판 목록 간의 유사도 행렬 (len(texts), len(targets)) 반환
+    공백은 제거 후 비교하며, 어느 한쪽이 8자가 아니면 0점
+    """
+    # 비교 쌍이 적으면 cdist 호출 비용이 더 크므로 쌍별로 계산 (결과 동일)
+    if len(texts) * len(targets) <= _PAIRWISE_LIMIT:
+        result = np.zeros((len(texts), len(targets)), dtype=np.float64)
+        for i, text in enumerate(texts):
+            for j, target in enumerate(targets):
+                result[i, j] = plate_similarity(target, text)
+        return result
+
+    texts = [text.replace(' ', '') for text in texts]
+    targets = [target.replace(' ', '') for target in targets]
 
-    return score
+    valid_targets = [j for j, target in enumerate(targets) if len(target) == 8]
+    if len(valid_targets) == len(targets):
+        return segment_scores(texts, segment_buckets(targets))
 
+    result = np.zeros((len(texts), len(targets)), dtype=np.float64)
+    if valid_targets:
+        result[:, valid_targets] = segment_scores(texts, segment_buckets([targets[j] for j in valid_targets]))
+    return result
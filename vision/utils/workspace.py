@@ -0,0 +1,64 @@
+import numpy as np
+
+
+class FrameWorkspace:
+    """
+    프레임 파이프라인에서 재사용하는 사전 할당 버퍼 모음
+    버퍼는 (이름, shape, dtype) 기준으로 유지되며 shape가 바뀌면 해당 이름의 버퍼만 새로 할당
+    하나의 인식 객체(스레드) 전용으로 사용해야 함
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+        # 할당 절감 통계
+        self.frames = 0
+        self.allocated_bytes = 0    # 실제로 새로 할당한 누적 바이트
+        self.reused_bytes = 0       # 재사용으로 할당을 생략한 누적 바이트
+        self.frame_bytes = 0        # 현재 프레임에서 요청된 버퍼 바이트
+        self.peak_frame_bytes = 0   # 프레임당 요청 바이트 최대값 (= 프레임당 생략 가능한 최대 할당량)
+
+    def begin_frame(self):
+        """프레임 처리 시작 시 호출 (프레임 단위 통계 초기화)"""
+        self.frames += 1
+        self.frame_bytes = 0
+
+    def get(self, name, shape, dtype=np.uint8):
+        """이름에 해당하는 버퍼 반환 (내용은 초기화되지 않음)"""
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+        buf = self._buffers.get(name)
+
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+            self.allocated_bytes += buf.nbytes
+        else:
+            self.reused_bytes += buf.nbytes
+
+        self.frame_bytes += buf.nbytes
+        self.peak_frame_bytes = max(self.peak_frame_bytes, self.frame_bytes)
+        return buf
+
+    def zeros(self, name, shape, dtype=np.uint8):
+        """0으로 채운 버퍼 반환 (np.zeros 대체)"""
+        buf = self.get(name, shape, dtype)
+        buf.fill(0)
+        return buf
+
+    @property
+    def held_bytes(self):
+        return sum(buf.nbytes for buf in self._buffers.values())
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'buffers': len(self._buffers),
+            'held_bytes': self.held_bytes,
+            'allocated_bytes': self.allocated_bytes,
+            'reused_bytes': self.reused_bytes,
+            'peak_frame_bytes': self.peak_frame_bytes,
+        }
+
+    def clear(self):
+        self._buffers.clear()
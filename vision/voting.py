@@ -0,0 +1,147 @@
+from collections import defaultdict, deque
+from typing import List, Optional, Union
+from vision.plate_index import PlateIndex
+from vision.result import PlateResult
+from vision.utils.verifier import plate_similarity
+from vision.utils.bbox import bbox_iou
+
+
+class _PlateTrack:
+
+    def __init__(self, bbox, window):
+        self.bbox = bbox
+        self.reads = deque(maxlen=window)   # (text, confidence)
+        self.missed = 0
+        self.confirmed = None
+        self.unconfirmed_reads = 0     # 확정되지 않은 상태로 연속 인식된 횟수
+
+
+class PlateVoter:
+    """
+    같은 위치(bbox 트랙)에서 최근 N번 읽힌 번호판 문자열로 자리별 문자 투표
+    각 자리의 사후 확률 = (가장 많이 득표한 문자의 신뢰도 합) / (전체 신뢰도 합 + prior_weight)
+    모든 자리의 사후 확률이 posterior_thresh 이상이면 다수결 문자열을 확정 결과로 반환
+    (prior_weight가 클수록 확정에 더 많은 일치 표가 필요)
+    """
+
+    PLATE_LENGTH = 8
+
+    def __init__(
+            self,
+            target: Union[str, PlateIndex] = '',
+            *,
+            window: int = 5,                # 트랙별로 유지할 최근 인식 횟수
+            posterior_thresh: float = 0.75,
+            prior_weight: float = 0.5,
+            iou_thresh: float = 0.3,        # 같은 트랙으로 볼 bbox IoU
+            max_missed: int = 3,            # 이 횟수만큼 연속으로 보이지 않은 트랙은 삭제
+            max_pending_reads: int = 10,    # 확정되지 않은 트랙에 추가 OCR을 요청할 최대 인식 횟수
+    ):
+        self.target = target
+        self.window = window
+        self.posterior_thresh = posterior_thresh
+        self.prior_weight = prior_weight
+        self.iou_thresh = iou_thresh
+        self.max_missed = max_missed
+        self.max_pending_reads = max_pending_reads
+        self.tracks: List[_PlateTrack] = []
+
+    def reset(self):
+        self.tracks = []
+
+    @property
+    def pending(self) -> bool:
+        """
+        아직 확정되지 않은 트랙이 있는지 (추가 OCR이 필요한지)
+        max_pending_reads번 인식해도 확정되지 않는 트랙은 제외 (확정 불가능한 트랙 때문에 매 프레임 OCR하지 않도록)
+        """
+        return any(
+            track.confirmed is None and track.unconfirmed_reads < self.max_pending_reads
+            for track in self.tracks
+        )
+
+    def update(
+            self,
+            candidates: List[PlateResult],
+            target: Union[str, PlateIndex, None] = None,
+    ) -> List[PlateResult]:
+        """
+        한 프레임의 번호판 후보(detect_candidates 결과)를 반영하고 확정된 결과 목록 반환
+        target: 확정 문자열과 비교할 타겟 (None이면 생성 시 지정한 target)
+        """
+        if target is None:
+            target = self.target
+
+        # bbox IoU 기준으로 기존 트랙과 연결 (IoU가 큰 쌍부터)
+        pairs = sorted(
+            ((bbox_iou(track.bbox, cand.bbox), t, c) for t, track in enumerate(self.tracks)
+             for c, cand in enumerate(candidates)),
+            reverse=True
+        )
+        matched_tracks, matched_cands = set(), {}
+        for iou, t, c in pairs:
+            if iou < self.iou_thresh:
+                break
+            if t in matched_tracks or c in matched_cands:
+                continue
+            matched_tracks.add(t)
+            matched_cands[c] = self.tracks[t]
+
+        for t, track in enumerate(self.tracks):
+            if t not in matched_tracks:
+                track.missed += 1
+        self.tracks = [track for track in self.tracks if track.missed <= self.max_missed]
+
+        confirmed = []
+        for c, cand in enumerate(candidates):
+            track = matched_cands.get(c)
+            if track is None:
+                track = _PlateTrack(cand.bbox, self.window)
+                self.tracks.append(track)
+
+            track.bbox = cand.bbox
+            track.missed = 0
+            track.reads.append((cand.text, 1.0 if cand.confidence is None else float(cand.confidence)))
+
+            # 새 인식으로 합의가 깨지면 다시 미확정 상태로 전환
+            track.confirmed = self._consensus(track, target)
+            if track.confirmed is not None:
+                track.unconfirmed_reads = 0
+                confirmed.append(track.confirmed)
+            else:
+                track.unconfirmed_reads += 1
+
+        return confirmed
+
+    def _consensus(self, track, target) -> Optional[PlateResult]:
+        votes = [defaultdict(float) for _ in range(self.PLATE_LENGTH)]
+        for text, confidence in track.reads:
+            if len(text) != self.PLATE_LENGTH:
+                continue
+            for pos, char in enumerate(text):
+                votes[pos][char] += confidence
+
+        chars, posterior = [], 1.0
+        for pos_votes in votes:
+            if not pos_votes:
+                return None
+            char, weight = max(pos_votes.items(), key=lambda item: item[1])
+            chars.append(char)
+            posterior = min(posterior, weight / (sum(pos_votes.values()) + self.prior_weight))
+
+        if posterior < self.posterior_thresh:
+            return None
+
+        text = ''.join(chars)
+        if isinstance(target, PlateIndex):
+            matched_target, similarity = target.best_matches([text])[0]
+        else:
+            matched_target, similarity = None, plate_similarity(target, text)
+
+        return PlateResult(
+            text=text,
+            similarity=similarity,
+            bbox=track.bbox,
+            target=matched_target,
+            confidence=posterior
+        )